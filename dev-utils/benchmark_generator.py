@@ -0,0 +1,92 @@
+"""
+Scaling benchmark of AzureMLPipelineGenerator on synthetic pipelines.
+
+Usage (from the repository root):
+
+    python dev-utils/benchmark_generator.py --sizes 100 1000 10000
+
+With ``--param-sets N``, every pipeline is generated for N parameter sets, as ``kedro azureml run``
+does for the entries of ``--params-matrix`` (a separate generation for each parameter set).
+"""
+import argparse
+import json
+import logging
+import time
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node, pipeline
+
+from kedro_azureml.config import _CONFIG_TEMPLATE
+from kedro_azureml.generator import AzureMLPipelineGenerator
+
+
+def _identity(*args):
+    return args[0]
+
+
+def synthetic_pipeline(size: int) -> Pipeline:
+    """Tree-shaped pipeline, every node consumes the output of the previous one and of the node in the middle"""
+    nodes = []
+    for i in range(size):
+        inputs = [f"dataset_{i}", "params:alpha"]
+        if i // 2 != i:
+            inputs.append(f"dataset_{i // 2}")
+        nodes.append(
+            node(_identity, inputs=inputs, outputs=f"dataset_{i + 1}", name=f"n{i}")
+        )
+    return pipeline(nodes)
+
+
+class _BenchmarkGenerator(AzureMLPipelineGenerator):
+    def __init__(
+        self, kedro_pipeline: Pipeline, catalog: DataCatalog, alpha: float = 1
+    ):
+        config = _CONFIG_TEMPLATE.model_copy(deep=True)
+        config.azure.pipeline_data_passing = None
+        super().__init__(
+            "benchmark",
+            "local",
+            config,
+            {"alpha": alpha},
+            catalog,
+            aml_env="benchmark@latest",
+            params=json.dumps({"alpha": alpha}),
+        )
+        self.kedro_pipeline = kedro_pipeline
+
+    def get_kedro_pipeline(self) -> Pipeline:
+        return self.kedro_pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 300, 1000, 3000, 10000]
+    )
+    parser.add_argument(
+        "--param-sets",
+        type=int,
+        default=1,
+        help="number of parameter sets (entries of the params matrix) to generate every pipeline for",
+    )
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{'nodes':>8}  {'param sets':>10}  {'seconds':>9}  {'ms/node':>8}")
+    for size in args.sizes:
+        kedro_pipeline = synthetic_pipeline(size)
+        catalog = DataCatalog(
+            {name: MemoryDataset() for name in kedro_pipeline.datasets()}
+        )
+        start = time.perf_counter()
+        for alpha in range(args.param_sets):
+            _BenchmarkGenerator(kedro_pipeline, catalog, alpha).generate()
+        elapsed = time.perf_counter() - start
+        print(
+            f"{size:>8}  {args.param_sets:>10}  {elapsed:>9.2f}  "
+            f"{1000 * elapsed / size / args.param_sets:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,164 @@
+import json
+import logging
 import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
 
-from azure.identity import DefaultAzureCredential, InteractiveBrowserCredential
+from azure.identity import (
+    AuthenticationRecord,
+    AzureCliCredential,
+    AzureDeveloperCliCredential,
+    AzurePowerShellCredential,
+    ChainedTokenCredential,
+    DefaultAzureCredential,
+    EnvironmentCredential,
+    InteractiveBrowserCredential,
+    ManagedIdentityCredential,
+    SharedTokenCacheCredential,
+    TokenCachePersistenceOptions,
+)
 
+from kedro_azureml.config import AuthConfig
+
+logger = logging.getLogger(__name__)
+
+AZURE_MANAGEMENT_SCOPE = "https://management.azure.com/.default"
+AUTH_STATE_PATH = Path.home() / ".kedro-azureml" / "auth.json"
+TOKEN_CACHE_NAME = "kedro-azureml"
+INTERACTIVE_CREDENTIAL = "InteractiveBrowserCredential"
+
+# members of the DefaultAzureCredential chain which can be re-created without any arguments
+_REMEMBERED_CREDENTIALS = {
+    cls.__name__: cls
+    for cls in (
+        EnvironmentCredential,
+        ManagedIdentityCredential,
+        SharedTokenCacheCredential,
+        AzureCliCredential,
+        AzurePowerShellCredential,
+        AzureDeveloperCliCredential,
+    )
+}
+
+# credentials resolved in this process, keyed by the auth config they were resolved with
+_credentials: Dict[str, Any] = {}
+_credential_lock = threading.Lock()
+
+
+def get_azureml_credentials(auth_config: Optional[AuthConfig] = None):
+    """Returns the Azure credential, resolved once per process and auth config."""
+    auth_config = auth_config or AuthConfig()
+    key = auth_config.model_dump_json()
+    with _credential_lock:
+        if key not in _credentials:
+            _credentials[key] = _resolve_credentials(auth_config)
+        return _credentials[key]
+
+
+def clear_credentials_cache() -> None:
+    with _credential_lock:
+        _credentials.clear()
+
+
+def _load_auth_state() -> dict:
+    try:
+        return json.loads(AUTH_STATE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_auth_state(state: dict) -> None:
+    try:
+        AUTH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        AUTH_STATE_PATH.write_text(json.dumps(state))
+    except OSError as e:
+        logger.debug(f"Could not save authentication state: {e}")
+
+
+def _resolve_credentials(auth_config: AuthConfig):
+    # On a AzureML compute instance, the managed identity will take precedence,
+    # while it does not have enough permissions.
+    # So, if we are on an AzureML compute instance, we disable the managed identity.
+    is_azureml_managed_identity = "MSI_ENDPOINT" in os.environ
+    state = _load_auth_state()
+    if (
+        remembered := _get_remembered_credential(
+            state, auth_config, is_azureml_managed_identity
+        )
+    ) is not None:
+        return remembered
 
-def get_azureml_credentials():
     try:
-        # On a AzureML compute instance, the managed identity will take precedence,
-        # while it does not have enough permissions.
-        # So, if we are on an AzureML compute instance, we disable the managed identity.
-        is_azureml_managed_identity = "MSI_ENDPOINT" in os.environ
         credential = DefaultAzureCredential(
             exclude_managed_identity_credential=is_azureml_managed_identity
         )
         # Check if given credential can get token successfully.
-        credential.get_token("https://management.azure.com/.default")
+        credential.get_token(AZURE_MANAGEMENT_SCOPE)
+        successful = _get_successful_credential_name(credential)
+        if successful in _REMEMBERED_CREDENTIALS:
+            _save_auth_state({**state, "credential": successful})
     except Exception:
         # Fall back to InteractiveBrowserCredential in case DefaultAzureCredential not work
-        credential = InteractiveBrowserCredential()
+        credential = _get_interactive_credential(state, auth_config)
+    return credential
+
+
+def _get_successful_credential_name(credential) -> Optional[str]:
+    """Name of the member of the DefaultAzureCredential chain which got the token, if azure-identity exposes it"""
+    successful = getattr(credential, "_successful_credential", None)
+    return type(successful).__name__ if successful is not None else None
+
+
+def _get_remembered_credential(
+    state: dict, auth_config: AuthConfig, is_azureml_managed_identity: bool
+):
+    """Re-creates the credential which worked in the previous process,
+    so the whole chain of DefaultAzureCredential does not have to be probed again."""
+    name = state.get("credential")
+    if name == INTERACTIVE_CREDENTIAL:
+        if auth_config.persistent_token_cache and state.get("authentication_record"):
+            logger.debug("Using the persisted interactive browser login")
+            return _get_interactive_credential(state, auth_config)
+        return None
+    if name not in _REMEMBERED_CREDENTIALS or (
+        is_azureml_managed_identity and name == "ManagedIdentityCredential"
+    ):
+        return None
+
+    logger.debug(f"Using remembered {name}")
+    # the rest of the chain is only used if the remembered credential stops working
+    return ChainedTokenCredential(
+        _REMEMBERED_CREDENTIALS[name](),
+        DefaultAzureCredential(
+            exclude_managed_identity_credential=is_azureml_managed_identity
+        ),
+        InteractiveBrowserCredential(),
+    )
+
+
+def _get_interactive_credential(state: dict, auth_config: AuthConfig):
+    if not auth_config.persistent_token_cache:
+        return InteractiveBrowserCredential()
+
+    record = state.get("authentication_record")
+    credential = InteractiveBrowserCredential(
+        cache_persistence_options=TokenCachePersistenceOptions(
+            name=TOKEN_CACHE_NAME,
+            allow_unencrypted_storage=auth_config.allow_unencrypted_token_cache,
+        ),
+        authentication_record=AuthenticationRecord.deserialize(record)
+        if record
+        else None,
+    )
+    if not record:
+        # the record lets the next processes find the account in the persistent token cache
+        record = credential.authenticate(scopes=[AZURE_MANAGEMENT_SCOPE]).serialize()
+        _save_auth_state(
+            {
+                **state,
+                "credential": INTERACTIVE_CREDENTIAL,
+                "authentication_record": record,
+            }
+        )
     return credential
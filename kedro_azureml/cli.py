@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import os
@@ -5,32 +6,140 @@ from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 import click
-from kedro.framework.cli.project import LOAD_VERSION_HELP
-from kedro.framework.cli.utils import _split_load_versions
+from kedro.framework.cli.project import (
+    FROM_INPUTS_HELP,
+    FROM_NODES_HELP,
+    LOAD_VERSION_HELP,
+    NODE_ARG_HELP,
+    TAG_ARG_HELP,
+    TO_NODES_HELP,
+    TO_OUTPUTS_HELP,
+)
+from kedro.framework.cli.utils import (
+    _split_load_versions,
+    split_node_names,
+    split_string,
+)
 from kedro.framework.startup import ProjectMetadata
 
 from kedro_azureml.cli_functions import (
     default_job_callback,
     dynamic_import_job_schedule_func_from_str,
+    get_cluster_names,
     get_context_and_pipeline,
+    get_context_and_pipelines,
+    get_step_storage_run_id,
+    parse_azure_params,
     parse_extra_env_params,
+    parse_params_matrix,
     parse_runtime_params,
+    read_azure_param_inputs,
     verify_configuration_directory_for_azure,
     warn_about_ignore_files,
 )
-from kedro_azureml.client import AzureMLPipelinesClient
+from kedro_azureml.client import (
+    DEFAULT_MAX_CONCURRENT_SUBMISSIONS,
+    AzureMLPipelinesClient,
+    AzureMLWorkspaceConnection,
+)
+from kedro_azureml.components import ComponentRegistry
 from kedro_azureml.config import CONFIG_TEMPLATE_YAML
 from kedro_azureml.constants import (
     AZURE_SUBSCRIPTION_ID,
     KEDRO_AZURE_BLOB_TEMP_DIR_NAME,
+    KEDRO_AZURE_STEP_FINGERPRINT,
+    PARAM_INPUT_TYPES,
 )
 from kedro_azureml.distributed.utils import is_distributed_master_node
 from kedro_azureml.manager import KedroContextManager
-from kedro_azureml.runner import AzurePipelinesRunner
+from kedro_azureml.runner import (
+    AzurePipelinesRunner,
+    read_output_marker,
+    write_output_marker,
+)
 from kedro_azureml.utils import CliContext
 
 logger = logging.getLogger(__name__)
 
+PIPELINE_FILTERS = (
+    "tags",
+    "node_names",
+    "from_nodes",
+    "to_nodes",
+    "from_inputs",
+    "to_outputs",
+)
+
+
+def pipeline_slicing_options(func):
+    """Kedro's options slicing the pipeline, passed to the command as ``pipeline_filters`` of ``Pipeline.filter``"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        kwargs["pipeline_filters"] = {
+            name: kwargs.pop(name) for name in PIPELINE_FILTERS
+        }
+        return func(*args, **kwargs)
+
+    options = [
+        click.option(
+            "--tags",
+            "-t",
+            type=str,
+            default="",
+            help=TAG_ARG_HELP,
+            callback=split_string,
+        ),
+        click.option(
+            "--nodes",
+            "--node-names",
+            "-n",
+            "node_names",
+            type=str,
+            default="",
+            help=NODE_ARG_HELP,
+            callback=split_node_names,
+        ),
+        click.option(
+            "--from-nodes",
+            type=str,
+            default="",
+            help=FROM_NODES_HELP,
+            callback=split_node_names,
+        ),
+        click.option(
+            "--to-nodes",
+            type=str,
+            default="",
+            help=TO_NODES_HELP,
+            callback=split_node_names,
+        ),
+        click.option(
+            "--from-inputs",
+            type=str,
+            default="",
+            help=FROM_INPUTS_HELP,
+            callback=split_string,
+        ),
+        click.option(
+            "--to-outputs",
+            type=str,
+            default="",
+            help=TO_OUTPUTS_HELP,
+            callback=split_string,
+        ),
+        click.option(
+            "--previous-run-id",
+            type=str,
+            default=None,
+            help="Kedro Azure run ID (the `kedro_azure_run_id` tag of the job) of the run from which the inputs "
+            "produced by the sliced-off nodes are read, if they are not in the catalog",
+        ),
+    ]
+    for option in reversed(options):
+        wrapper = option(wrapper)
+    return wrapper
+
 
 @click.group("AzureML")
 def commands():
@@ -192,10 +301,11 @@ def init(
 @click.option(
     "-p",
     "--pipeline",
-    "pipeline",
+    "pipelines",
     type=str,
-    help="Name of pipeline to run",
-    default="__default__",
+    multiple=True,
+    help="Name of pipeline to run, can be used multiple times to run several pipelines",
+    default=["__default__"],
 )
 @click.option(
     "--params",
@@ -203,7 +313,37 @@ def init(
     type=str,
     help="Parameters override in form of JSON string",
 )
+@click.option(
+    "--params-matrix",
+    "params_matrix",
+    type=click.Path(exists=True, dir_okay=False),
+    callback=parse_params_matrix,
+    help="YAML/JSON file with a list (or a mapping of names) of parameter overrides, "
+    "merged over --params. Every pipeline is run once for each of the parameter sets",
+)
+@click.option(
+    "--max-concurrent-submissions",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENT_SUBMISSIONS,
+    show_default=True,
+    help="Maximum number of jobs submitted to Azure ML at the same time",
+)
 @click.option("--wait-for-completion", type=bool, is_flag=True, default=False)
+@click.option(
+    "--warm-up",
+    type=bool,
+    is_flag=True,
+    default=False,
+    help="Raise the minimum number of nodes of the compute clusters to 1 while the command runs, "
+    "so that they scale up while the pipelines are generated",
+)
+@click.option(
+    "--stream-logs",
+    type=bool,
+    is_flag=True,
+    default=False,
+    help="Stream the logs of the jobs when waiting for completion, instead of polling their progress",
+)
 @click.option(
     "--env-var",
     type=str,
@@ -218,6 +358,22 @@ def init(
     help=LOAD_VERSION_HELP,
     callback=_split_load_versions,
 )
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="Generate the pipeline even if it did not change since it was last compiled",
+)
+@pipeline_slicing_options
+@click.option(
+    "--resume",
+    "resume_run_id",
+    type=str,
+    default=None,
+    help="Kedro Azure run ID (the `kedro_azure_run_id` tag of the job) of the run to resume, "
+    "only the nodes of which the outputs are missing and their descendants are run",
+)
 @click.option(
     "--on-job-scheduled",
     "on_job_scheduled",
@@ -238,17 +394,31 @@ def run(
     subscription_id: str,
     aml_env: Optional[str],
     image: Optional[str],
-    pipeline: str,
+    pipelines: Tuple[str],
     params: str,
+    params_matrix: Optional[List[Tuple[str, Dict]]],
+    max_concurrent_submissions: int,
     wait_for_completion: bool,
+    stream_logs: bool,
+    warm_up: bool,
     env_var: Tuple[str],
     load_versions: Dict[str, str],
+    no_cache: bool,
     on_job_scheduled: Optional[Callable],
+    pipeline_filters: Dict[str, List[str]],
+    previous_run_id: Optional[str],
+    resume_run_id: Optional[str],
 ):
     """Runs the specified pipeline in Azure ML Pipelines; Additional parameters can be passed from command line.
     Can be used with --wait-for-completion param to block the caller until the pipeline finishes in Azure ML.
+    By default, the progress of the steps is polled, use --stream-logs to stream the logs instead.
+    Several pipelines and/or parameter sets (--params-matrix) are submitted as separate jobs, concurrently.
     """
     params = json.dumps(p) if (p := parse_runtime_params(params)) else ""
+    if resume_run_id and (len(set(pipelines)) > 1 or params_matrix):
+        raise click.UsageError(
+            "--resume resumes a single run, it cannot be used with several pipelines or --params-matrix"
+        )
 
     if subscription_id:
         click.echo(f"Overriding Azure Subscription ID for run to: {subscription_id}")
@@ -262,21 +432,62 @@ def run(
 
     mgr: KedroContextManager
     extra_env = parse_extra_env_params(env_var)
-    with get_context_and_pipeline(
-        ctx, image, pipeline, params, aml_env, extra_env, load_versions
+    # the client is created and the cluster is looked up (and warmed up) during the generation
+    connection = AzureMLWorkspaceConnection(subscription_id, warm_up)
+    with connection, get_context_and_pipelines(
+        ctx,
+        image,
+        list(dict.fromkeys(pipelines)),
+        params,
+        params_matrix,
+        aml_env,
+        extra_env,
+        load_versions,
+        on_config_loaded=lambda mgr: connection.start(
+            mgr.plugin_config.azure,
+            get_cluster_names(
+                mgr.plugin_config.azure,
+                list(dict.fromkeys(pipelines)),
+                pipeline_filters,
+            )
+            if warm_up
+            else None,
+        ),
+        use_cache=not no_cache,
+        pipeline_filters=pipeline_filters,
+        previous_run_id=previous_run_id,
+        resume_run_id=resume_run_id,
+        get_component_registry=lambda mgr: (
+            ComponentRegistry(
+                connection.get(mgr.plugin_config.azure)[0],
+                max_concurrent_submissions,
+            )
+            if mgr.plugin_config.azure.registered_components
+            and mgr.plugin_config.azure.registered_components.enabled
+            else None
+        ),
     ) as (
         mgr,
-        az_pipeline,
+        az_pipelines,
     ):
-        az_client = AzureMLPipelinesClient(az_pipeline, subscription_id)
-
-        if not on_job_scheduled:
-            on_job_scheduled = default_job_callback
+        if len(az_pipelines) == 1:
+            az_client = AzureMLPipelinesClient(
+                next(iter(az_pipelines.values())), subscription_id
+            )
+            if not on_job_scheduled:
+                on_job_scheduled = default_job_callback
+        else:
+            # job URLs are listed in the summary of submitted jobs
+            az_client = AzureMLPipelinesClient(
+                az_pipelines, subscription_id, max_concurrent_submissions
+            )
 
         is_ok = az_client.run(
             mgr.plugin_config.azure,
             wait_for_completion,
             on_job_scheduled,
+            stream_logs,
+            connection,
         )
 
         if is_ok:
@@ -347,6 +558,14 @@ def run(
     help=LOAD_VERSION_HELP,
     callback=_split_load_versions,
 )
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="Generate the pipeline even if it did not change since it was last compiled",
+)
+@pipeline_slicing_options
 @click.pass_obj
 def compile(
     ctx: CliContext,
@@ -357,17 +576,29 @@ def compile(
     output: str,
     env_var: Tuple[str],
     load_versions: Dict[str, str],
+    no_cache: bool,
+    pipeline_filters: Dict[str, List[str]],
+    previous_run_id: Optional[str],
 ):
-    """Compiles the pipeline into YAML format"""
+    """Compiles the pipeline into YAML format, unchanged pipelines are loaded from the compile cache"""
     params = json.dumps(p) if (p := parse_runtime_params(params)) else ""
     extra_env = parse_extra_env_params(env_var)
     with get_context_and_pipeline(
-        ctx, image, pipeline, params, aml_env, extra_env, load_versions
+        ctx,
+        image,
+        pipeline,
+        params,
+        aml_env,
+        extra_env,
+        load_versions,
+        use_cache=not no_cache,
+        pipeline_filters=pipeline_filters,
+        previous_run_id=previous_run_id,
     ) as (
         _,
-        az_pipeline,
+        compiled_pipeline,
     ):
-        Path(output).write_text(str(az_pipeline))
+        Path(output).write_text(compiled_pipeline.spec)
         click.echo(f"Compiled pipeline to {output}")
 
 
@@ -381,7 +612,13 @@ def compile(
     default="__default__",
 )
 @click.option(
-    "-n", "--node", "node", type=str, help="Name of the node to run", required=True
+    "-n",
+    "--node",
+    "nodes",
+    type=str,
+    multiple=True,
+    help="Name of the node to run, can be used multiple times to run several nodes in one step",
+    required=True,
 )
 @click.option(
     "--params",
@@ -403,17 +640,44 @@ def compile(
     multiple=True,
     help="Name and path of Azure ML Pipeline output",
 )
+@click.option(
+    "--az-param",
+    "azure_params",
+    type=(str, click.Choice(PARAM_INPUT_TYPES), str),
+    multiple=True,
+    help="Name, type and value of the parameter passed as Azure ML Pipeline input",
+)
+@click.option(
+    "--az-param-input",
+    "azure_param_inputs",
+    type=(str, click.Choice(PARAM_INPUT_TYPES), str),
+    multiple=True,
+    help="Name, type and Azure ML Pipeline input of the parameter, read from the AZURE_ML_INPUT_<input> variable",
+)
+@click.option(
+    "--merge-shards",
+    "merge_shards",
+    type=int,
+    default=None,
+    help="Merge the outputs of that many shards of the parallel node, instead of running it",
+)
 @click.pass_obj
 def execute(
     ctx: CliContext,
     pipeline: str,
-    node: str,
+    nodes: Tuple[str],
     params: str,
     azure_inputs: List[Tuple[str, str]],
     azure_outputs: List[Tuple[str, str]],
+    azure_params: List[Tuple[str, str, str]],
+    azure_param_inputs: List[Tuple[str, str, str]],
+    merge_shards: Optional[int],
 ):
     # 1. Run kedro
     parameters = parse_runtime_params(params)
+    azure_params = [*azure_params, *read_azure_param_inputs(azure_param_inputs)]
+    if azure_params:
+        parameters = parse_azure_params(azure_params, parameters or {})
     azure_inputs = {ds_name: data_path for ds_name, data_path in azure_inputs}
     azure_outputs = {ds_name: data_path for ds_name, data_path in azure_outputs}
     data_paths = {**azure_inputs, **azure_outputs}
@@ -423,15 +687,39 @@ def execute(
             mgr.plugin_config.azure.pipeline_data_passing is not None
             and mgr.plugin_config.azure.pipeline_data_passing.enabled
         )
+        input_storage_run_ids = {
+            ds_name: run_id
+            for ds_name, data_path in azure_inputs.items()
+            if (run_id := read_output_marker(data_path))
+        }
+        storage_run_id = None
+        if not pipeline_data_passing and (
+            step_fingerprint := os.environ.get(KEDRO_AZURE_STEP_FINGERPRINT)
+        ):
+            storage_run_id = get_step_storage_run_id(
+                step_fingerprint, azure_params, input_storage_run_ids
+            )
         runner = AzurePipelinesRunner(
-            data_paths=data_paths, pipeline_data_passing=pipeline_data_passing
+            data_paths=data_paths,
+            pipeline_data_passing=pipeline_data_passing,
+            storage_run_id=storage_run_id,
+            input_storage_run_ids=input_storage_run_ids,
         )
-        mgr.session.run(pipeline, node_names=[node], runner=runner)
+        if merge_shards:
+            from kedro.framework.project import pipelines
+
+            runner.merge_shards(
+                pipelines[pipeline].filter(node_names=list(nodes)),
+                mgr.context.catalog,
+                merge_shards,
+            )
+        else:
+            mgr.session.run(pipeline, node_names=list(nodes), runner=runner)
 
-    # 2. Save dummy outputs
+    # 2. Save the outputs' markers with the run ID under which the temporary data was saved
     # In distributed computing, it will only happen on nodes with rank 0
     if not pipeline_data_passing and is_distributed_master_node():
         for data_path in azure_outputs.values():
-            (Path(data_path) / "output.txt").write_text("#getindata")
+            write_output_marker(data_path, runner.storage_run_id)
     else:
         logger.info("Skipping saving Azure outputs on non-master distributed nodes")
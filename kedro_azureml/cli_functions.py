@@ -1,21 +1,62 @@
+import hashlib
 import importlib
 import json
 import logging
 import os
 import re
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import click
+import yaml
 
+from kedro_azureml.compile_cache import CompiledPipeline, compile_pipeline
+from kedro_azureml.components import ComponentRegistry
+from kedro_azureml.config import AzureMLConfig
+from kedro_azureml.constants import AZURE_ML_INPUT_ENV_PREFIX
 from kedro_azureml.generator import AzureMLPipelineGenerator
 from kedro_azureml.manager import KedroContextManager
-from kedro_azureml.utils import CliContext
+from kedro_azureml.utils import CliContext, merge_dicts, update_dict
 
 logger = logging.getLogger()
 
 
+def _get_storage_account_key(mgr: KedroContextManager) -> str:
+    storage_account_key = os.getenv("AZURE_STORAGE_ACCOUNT_KEY", "")
+    pipeline_data_passing = (
+        mgr.plugin_config.azure.pipeline_data_passing is not None
+        and mgr.plugin_config.azure.pipeline_data_passing.enabled
+    )
+    if not pipeline_data_passing and not storage_account_key:
+        click.echo(
+            click.style(
+                "Environment variable AZURE_STORAGE_ACCOUNT_KEY not set, falling back to CLI prompt",
+                fg="yellow",
+            )
+        )
+        storage_account_key = click.prompt(
+            f"Please provide Azure Storage Account Key for "
+            f"storage account {mgr.plugin_config.azure.temporary_storage.account_name}",
+            hide_input=True,
+        )
+    return storage_account_key
+
+
+def _compile_pipeline(
+    generator: AzureMLPipelineGenerator,
+    name: str,
+    use_cache: bool,
+    eager_load: bool = False,
+) -> CompiledPipeline:
+    compiled = compile_pipeline(generator, use_cache, eager_load)
+    if use_cache:
+        click.echo(
+            f"Compile cache {'hit' if compiled.cache_hit else 'miss'} for pipeline {name}"
+        )
+    return compiled
+
+
 @contextmanager
 def get_context_and_pipeline(
     ctx: CliContext,
@@ -25,27 +66,18 @@ def get_context_and_pipeline(
     aml_env: Optional[str] = None,
     extra_env: Dict[str, str] = {},
     load_versions: Dict[str, str] = {},
+    use_cache: bool = False,
+    pipeline_filters: Dict[str, List[str]] = {},
+    previous_run_id: Optional[str] = None,
 ):
+    """
+    Yields the context manager and the compiled pipeline, which is loaded from the compile cache
+    when ``use_cache`` is set and nothing the pipeline depends on changed since it was compiled.
+    """
     with KedroContextManager(
         env=ctx.env, runtime_params=parse_runtime_params(params, True)
     ) as mgr:
-        storage_account_key = os.getenv("AZURE_STORAGE_ACCOUNT_KEY", "")
-        pipeline_data_passing = (
-            mgr.plugin_config.azure.pipeline_data_passing is not None
-            and mgr.plugin_config.azure.pipeline_data_passing.enabled
-        )
-        if not pipeline_data_passing and not storage_account_key:
-            click.echo(
-                click.style(
-                    "Environment variable AZURE_STORAGE_ACCOUNT_KEY not set, falling back to CLI prompt",
-                    fg="yellow",
-                )
-            )
-            storage_account_key = click.prompt(
-                f"Please provide Azure Storage Account Key for "
-                f"storage account {mgr.plugin_config.azure.temporary_storage.account_name}",
-                hide_input=True,
-            )
+        storage_account_key = _get_storage_account_key(mgr)
 
         generator = AzureMLPipelineGenerator(
             pipeline,
@@ -59,9 +91,164 @@ def get_context_and_pipeline(
             storage_account_key,
             extra_env,
             load_versions,
+            pipeline_filters,
+            previous_run_id,
+        )
+        yield mgr, _compile_pipeline(generator, pipeline, use_cache)
+
+
+@contextmanager
+def get_context_and_pipelines(
+    ctx: CliContext,
+    docker_image: Optional[str],
+    pipelines: Sequence[str],
+    params: str,
+    params_matrix: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+    aml_env: Optional[str] = None,
+    extra_env: Dict[str, str] = {},
+    load_versions: Dict[str, str] = {},
+    on_config_loaded: Optional[Callable[[KedroContextManager], None]] = None,
+    use_cache: bool = False,
+    pipeline_filters: Dict[str, List[str]] = {},
+    previous_run_id: Optional[str] = None,
+    resume_run_id: Optional[str] = None,
+    get_component_registry: Optional[
+        Callable[[KedroContextManager], Optional[ComponentRegistry]]
+    ] = None,
+):
+    """
+    Generates Azure ML pipeline jobs for every combination of the pipelines and the parameter sets
+    from the params matrix (merged over ``params``).
+    Every parameter set is generated separately (the parameters can change the steps and are passed to their
+    commands), so the generation time grows with the size of the params matrix,
+    see ``dev-utils/benchmark_generator.py``. The parameter sets with overrides are generated in Kedro sessions
+    of their own, so that ``${runtime_params:...}`` in the catalog and ``azureml.yml`` resolve with their values.
+    Yields the context manager and a dict of the jobs, keyed by ``<pipeline>`` or ``<pipeline>[<params set>]``.
+    ``on_config_loaded`` is called before the generation, as soon as the plugin config is available.
+    With ``use_cache``, the jobs are loaded from the compile cache if their pipelines did not change.
+    The pipelines are sliced with ``pipeline_filters`` (the arguments of Kedro's ``Pipeline.filter``),
+    with ``resume_run_id`` to the nodes which did not save their outputs in that run.
+    ``get_component_registry`` returns the registry the steps are registered in as components, if any.
+    """
+    base_params = parse_runtime_params(params, True) or {}
+    with KedroContextManager(
+        env=ctx.env, runtime_params=base_params or None
+    ) as mgr, ExitStack() as params_set_contexts:
+        storage_account_key = _get_storage_account_key(mgr)
+        if on_config_loaded:
+            on_config_loaded(mgr)
+        component_registry = (
+            get_component_registry(mgr) if get_component_registry else None
+        )
+        params_sets = [
+            (
+                params_set_name,
+                overrides,
+                params_set_contexts.enter_context(
+                    KedroContextManager(
+                        env=ctx.env, runtime_params=merge_dicts(base_params, overrides)
+                    )
+                )
+                if overrides
+                else mgr,
+            )
+            for params_set_name, overrides in params_matrix or [(None, {})]
+        ]
+
+        az_pipelines = {}
+        for pipeline in pipelines:
+            for params_set_name, overrides, params_set_mgr in params_sets:
+                runtime_params = merge_dicts(base_params, overrides)
+                generator = AzureMLPipelineGenerator(
+                    pipeline,
+                    ctx.env,
+                    params_set_mgr.plugin_config,
+                    merge_dicts(params_set_mgr.context.params, overrides),
+                    params_set_mgr.context.catalog,
+                    aml_env,
+                    docker_image,
+                    json.dumps(runtime_params) if runtime_params else "",
+                    storage_account_key,
+                    extra_env,
+                    load_versions,
+                    pipeline_filters,
+                    previous_run_id,
+                    resume_run_id,
+                    component_registry=component_registry,
+                )
+                name = (
+                    f"{pipeline}[{params_set_name}]"
+                    if params_set_name is not None
+                    else pipeline
+                )
+                az_pipelines[name] = _compile_pipeline(
+                    generator, name, use_cache, eager_load=True
+                ).job
+        yield mgr, az_pipelines
+
+
+def get_cluster_names(
+    config: AzureMLConfig,
+    pipelines: Sequence[str],
+    pipeline_filters: Dict[str, List[str]] = {},
+) -> List[str]:
+    """
+    Names of the compute clusters which the nodes of the pipelines run on, selected by their tags
+    (see ``AzureMLPipelineGenerator.get_target_resource_from_node_tags``)
+    """
+    from kedro.framework.project import pipelines as kedro_pipelines
+
+    cluster_names = []
+    for name in pipelines:
+        pipeline = kedro_pipelines[name]
+        if pipeline_filters:
+            try:
+                pipeline = pipeline.filter(**pipeline_filters)
+            except ValueError:
+                continue  # reported by the generation
+        for node in pipeline.nodes:
+            compute_keys = sorted(set(node.tags) & set(config.compute)) or [
+                "__default__"
+            ]
+            cluster_names.extend(
+                config.compute[key].cluster_name for key in compute_keys
+            )
+    return list(dict.fromkeys(cluster_names))
+
+
+def parse_params_matrix(
+    ctx: click.Context, param: click.Parameter, path: Optional[str]
+) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Click callback loading the params matrix file - a YAML/JSON list of parameter overrides
+    or a mapping of parameter set names to parameter overrides.
+    Returns a list of (parameter set name, parameter overrides) tuples.
+    """
+    if not path:
+        return None
+
+    try:
+        matrix = yaml.safe_load(Path(path).read_text())
+    except yaml.YAMLError as e:
+        raise click.BadParameter(f"Cannot parse the params matrix: {e}") from e
+
+    if isinstance(matrix, list):
+        params_sets = [(str(i), overrides) for i, overrides in enumerate(matrix)]
+    elif isinstance(matrix, dict):
+        params_sets = [(str(name), overrides) for name, overrides in matrix.items()]
+    else:
+        raise click.BadParameter(
+            "The params matrix must be a list or a mapping of parameter overrides"
         )
-        az_pipeline = generator.generate()
-        yield mgr, az_pipeline
+
+    if not params_sets:
+        raise click.BadParameter("The params matrix is empty")
+    for name, overrides in params_sets:
+        if not isinstance(overrides, dict):
+            raise click.BadParameter(
+                f"Parameter set {name} of the params matrix is not a mapping"
+            )
+    return params_sets
 
 
 def parse_runtime_params(params, silent=False):
@@ -75,6 +262,70 @@ def parse_runtime_params(params, silent=False):
     return parameters
 
 
+def parse_azure_params(
+    azure_params: Sequence[Tuple[str, str, str]], params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Decodes the parameters passed to the step as Azure ML pipeline inputs (see
+    ``AzureMLPipelineGenerator._get_param_type_and_value``) and sets them in the runtime params
+    """
+    decoders: Dict[str, Callable[[str], Any]] = {
+        "boolean": lambda value: value.lower() in ("true", "1"),
+        "integer": int,
+        "number": float,
+        "string": str,
+        "json": json.loads,
+    }
+    return update_dict(
+        params,
+        *(
+            (name, decoders[param_type](value))
+            for name, param_type, value in azure_params
+        ),
+    )
+
+
+def read_azure_param_inputs(
+    azure_param_inputs: Sequence[Tuple[str, str, str]]
+) -> List[Tuple[str, str, str]]:
+    """
+    Reads the values of the parameters passed to the step as Azure ML pipeline inputs from the
+    ``AZURE_ML_INPUT_<port>`` environment variables, which Azure ML sets for the inputs of the step.
+    The values are not passed in the command, as they can contain any characters when the pipeline is re-submitted.
+    """
+    azure_params = []
+    for name, param_type, port in azure_param_inputs:
+        if (value := os.environ.get(AZURE_ML_INPUT_ENV_PREFIX + port)) is None:
+            raise click.BadParameter(
+                f"The value of the parameter {name} is not set, "
+                f"{AZURE_ML_INPUT_ENV_PREFIX + port} environment variable is missing",
+                param_hint="--az-param-input",
+            )
+        azure_params.append((name, param_type, value))
+    return azure_params
+
+
+def get_step_storage_run_id(
+    step_fingerprint: str,
+    azure_params: Sequence[Tuple[str, str, str]],
+    input_storage_run_ids: Dict[str, str],
+) -> str:
+    """
+    Run ID under which the step saves its outputs to the temporary storage when the steps are reused. It depends on
+    the fingerprint of the step, the values of the parameters and the run IDs of the inputs, so the outputs
+    of the step run with different data are never overwritten.
+    """
+    return hashlib.sha256(
+        json.dumps(
+            [
+                step_fingerprint,
+                sorted(map(list, azure_params)),
+                sorted(input_storage_run_ids.items()),
+            ]
+        ).encode()
+    ).hexdigest()[:32]
+
+
 def warn_about_ignore_files():
     aml_ignore = Path.cwd().joinpath(".amlignore")
     git_ignore = Path.cwd().joinpath(".gitignore")
@@ -1,14 +1,24 @@
+import atexit
 import json
 import logging
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import backoff
 from azure.ai.ml import MLClient
-from azure.ai.ml.entities import Job
+from azure.ai.ml.entities import Compute, Job
+from azure.core.polling import LROPoller
 
 from kedro_azureml.auth.utils import get_azureml_credentials
+from kedro_azureml.code_snapshot import resolve_code_asset
+from kedro_azureml.components import iter_steps
 from kedro_azureml.config import AzureMLConfig
 
 logger = logging.getLogger(__name__)
@@ -22,7 +32,7 @@ def _get_azureml_client(subscription_id: Optional[str], config: AzureMLConfig):
         "workspace_name": config.workspace_name,
     }
 
-    credential = get_azureml_credentials()
+    credential = get_azureml_credentials(getattr(config, "auth", None))
 
     with TemporaryDirectory() as tmp_dir:
         config_path = Path(tmp_dir) / "config.json"
@@ -33,44 +43,419 @@ def _get_azureml_client(subscription_id: Optional[str], config: AzureMLConfig):
         yield ml_client
 
 
+DEFAULT_MAX_CONCURRENT_SUBMISSIONS = 4
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_POLL_INTERVAL = 60.0
+DEFAULT_MAX_POLL_TRIES = 5
+# status reported for the jobs whose status could not be polled, even after retrying
+UNKNOWN_JOB_STATUS = "Unknown"
+TERMINAL_JOB_STATUSES = ("Completed", "Failed", "Canceled", "NotResponding")
+QUEUED_JOB_STATUSES = (
+    "NotStarted",
+    "Starting",
+    "Provisioning",
+    "Preparing",
+    "Queued",
+)
+
+
+def _format_table(rows: List[Tuple]) -> str:
+    widths = [max(len(str(row[i])) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(str(value).ljust(width) for value, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return (
+        f"{hours}h{minutes:02d}m{seconds:02d}s"
+        if hours
+        else f"{minutes}m{seconds:02d}s"
+    )
+
+
+def format_jobs_summary(jobs: Dict[str, Optional[Job]]) -> str:
+    return _format_table(
+        [("Pipeline", "Job name", "URL")]
+        + [
+            (name, job.name, job.studio_url)
+            if job
+            else (name, "-", "submission failed")
+            for name, job in jobs.items()
+        ]
+    )
+
+
+class AzureMLJobsWaiter:
+    """
+    Waits for Azure ML pipeline jobs by polling the status of the jobs and of their steps,
+    with the poll interval growing exponentially (up to ``max_poll_interval``) while nothing changes.
+    The progress of the steps is logged as a table whenever any status changes.
+    Failed polls are retried with ``max_poll_tries``, a job which still cannot be polled is reported
+    with the ``Unknown`` status, without interrupting the waiting for the other jobs.
+    """
+
+    def __init__(
+        self,
+        ml_client: MLClient,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_SUBMISSIONS,
+        max_poll_tries: int = DEFAULT_MAX_POLL_TRIES,
+    ):
+        self.ml_client = ml_client
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_workers = max_workers
+        self.max_poll_tries = max_poll_tries
+        # (pipeline, step) -> [status, started at, finished at], step is None for the pipeline job itself
+        self._progress: Dict[Tuple[str, Optional[str]], list] = {}
+
+    def _poll_intervals(self):
+        intervals = backoff.expo(
+            factor=self.poll_interval, max_value=self.max_poll_interval
+        )
+        next(intervals)
+        return intervals
+
+    def _get_statuses(self, job_name: str) -> Tuple[str, Dict[str, str]]:
+        status = self.ml_client.jobs.get(job_name).status
+        steps = {
+            child.display_name or child.name: child.status
+            for child in self.ml_client.jobs.list(parent_job_name=job_name)
+        }
+        return status, steps
+
+    def _get_statuses_with_retries(self, job_name: str) -> Tuple[str, Dict[str, str]]:
+        return backoff.on_exception(
+            backoff.expo,
+            Exception,
+            max_tries=self.max_poll_tries,
+            factor=self.poll_interval,
+            max_value=self.max_poll_interval,
+            logger=logger,
+        )(self._get_statuses)(job_name)
+
+    def _update(self, key: Tuple[str, Optional[str]], status: str, now: float) -> bool:
+        progress = self._progress.setdefault(key, [None, None, None])
+        if progress[0] == status:
+            return False
+        progress[0] = status
+        if status not in QUEUED_JOB_STATUSES and progress[1] is None:
+            progress[1] = now
+        if status in TERMINAL_JOB_STATUSES + (UNKNOWN_JOB_STATUS,):
+            progress[2] = now
+        return True
+
+    def format_progress(self) -> str:
+        now = time.monotonic()
+        rows = [("Pipeline", "Step", "Status", "Duration")]
+        # pipeline job first, followed by its steps
+        for (pipeline, step), (status, started, finished) in sorted(
+            self._progress.items(), key=lambda i: (i[0][0], i[0][1] or "")
+        ):
+            duration = (finished or now) - started if started is not None else None
+            rows.append(
+                (
+                    pipeline if step is None else "",
+                    step or "-",
+                    status,
+                    _format_duration(duration),
+                )
+            )
+        return _format_table(rows)
+
+    def wait(self, jobs: Dict[str, Job]) -> Dict[str, str]:
+        """
+        Waits until all the jobs finish.
+        :param jobs: submitted jobs, keyed by the pipeline names
+        :return: final statuses of the jobs
+        """
+        pending = dict(jobs)
+        statuses = {}
+        intervals = self._poll_intervals()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                futures = {
+                    name: executor.submit(self._get_statuses_with_retries, job.name)
+                    for name, job in pending.items()
+                }
+                now = time.monotonic()
+                changed = False
+                for name, future in futures.items():
+                    try:
+                        status, steps = future.result()
+                    except Exception:
+                        logger.exception(f"Error while polling the pipeline {name}")
+                        status, steps = UNKNOWN_JOB_STATUS, {}
+                    changed = self._update((name, None), status, now) or changed
+                    for step, step_status in steps.items():
+                        changed = (
+                            self._update((name, step), step_status, now) or changed
+                        )
+                    if status in TERMINAL_JOB_STATUSES + (UNKNOWN_JOB_STATUS,):
+                        statuses[name] = status
+                        del pending[name]
+
+                if changed:
+                    logger.info("Progress of the pipelines:\n" + self.format_progress())
+                    intervals = self._poll_intervals()
+                if not pending:
+                    return statuses
+                time.sleep(next(intervals))
+
+
+def _exit_on_sigterm(signum, frame):
+    sys.exit(128 + signum)
+
+
+class AzureMLWorkspaceConnection:
+    """
+    Creates the MLClient and looks up the compute cluster in a background thread, started with ``start``,
+    so that it overlaps with the generation of the pipelines. With ``warm_up``, the minimum number of nodes
+    of the clusters used by the pipelines is raised to 1, so that they start scaling up before the jobs
+    are submitted, and restored when the connection is closed - also at the exit of the interpreter
+    and on SIGTERM, which is turned into ``SystemExit`` while the clusters are warmed up.
+    """
+
+    def __init__(self, subscription_id: Optional[str], warm_up: bool = False):
+        self.subscription_id = subscription_id
+        self.warm_up = warm_up
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._connected: Optional[Future] = None
+        # cluster name -> (original min instances, warm-up poller)
+        self._warmed_up: Dict[str, Tuple[int, LROPoller]] = {}
+        self._sigterm_handler = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(
+        self, config: AzureMLConfig, cluster_names: Optional[Iterable[str]] = None
+    ) -> "AzureMLWorkspaceConnection":
+        """
+        Starts connecting to the workspace.
+        :param cluster_names: clusters used by the pipelines, warmed up with ``warm_up``
+            (the default cluster if not provided)
+        """
+        if self._connected is None:
+            if self.warm_up:
+                self._restore_on_exit()
+            self._connected = self._executor.submit(
+                self._connect, config, cluster_names
+            )
+        return self
+
+    def get(self, config: AzureMLConfig) -> Tuple[MLClient, Compute]:
+        return self.start(config)._connected.result()
+
+    def _connect(
+        self, config: AzureMLConfig, cluster_names: Optional[Iterable[str]]
+    ) -> Tuple[MLClient, Compute]:
+        with _get_azureml_client(self.subscription_id, config) as ml_client:
+            cluster_name = config.compute["__default__"].cluster_name
+            assert (
+                cluster := ml_client.compute.get(cluster_name)
+            ), f"Cluster {cluster_name} does not exist"
+
+            if self.warm_up:
+                for name in dict.fromkeys(cluster_names or [cluster_name]):
+                    self._warm_up_cluster(
+                        ml_client,
+                        cluster
+                        if name == cluster_name
+                        else ml_client.compute.get(name),
+                    )
+            return ml_client, cluster
+
+    def _restore_on_exit(self):
+        atexit.register(self.close)
+        # signal handlers can only be set in the main thread
+        if threading.current_thread() is threading.main_thread():
+            self._sigterm_handler = signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+    def _warm_up_cluster(self, ml_client: MLClient, cluster: Compute):
+        min_instances = getattr(cluster, "min_instances", None)
+        if min_instances != 0:
+            return
+        try:
+            cluster.min_instances = 1
+            poller = ml_client.compute.begin_update(cluster)
+        except Exception:
+            logger.warning(f"Cannot warm up cluster {cluster.name}", exc_info=True)
+            return
+        logger.info(f"Warming up cluster {cluster.name}, min instances raised to 1")
+        self._warmed_up[cluster.name] = (min_instances, poller)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.close)
+        if self._sigterm_handler is not None:
+            signal.signal(signal.SIGTERM, self._sigterm_handler)
+            self._sigterm_handler = None
+        if not self._warmed_up:
+            return
+        ml_client, _ = self._connected.result()
+        for name, (min_instances, poller) in self._warmed_up.items():
+            try:
+                poller.result()
+                cluster = ml_client.compute.get(name)
+                cluster.min_instances = min_instances
+                ml_client.compute.begin_update(cluster).result()
+                logger.info(
+                    f"Restored min instances of cluster {name} to {min_instances}"
+                )
+            except Exception:
+                logger.warning(
+                    f"Cannot restore min instances of cluster {name} to {min_instances}",
+                    exc_info=True,
+                )
+        self._warmed_up.clear()
+
+
 class AzureMLPipelinesClient:
-    def __init__(self, azure_pipeline: Job, subscription_id: str):
+    def __init__(
+        self,
+        azure_pipeline: Union[Job, Dict[str, Job]],
+        subscription_id: str,
+        max_concurrent_submissions: int = DEFAULT_MAX_CONCURRENT_SUBMISSIONS,
+    ):
         self.subscription_id = subscription_id
         self.azure_pipeline = azure_pipeline
+        self.max_concurrent_submissions = max_concurrent_submissions
 
     def run(
         self,
         config: AzureMLConfig,
         wait_for_completion=False,
         on_job_scheduled: Optional[Callable[[Job], None]] = None,
+        stream_logs: bool = False,
+        connection: Optional[AzureMLWorkspaceConnection] = None,
     ) -> bool:
-        with _get_azureml_client(self.subscription_id, config) as ml_client:
-            assert (
-                cluster := ml_client.compute.get(
-                    config.compute["__default__"].cluster_name
+        """
+        Submits the pipeline job(s) and optionally waits for them, by polling their status
+        or, with ``stream_logs``, by streaming their logs one after another.
+        :param connection: already started connection to the workspace, created for the run if not provided
+        :return: True if all the jobs were submitted (and completed, when waiting for completion)
+        """
+        if connection is None:
+            with AzureMLWorkspaceConnection(self.subscription_id) as connection:
+                return self.run(
+                    config,
+                    wait_for_completion,
+                    on_job_scheduled,
+                    stream_logs,
+                    connection,
                 )
-            ), f"Cluster {config.compute['__default__'].cluster_name} does not exist"
 
-            logger.info(
-                f"Creating job on cluster {cluster.name} ({cluster.size}, min instances: {cluster.min_instances}, "
-                f"max instances: {cluster.max_instances})"
-            )
+        ml_client, cluster = connection.get(config)
+        logger.info(
+            f"Creating job on cluster {cluster.name} ({cluster.size}, min instances: {cluster.min_instances}, "
+            f"max instances: {cluster.max_instances})"
+        )
+
+        if config.code_directory and not (
+            config.registered_components and config.registered_components.enabled
+        ):
+            # the registered components already reference the code asset
+            if code_id := resolve_code_asset(ml_client, config.code_directory):
+                self._use_code_asset(code_id)
 
+        if isinstance(self.azure_pipeline, dict):
+            pipeline_jobs = self._submit_many(
+                ml_client, config, cluster, on_job_scheduled
+            )
+        else:
             pipeline_job = ml_client.jobs.create_or_update(
                 self.azure_pipeline,
                 experiment_name=config.experiment_name,
                 compute=cluster,
             )
-
             if on_job_scheduled:
                 on_job_scheduled(pipeline_job)
+            pipeline_jobs = {self.azure_pipeline.display_name: pipeline_job}
+
+        is_ok = all(pipeline_jobs.values())
+        submitted = {name: job for name, job in pipeline_jobs.items() if job}
+        if not wait_for_completion or not submitted:
+            return is_ok
+        elif stream_logs:
+            for pipeline_job in submitted.values():
+                is_ok = self._stream(ml_client, pipeline_job) and is_ok
+            return is_ok
+        else:
+            statuses = AzureMLJobsWaiter(
+                ml_client, max_workers=self.max_concurrent_submissions
+            ).wait(submitted)
+            for name, status in statuses.items():
+                if status != "Completed":
+                    logger.error(f"Pipeline {name} finished with status {status}")
+            return is_ok and all(s == "Completed" for s in statuses.values())
+
+    def _get_pipelines(self) -> List[Job]:
+        return (
+            list(self.azure_pipeline.values())
+            if isinstance(self.azure_pipeline, dict)
+            else [self.azure_pipeline]
+        )
+
+    def _use_code_asset(self, code_id: str):
+        for azure_pipeline in self._get_pipelines():
+            for step in iter_steps(azure_pipeline):
+                if getattr(step, "code", None):
+                    step.code = code_id
 
-            if wait_for_completion:
+    def _submit_many(
+        self,
+        ml_client: MLClient,
+        config: AzureMLConfig,
+        cluster,
+        on_job_scheduled: Optional[Callable[[Job], None]],
+    ) -> Dict[str, Optional[Job]]:
+        logger.info(
+            f"Submitting {len(self.azure_pipeline)} jobs, "
+            f"up to {self.max_concurrent_submissions} at a time"
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrent_submissions
+        ) as executor:
+            futures = {
+                name: executor.submit(
+                    ml_client.jobs.create_or_update,
+                    azure_pipeline,
+                    experiment_name=config.experiment_name,
+                    compute=cluster,
+                )
+                for name, azure_pipeline in self.azure_pipeline.items()
+            }
+
+            pipeline_jobs: Dict[str, Optional[Job]] = {}
+            for name, future in futures.items():
                 try:
-                    ml_client.jobs.stream(pipeline_job.name)
-                    return True
+                    pipeline_jobs[name] = future.result()
                 except Exception:
-                    logger.exception("Error while running the pipeline", exc_info=True)
-                    return False
-            else:
-                return True
+                    logger.exception(f"Error while submitting the pipeline {name}")
+                    pipeline_jobs[name] = None
+                    continue
+                if on_job_scheduled:
+                    on_job_scheduled(pipeline_jobs[name])
+
+        logger.info("Submitted jobs:\n" + format_jobs_summary(pipeline_jobs))
+        return pipeline_jobs
+
+    @staticmethod
+    def _stream(ml_client: MLClient, pipeline_job: Job) -> bool:
+        try:
+            ml_client.jobs.stream(pipeline_job.name)
+            return True
+        except Exception:
+            logger.exception("Error while running the pipeline", exc_info=True)
+            return False
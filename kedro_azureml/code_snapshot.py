@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from azure.ai.ml import MLClient
+
+try:
+    # azure-ai-ml has no public API to list the files of the code snapshot and to register code assets,
+    # the private one is tested with the versions pinned in pyproject.toml
+    from azure.ai.ml._utils._asset_utils import (
+        get_ignore_file,
+        get_upload_files_from_folder,
+    )
+    from azure.ai.ml.entities._assets import Code
+except ImportError:
+    get_ignore_file = get_upload_files_from_folder = Code = None
+
+logger = logging.getLogger(__name__)
+
+CODE_SNAPSHOTS_PATH = Path.home() / ".kedro-azureml" / "code-snapshots.json"
+MAX_CACHED_SNAPSHOTS = 10
+
+
+@dataclass
+class CodeSnapshot:
+    path: Path
+    files: List[Tuple[str, int]]  # (path relative to the code directory, size)
+    fingerprint: str
+
+    @property
+    def total_size(self) -> int:
+        return sum(size for _, size in self.files)
+
+    def largest_files(self, count: int = 10) -> List[Tuple[str, int]]:
+        return sorted(self.files, key=lambda f: f[1], reverse=True)[:count]
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def _list_upload_files(path: Path) -> Iterable[Tuple[str, str]]:
+    """(absolute path, relative path) of the files which Azure ML uploads from the code directory"""
+    try:
+        return get_upload_files_from_folder(path, ignore_file=get_ignore_file(path))
+    except (TypeError, AttributeError):
+        # the private API is not available, all the files are listed
+        return (
+            (str(file), file.relative_to(path).as_posix())
+            for file in path.rglob("*")
+            if file.is_file()
+        )
+
+
+def get_code_snapshot(code_directory: Union[str, os.PathLike]) -> CodeSnapshot:
+    """
+    Lists the files which Azure ML uploads from the code directory (respecting ``.amlignore``, or ``.gitignore``
+    when there is no ``.amlignore``) and fingerprints them by their paths, sizes and modification times,
+    without reading their contents.
+    """
+    path = Path(code_directory).expanduser().resolve()
+    files = []
+    fingerprint = hashlib.sha256()
+    for absolute_path, relative_path in sorted(
+        _list_upload_files(path), key=lambda f: f[1]
+    ):
+        stat = os.stat(absolute_path)
+        files.append((relative_path, stat.st_size))
+        fingerprint.update(
+            f"{relative_path}\t{stat.st_size}\t{stat.st_mtime_ns}\n".encode()
+        )
+    return CodeSnapshot(path, files, fingerprint.hexdigest())
+
+
+def _load_cached_snapshots() -> dict:
+    try:
+        return json.loads(CODE_SNAPSHOTS_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cached_snapshots(snapshots: dict):
+    try:
+        CODE_SNAPSHOTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CODE_SNAPSHOTS_PATH.write_text(json.dumps(snapshots, indent=2))
+    except OSError:
+        logger.warning(
+            f"Cannot save the code snapshots cache to {CODE_SNAPSHOTS_PATH}",
+            exc_info=True,
+        )
+
+
+def resolve_code_asset(
+    ml_client: MLClient, code_directory: Union[str, os.PathLike]
+) -> Optional[str]:
+    """
+    Returns the ID of the code asset with the contents of the code directory.
+    The asset registered for the same code snapshot fingerprint in the workspace is reused,
+    otherwise the code directory is uploaded and registered as a new code asset.
+    Returns None if the code assets cannot be registered with the installed azure-ai-ml,
+    the code directory is then uploaded by Azure ML with the jobs.
+    """
+    snapshot = get_code_snapshot(code_directory)
+    logger.info(
+        f"Code snapshot of {snapshot.path}: {len(snapshot.files)} files, "
+        f"{_format_size(snapshot.total_size)}, largest files:\n"
+        + "\n".join(
+            f"  {_format_size(size):>10}  {name}"
+            for name, size in snapshot.largest_files()
+        )
+    )
+
+    workspace = "/".join(
+        (
+            ml_client.subscription_id,
+            ml_client.resource_group_name,
+            ml_client.workspace_name,
+        )
+    )
+    snapshots = _load_cached_snapshots()
+    cached = snapshots.setdefault(workspace, {}).setdefault(str(snapshot.path), {})
+    if code_id := cached.get(snapshot.fingerprint):
+        logger.info(f"Code snapshot unchanged, reusing the code asset {code_id}")
+        return code_id
+
+    try:
+        code_id = ml_client._code.create_or_update(Code(path=str(snapshot.path))).id
+    except (TypeError, AttributeError):
+        logger.warning(
+            "Cannot register the code asset with the installed azure-ai-ml, "
+            "the code directory is uploaded with the jobs",
+            exc_info=True,
+        )
+        return None
+    logger.info(f"Registered the code snapshot as {code_id}")
+
+    cached[snapshot.fingerprint] = code_id
+    for fingerprint in list(cached)[:-MAX_CACHED_SNAPSHOTS]:
+        del cached[fingerprint]
+    _save_cached_snapshots(snapshots)
+    return code_id
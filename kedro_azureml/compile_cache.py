@@ -0,0 +1,125 @@
+import io
+import logging
+from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+from azure.ai.ml import load_job
+from azure.ai.ml.entities import Job
+
+from kedro_azureml.generator import AzureMLPipelineGenerator
+
+logger = logging.getLogger(__name__)
+
+COMPILE_CACHE_DIR = Path.home() / ".kedro-azureml" / "compile-cache"
+MAX_CACHED_PIPELINES = 20
+RUN_ID_PLACEHOLDER = "__KEDRO_AZURE_RUN_ID__"
+STORAGE_ACCOUNT_KEY_PLACEHOLDER = "__AZURE_STORAGE_ACCOUNT_KEY__"
+
+
+class CompiledPipeline:
+    """Azure ML pipeline job generated by ``AzureMLPipelineGenerator`` or loaded from the compile cache"""
+
+    def __init__(
+        self,
+        spec: Optional[str] = None,
+        job: Optional[Job] = None,
+        cache_hit: bool = False,
+    ):
+        assert spec is not None or job is not None
+        self._spec = spec
+        self._job = job
+        self.cache_hit = cache_hit
+
+    @property
+    def spec(self) -> str:
+        """YAML definition of the job"""
+        if self._spec is None:
+            self._spec = str(self._job)
+        return self._spec
+
+    @property
+    def job(self) -> Job:
+        if self._job is None:
+            self._job = load_job(io.StringIO(self._spec))
+        return self._job
+
+
+def _get_cache_path(fingerprint: str) -> Path:
+    return COMPILE_CACHE_DIR / f"{fingerprint}.yaml"
+
+
+def _load_cached_spec(fingerprint: str) -> Optional[str]:
+    try:
+        return _get_cache_path(fingerprint).read_text()
+    except OSError:
+        return None
+
+
+def _save_cached_spec(fingerprint: str, spec: str):
+    try:
+        COMPILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _get_cache_path(fingerprint).write_text(spec)
+        cached = sorted(
+            COMPILE_CACHE_DIR.glob("*.yaml"), key=lambda p: p.stat().st_mtime
+        )
+        for path in cached[:-MAX_CACHED_PIPELINES]:
+            path.unlink(missing_ok=True)
+    except OSError:
+        logger.warning(
+            f"Cannot save the compiled pipeline to {COMPILE_CACHE_DIR}",
+            exc_info=True,
+        )
+
+
+def _is_cacheable(generator: AzureMLPipelineGenerator) -> bool:
+    """
+    Resumed runs depend on the data in the temporary storage and the jobs with nested pipeline components
+    (``namespace_components``) cannot be loaded back from YAML by azure-ai-ml, so they are never cached
+    """
+    namespace_components = generator.config.azure.namespace_components
+    return not generator.resume_run_id and not (
+        namespace_components is not None and namespace_components.enabled
+    )
+
+
+def compile_pipeline(
+    generator: AzureMLPipelineGenerator,
+    use_cache: bool = True,
+    eager_load: bool = False,
+) -> CompiledPipeline:
+    """
+    Generates the Azure ML pipeline job, or loads it from the compile cache if the generator's fingerprint
+    did not change. Cached jobs get a new Kedro Azure run ID and the storage account key is never cached.
+    With ``eager_load``, the cached job is loaded right away and it is generated again if it cannot be loaded.
+    """
+    if not use_cache or not _is_cacheable(generator):
+        return CompiledPipeline(job=generator.generate())
+
+    fingerprint = generator.get_fingerprint()
+    storage_account_key = generator.storage_account_key
+    if (cached_spec := _load_cached_spec(fingerprint)) is not None:
+        spec = cached_spec.replace(RUN_ID_PLACEHOLDER, uuid4().hex)
+        if storage_account_key:
+            spec = spec.replace(STORAGE_ACCOUNT_KEY_PLACEHOLDER, storage_account_key)
+        compiled = CompiledPipeline(spec, cache_hit=True)
+        try:
+            if eager_load:
+                compiled.job
+            return compiled
+        except Exception:
+            logger.warning(
+                f"Cannot load the cached pipeline {_get_cache_path(fingerprint)}, generating it again",
+                exc_info=True,
+            )
+
+    compiled = CompiledPipeline(job=generator.generate())
+    cached_spec = compiled.spec.replace(
+        generator.kedro_azure_run_id, RUN_ID_PLACEHOLDER
+    )
+    if storage_account_key:
+        cached_spec = cached_spec.replace(
+            storage_account_key, STORAGE_ACCOUNT_KEY_PLACEHOLDER
+        )
+    _save_cached_spec(fingerprint, cached_spec)
+    return compiled
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from azure.ai.ml import MLClient
+from azure.ai.ml.entities import (
+    CommandComponent,
+    Component,
+    Job,
+    PipelineComponent,
+)
+from azure.ai.ml.entities._builders import BaseNode
+from azure.core.exceptions import ResourceNotFoundError
+
+from kedro_azureml.code_snapshot import resolve_code_asset
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS_REGISTRY_PATH = Path.home() / ".kedro-azureml" / "components.json"
+COMPONENT_NAME_PREFIX = "kedro_"
+AZUREML_PREFIX = "azureml:"
+
+
+def iter_steps(job: Job) -> Iterator[BaseNode]:
+    """Steps of the pipeline job, including the steps of the nested pipeline components"""
+    for step in job.jobs.values():
+        if isinstance(component := getattr(step, "component", None), PipelineComponent):
+            yield from iter_steps(component)
+        else:
+            yield step
+
+
+def get_component_version(component: CommandComponent) -> str:
+    """Hash of the command template, the environment, the code and the inputs and outputs of the component"""
+    spec = component._to_dict()
+    spec.pop("version", None)
+    return hashlib.sha256(
+        json.dumps(spec, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+
+
+def _load_registry() -> dict:
+    try:
+        return json.loads(COMPONENTS_REGISTRY_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_registry(registry: dict):
+    try:
+        COMPONENTS_REGISTRY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        COMPONENTS_REGISTRY_PATH.write_text(json.dumps(registry, indent=2))
+    except OSError:
+        logger.warning(
+            f"Cannot save the components registry cache to {COMPONENTS_REGISTRY_PATH}",
+            exc_info=True,
+        )
+
+
+def get_component_key(component: CommandComponent) -> str:
+    """``<name>:<version>`` of the registered component"""
+    return f"{COMPONENT_NAME_PREFIX}{component.name}:{get_component_version(component)}"
+
+
+class ComponentRegistry:
+    """
+    Registers the commands of the steps as Azure ML components, versioned by their hash, so that the steps
+    are built from the registered components instead of embedding them. The environment and the code
+    of the steps are resolved to concrete versions before hashing, so a new version of the environment
+    (e.g. published under the ``latest`` label) or a change of the code makes a new version of the component.
+    The components registered before (according to the local registry cache) are not registered again.
+    """
+
+    def __init__(self, ml_client: MLClient, max_workers: int = 4):
+        self.ml_client = ml_client
+        self.max_workers = max_workers
+        self._environments: Dict[str, str] = {}
+        self._code: Dict[str, Optional[str]] = {}
+        self._components: Dict[str, Component] = {}
+
+    def resolve_environment(self, environment: str) -> str:
+        """Resolves the environment with a label (``name@latest``) or without a version to ``azureml:name:version``"""
+        if environment not in self._environments:
+            name = (
+                environment[len(AZUREML_PREFIX) :]
+                if environment.startswith(AZUREML_PREFIX)
+                else environment
+            )
+            if name.startswith("/") or ":" in name:
+                resolved = environment  # ARM ID or a concrete version
+            else:
+                name, _, label = name.partition("@")
+                env = self.ml_client.environments.get(name, label=label or "latest")
+                resolved = f"{AZUREML_PREFIX}{env.name}:{env.version}"
+                logger.info(f"Resolved environment {environment} to {resolved}")
+            self._environments[environment] = resolved
+        return self._environments[environment]
+
+    def resolve_code(self, code_directory: str) -> Optional[str]:
+        """ID of the code asset with the contents of the code directory, None if it cannot be registered"""
+        if code_directory not in self._code:
+            self._code[code_directory] = resolve_code_asset(
+                self.ml_client, code_directory
+            )
+        return self._code[code_directory]
+
+    def register(self, components: Iterable[CommandComponent]) -> Dict[str, str]:
+        """
+        Registers the components which are not registered yet.
+        :return: IDs of the components, keyed by ``<name>:<version>``
+        """
+        keys = {}
+        for component in components:
+            keys.setdefault(get_component_key(component), component)
+        new_components = {
+            key: component
+            for key, component in keys.items()
+            if key not in self._components
+        }
+        if new_components:
+            workspace = "/".join(
+                (
+                    self.ml_client.subscription_id,
+                    self.ml_client.resource_group_name,
+                    self.ml_client.workspace_name,
+                )
+            )
+            registry = _load_registry()
+            registered = registry.setdefault(workspace, {})
+            reused = sum(key in registered for key in new_components)
+
+            def register(key: str) -> Component:
+                name, version = key.split(":")
+                if key in registered:
+                    try:
+                        return self.ml_client.components.get(name, version=version)
+                    except ResourceNotFoundError:
+                        pass  # removed from the workspace, registered again
+                component = new_components[key]
+                component.name, component.version = name, version
+                return self.ml_client.components.create_or_update(component)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                self._components.update(
+                    zip(new_components, executor.map(register, new_components))
+                )
+            registered.update((key, self._components[key].id) for key in new_components)
+            _save_registry(registry)
+            logger.info(
+                f"Registered {len(new_components) - reused} new components, "
+                f"reused {reused} registered components"
+            )
+        return {key: self._components[key].id for key in keys}
+
+    def get(self, component: CommandComponent) -> Component:
+        """Registered version of the component"""
+        return self._components[get_component_key(component)]
@@ -1,5 +1,6 @@
 from collections import defaultdict
-from typing import Dict, Optional, Type
+from functools import partial
+from typing import Dict, List, Literal, Optional, Type
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -8,6 +9,10 @@ from typing_extensions import Annotated
 from kedro_azureml.utils import update_dict
 
 
+def _constant(value):
+    return value
+
+
 class DefaultConfigDict(defaultdict):
     def __getitem__(self, key):
         defaults: BaseModel = super().__getitem__("__default__")
@@ -36,13 +41,54 @@ class PipelineDataPassingConfig(BaseModel):
     enabled: bool = False
 
 
+class NodeFusionConfig(BaseModel):
+    # Run chains of Kedro nodes (and nodes tagged with the same `group.<name>` tag) in a single Azure ML step
+    enabled: bool = False
+    linear_chains: bool = True
+
+
+class NamespaceComponentsConfig(BaseModel):
+    # Compile every Kedro namespace into an Azure ML pipeline component, namespaces with the same structure share it
+    enabled: bool = False
+
+
+class RegisteredComponentsConfig(BaseModel):
+    # Register the commands of the steps as Azure ML components, versioned by the hash of their definition
+    enabled: bool = False
+
+
+class StepReuseConfig(BaseModel):
+    # Mark the steps as deterministic and fingerprint them with the code of their nodes, the parameters they consume
+    # and the fingerprints of the upstream steps, so Azure ML reuses the results of the unchanged steps
+    enabled: bool = False
+    # Catalog datasets (other than AzureMLAssetDatasets) read by the steps can change between the runs,
+    # so the steps reading them are not reused unless the datasets are listed here as not changing
+    static_inputs: List[str] = []
+
+
+class LocalRunConfig(BaseModel):
+    # Settings used by AzureMLAssetDatasets when the pipeline runs locally
+    prefetch: bool = False
+    prefetch_workers: int = 4
+    download_engine: Literal["sdk", "parallel"] = "sdk"
+    download_workers: int = 8
+    download_retries: int = 3
+    incremental_sync: bool = False
+
+
+class AuthConfig(BaseModel):
+    persistent_token_cache: bool = False
+    allow_unencrypted_token_cache: bool = False
+
+
 class AzureMLConfig(BaseModel):
     @staticmethod
     def _create_default_dict_with(
         value: dict, default, dict_cls: Type = DefaultConfigDict
     ):
         default_value = (value := value or {}).get("__default__", default)
-        return dict_cls(lambda: default_value, value)
+        # not a lambda, so the config can be pickled (e.g. by ParallelRunner)
+        return dict_cls(partial(_constant, default_value), value)
 
     @field_validator("compute")
     @classmethod
@@ -63,6 +109,12 @@ class AzureMLConfig(BaseModel):
     code_directory: Optional[str] = None
     working_directory: Optional[str] = None
     pipeline_data_passing: Optional[PipelineDataPassingConfig] = None
+    node_fusion: Optional[NodeFusionConfig] = None
+    namespace_components: Optional[NamespaceComponentsConfig] = None
+    registered_components: Optional[RegisteredComponentsConfig] = None
+    step_reuse: Optional[StepReuseConfig] = None
+    local_run: Optional[LocalRunConfig] = None
+    auth: Optional[AuthConfig] = None
 
 
 class KedroAzureMLConfig(BaseModel):
@@ -75,6 +127,8 @@ class KedroAzureRunnerConfig(BaseModel):
     temporary_storage: AzureTempStorageConfig
     run_id: str
     storage_account_key: str
+    # run IDs under which the inputs produced by the sliced-off nodes were saved
+    input_run_ids: Dict[str, str] = {}
 
 
 CONFIG_TEMPLATE_YAML = """
@@ -1,6 +1,14 @@
 KEDRO_AZURE_BLOB_TEMP_DIR_NAME = "kedro-azureml-temp"
 KEDRO_AZURE_RUNNER_CONFIG = "KEDRO_AZURE_RUNNER_CONFIG"
+KEDRO_AZURE_RUN_ID = "KEDRO_AZURE_RUN_ID"
+KEDRO_AZURE_RUN_ID_TAG = "kedro_azure_run_id"
+KEDRO_AZURE_LOAD_VERSIONS = "KEDRO_AZURE_LOAD_VERSIONS"
+KEDRO_AZURE_STEP_FINGERPRINT = "KEDRO_AZURE_STEP_FINGERPRINT"
 KEDRO_AZURE_RUNNER_DATASET_TIMEOUT = "KEDRO_AZURE_RUNNER_DATASET_TIMEOUT"
 AZURE_SUBSCRIPTION_ID = "AZURE_SUBSCRIPTION_ID"
 DISTRIBUTED_CONFIG_FIELD = "__kedroazureml_distributed_config__"
+PARALLEL_CONFIG_FIELD = "__kedroazureml_parallel_config__"
+KEDRO_AZURE_PARALLEL_SHARD = "KEDRO_AZURE_PARALLEL_SHARD"
 PARAMS_PREFIX = "params:"
+PARAM_INPUT_TYPES = ("boolean", "integer", "number", "string", "json")
+AZURE_ML_INPUT_ENV_PREFIX = "AZURE_ML_INPUT_"
@@ -1,5 +1,6 @@
 from kedro_azureml.datasets.asset_dataset import AzureMLAssetDataset
 from kedro_azureml.datasets.file_dataset import AzureMLFileDataset
+from kedro_azureml.datasets.mltable_dataset import MLTableDataset
 from kedro_azureml.datasets.pandas_dataset import AzureMLPandasDataset
 from kedro_azureml.datasets.pipeline_dataset import AzureMLPipelineDataset
 from kedro_azureml.datasets.runner_dataset import (
@@ -14,4 +15,5 @@ __all__ = [
     "AzureMLPandasDataset",
     "KedroAzureRunnerDataset",
     "KedroAzureRunnerDistributedDataset",
+    "MLTableDataset",
 ]
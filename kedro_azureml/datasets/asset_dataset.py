@@ -1,10 +1,33 @@
+import hashlib
+import json
 import logging
+import os
+import posixpath
+import shutil
+import tempfile
+import threading
+import weakref
+from concurrent.futures import Executor, Future
+from datetime import datetime, timezone
 from functools import partial
 from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional, Type, Union, get_args
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+)
+from uuid import uuid4
 
 import azure.ai.ml._artifacts._artifact_utilities as artifact_utils
+import backoff
+from azure.ai.ml.entities import Data
 from azure.core.exceptions import ResourceNotFoundError
 from cachetools import Cache, cachedmethod
 from cachetools.keys import hashkey
@@ -20,17 +43,55 @@ from kedro.io.core import (
 )
 
 from kedro_azureml.client import _get_azureml_client
-from kedro_azureml.config import AzureMLConfig
+from kedro_azureml.config import AzureMLConfig, LocalRunConfig
+from kedro_azureml.constants import KEDRO_AZURE_RUN_ID
+from kedro_azureml.datasets.asset_downloader import (
+    AzureMLAssetDownloader,
+    Manifest,
+    UnsupportedDatastoreError,
+    get_abfs_location,
+    interprocess_lock,
+    load_manifest,
+    save_manifest,
+)
 from kedro_azureml.datasets.pipeline_dataset import AzureMLPipelineDataset
 
-AzureMLDataAssetType = Literal["uri_file", "uri_folder"]
+AzureMLDataAssetType = Literal["uri_file", "uri_folder", "mltable"]
+AzureMLSaveMode = Literal["overwrite", "append"]
+MANIFESTS_DIR = ".kedro-azureml"
+PARTITIONS_TAG = "kedro_azureml_partitions"
+FINGERPRINT_TAG = "kedro_azureml_fingerprint"
+REUSED_VERSION_MARKER = ".kedro-azureml-reused-version"
+# default of how long to wait for the files saved to the mounted output to show up in the datastore
+UPLOAD_TIMEOUT = 600
+# how many times a partition is re-registered after concurrent appends registered versions without it
+APPEND_RETRIES = 5
+LOCAL_VERSION = Version("local", "local")
 logger = logging.getLogger(__name__)
 
 
+def _version_sort_key(version: str):
+    return (version.isdigit(), int(version) if version.isdigit() else 0, version)
+
+
+def compute_fingerprint(folder: Path) -> str:
+    """Computes a fingerprint of the names and contents of all the files in the folder"""
+    fingerprint = hashlib.sha256()
+    for path in sorted(p for p in folder.rglob("*") if p.is_file()):
+        file_hash = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(chunk)
+        fingerprint.update(
+            f"{path.relative_to(folder).as_posix()}\t{file_hash.hexdigest()}\n".encode()
+        )
+    return fingerprint.hexdigest()
+
+
 class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
     """
     AzureMLAssetDataset enables kedro-azureml to use azureml
-    v2-sdk Folder/File datasets for remote and local runs.
+    v2-sdk Folder/File/MLTable datasets for remote and local runs.
 
     Args
     ----
@@ -41,9 +102,24 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
      | - ``root_dir``: The local folder where the dataset should be saved during local runs.
         ``Relevant for local execution via `kedro run`.
      | - ``filepath_arg``: Filepath arg on the wrapped dataset, defaults to `filepath`
-     | - ``azureml_type``: Either `uri_folder` or `uri_file`
+     | - ``azureml_type``: One of `uri_folder`, `uri_file` or `mltable`
+        (use ``kedro_azureml.datasets.MLTableDataset`` as the underlying dataset for `mltable`)
      | - ``azureml_version``: Specific version of the AzureML dataset to use. If not provided, uses latest version.
      | - ``version``: Version of the AzureML dataset to be used in kedro format (deprecated, use azureml_version).
+     | - ``download``: Whether to download the dataset for local runs. If `false`, the underlying dataset reads
+        the data directly from the datastore (`abfs://`), defaults to `true`.
+     | - ``include``: Glob patterns of the files (relative to the `uri_folder` asset) to download for local runs.
+     | - ``exclude``: Glob patterns of the files (relative to the `uri_folder` asset) to skip for local runs.
+     | - ``save_mode``: `overwrite` (default) saves the whole dataset as a new asset version, `append` saves
+        only a new partition (a `<partition>/<filepath>` folder) and registers a new version containing
+        the partitions of the previous version and the new one.
+     | - ``skip_unchanged``: Compare the fingerprint of the saved data with the one of the latest version
+        of the asset in Azure ML pipelines and re-use that version instead of uploading the same data again.
+     | - ``output_args``: Options of the `append` mode and `skip_unchanged`: `datastore` and `path` of the
+        folder to save the data to (defaults to `workspaceblobstore` and `kedro-azureml/<azureml_dataset>`)
+        and `partition` - name of the new partition, `{timestamp}` is replaced with the current UTC time,
+        `upload_timeout` - seconds to wait for the saved files to be uploaded before registering
+        the version (defaults to 600).
 
     Example
     -------
@@ -70,6 +146,25 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
                 type: pandas.ParquetDataset
                 filepath: "companies.csv"
 
+        my_streamed_dataset:
+            type: kedro_azureml.datasets.AzureMLAssetDataset
+            azureml_dataset: my_large_azureml_dataset
+            download: false
+            dataset:
+                type: pandas.ParquetDataset
+                filepath: "."
+                load_args:
+                    columns: [id, value]
+
+        my_partial_dataset:
+            type: kedro_azureml.datasets.AzureMLAssetDataset
+            azureml_dataset: my_partitioned_azureml_dataset
+            include: ["date=2024-01-0*/*.parquet"]
+            exclude: ["*/_SUCCESS"]
+            dataset:
+                type: pandas.ParquetDataset
+                filepath: "."
+
         my_versioned_dataset:
             type: kedro_azureml.datasets.AzureMLAssetDataset
             azureml_dataset: my_azureml_dataset
@@ -79,6 +174,16 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
                 type: pandas.ParquetDataset
                 filepath: "."
 
+        my_event_log:
+            type: kedro_azureml.datasets.AzureMLAssetDataset
+            azureml_dataset: my_event_log
+            save_mode: append
+            output_args:
+                partition: "date=${runtime_params:date}"
+            dataset:
+                type: pandas.ParquetDataset
+                filepath: "events.parquet"
+
     """
 
     versioned = True
@@ -92,6 +197,12 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
         azureml_type: AzureMLDataAssetType = "uri_folder",
         version: Optional[Version] = None,
         azureml_version: Optional[str] = None,
+        download: bool = True,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        save_mode: AzureMLSaveMode = "overwrite",
+        skip_unchanged: bool = False,
+        output_args: Optional[Dict[str, Any]] = None,
         metadata: Dict[str, Any] = None,
     ):
         """
@@ -100,8 +211,16 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
         root_dir: The local folder where the dataset should be saved during local runs.
                 Relevant only for local execution via `kedro run`.
         filepath_arg: Filepath arg on the wrapped dataset, defaults to `filepath`
-        azureml_type: Either `uri_folder` or `uri_file`
+        azureml_type: One of `uri_folder`, `uri_file` or `mltable`
         azureml_version: Specific version of the AzureML dataset to use. If not provided, uses latest version.
+        download: Whether to download the dataset for local runs. If False, the underlying dataset
+            reads the data directly from the datastore.
+        include: Glob patterns of the files of `uri_folder` asset to download for local runs.
+        exclude: Glob patterns of the files of `uri_folder` asset to skip for local runs.
+        save_mode: `overwrite` or `append` - save only a new partition of `uri_folder` asset.
+        skip_unchanged: Re-use the latest version of the asset if the saved data did not change.
+        output_args: `datastore`, `path` and `partition` name template of the saved data
+            and `upload_timeout` in seconds.
         metadata: Any arbitrary metadata.
             This is ignored by Kedro, but may be consumed by users or external plugins.
         """
@@ -118,8 +237,22 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
         # 1 entry for load version, 1 for save version
         self._version_cache = Cache(maxsize=2)  # type: Cache
         self._download = True
+        self._download_asset = download
         self._local_run = True
         self._azureml_config = None
+        self._prefetched: Optional[Future] = None
+        # guards the mutable state of the dataset, which may be used by many threads (e.g. ThreadRunner)
+        self._lock = threading.RLock()
+        self._download_lock = threading.Lock()
+        self._downloaded = False
+        # shared by all the copies of the dataset made by pickling
+        self._download_session = uuid4().hex
+        # folder of the download locks and markers of the session, set per run by the hook,
+        # otherwise a folder of the session removed with the dataset which created it
+        self._download_session_dir: Optional[Path] = None
+        weakref.finalize(
+            self, shutil.rmtree, self._default_download_session_dir, ignore_errors=True
+        )
         self._azureml_type = azureml_type
         if self._azureml_type not in get_args(AzureMLDataAssetType):
             raise DatasetError(
@@ -127,6 +260,57 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
                 f"Valid values are: {get_args(AzureMLDataAssetType)}"
             )
 
+        self._include = [include] if isinstance(include, str) else include
+        self._exclude = [exclude] if isinstance(exclude, str) else exclude
+        if self._include or self._exclude:
+            if self._azureml_type != "uri_folder":
+                raise DatasetError(
+                    "'include' and 'exclude' can only be used with azureml_type 'uri_folder'"
+                )
+            if not download:
+                raise DatasetError(
+                    "'include' and 'exclude' cannot be used together with 'download: false'"
+                )
+
+        self._save_mode = save_mode
+        if self._save_mode not in get_args(AzureMLSaveMode):
+            raise DatasetError(
+                f"Invalid save_mode '{self._save_mode}' in dataset definition. "
+                f"Valid values are: {get_args(AzureMLSaveMode)}"
+            )
+        if self._save_mode == "append" and self._azureml_type != "uri_folder":
+            raise DatasetError(
+                "save_mode 'append' can only be used with azureml_type 'uri_folder'"
+            )
+        self._output_args = {
+            "datastore": "workspaceblobstore",
+            "path": f"kedro-azureml/{azureml_dataset}",
+            "partition": "{timestamp}",
+            "upload_timeout": UPLOAD_TIMEOUT,
+            **(output_args or {}),
+        }
+        try:
+            self._output_args["upload_timeout"] = float(
+                self._output_args["upload_timeout"]
+            )
+        except (TypeError, ValueError):
+            raise DatasetError(
+                f"output_args 'upload_timeout' has to be a number of seconds, "
+                f"got {self._output_args['upload_timeout']!r}"
+            )
+        self._partitions: Optional[List[str]] = None
+        # temporary folder linking the partitions of the loaded version, removed with the dataset
+        self._partitions_view: Optional[Path] = None
+
+        self._skip_unchanged = skip_unchanged
+        if self._skip_unchanged and (
+            self._azureml_type != "uri_folder" or self._save_mode == "append"
+        ):
+            raise DatasetError(
+                "skip_unchanged can only be used with azureml_type 'uri_folder' "
+                "and save_mode 'overwrite'"
+            )
+
         # TODO: remove and disable versioning in Azure ML runner?
         if VERSION_KEY in self._dataset_config:
             raise DatasetError(
@@ -135,6 +319,22 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
                 f"the dataset definition."
             )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # locks and the prefetch future can't be pickled (e.g. by ParallelRunner),
+        # they are re-created in the process un-pickling the dataset
+        state = self.__dict__.copy()
+        for attr in ("_lock", "_download_lock", "_prefetched"):
+            state.pop(attr, None)
+        # the partitions view is removed by the process which created it
+        state["_partitions_view"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._download_lock = threading.Lock()
+        self._prefetched = None
+
     @property
     def azure_config(self) -> AzureMLConfig:
         """AzureML config to be used by the dataset."""
@@ -144,35 +344,116 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
     def azure_config(self, azure_config: AzureMLConfig) -> None:
         self._azureml_config = azure_config
 
+    @property
+    def _local_run_config(self) -> LocalRunConfig:
+        return getattr(self._azureml_config, "local_run", None) or LocalRunConfig()
+
     @property
     def path(self) -> str:
         # For local runs we want to replicate the folder structure of the remote dataset.
         # Otherwise kedros versioning would version at the file/folder level and not the
         # AzureML dataset level
         if self._local_run:
-            return (
-                Path(self.root_dir)
-                / self._azureml_dataset
-                / self._resolve_azureml_version()
-                / Path(self._dataset_config[self._filepath_arg])
-            )
+            return self._local_path(self._resolve_azureml_version())
         else:
-            return Path(self.root_dir) / Path(self._dataset_config[self._filepath_arg])
+            return Path(self.root_dir) / self._asset_relative_path
+
+    @property
+    def _asset_relative_path(self) -> Path:
+        # in append mode `filepath` is relative to each partition folder,
+        # so the dataset reads all the partitions of the asset
+        if self._save_mode == "append":
+            return Path(".")
+        return Path(self._dataset_config[self._filepath_arg])
+
+    @property
+    def append_uri(self) -> str:
+        """Datastore folder shared by all the partitions saved in the `append` mode"""
+        return self._output_uri()
+
+    @property
+    def registers_own_versions(self) -> bool:
+        """Whether the dataset registers new asset versions by itself in Azure ML pipelines,
+        instead of Azure ML registering the output of the step"""
+        return self._save_mode == "append" or self._skip_unchanged
+
+    def get_output_uri(self, run_id: str) -> str:
+        """Datastore folder the dataset saves to in the given pipeline run"""
+        if self._save_mode == "append":
+            return self.append_uri
+        return self._output_uri(run_id)
+
+    def _output_uri(self, *parts: str) -> str:
+        path = "/".join([self._output_args["path"].strip("/"), *parts])
+        return f"azureml://datastores/{self._output_args['datastore']}/paths/{path}/"
 
     @property
     def download_path(self) -> str:
+        return self._download_path(self.path)
+
+    def _local_dir_name(self, version: str) -> str:
+        # partial downloads are kept apart from the complete ones (and from each other),
+        # so the underlying dataset never reads files from outside of the selected subset
+        if not (self._include or self._exclude):
+            return version
+        subset = json.dumps([self._include, self._exclude], sort_keys=True)
+        return f"{version}-subset-{hashlib.md5(subset.encode()).hexdigest()[:8]}"
+
+    def _local_path(self, version: str) -> Path:
+        return (
+            Path(self.root_dir)
+            / self._azureml_dataset
+            / self._local_dir_name(version)
+            / self._asset_relative_path
+        )
+
+    @staticmethod
+    def _download_path(path: Path) -> str:
         # Because `is_dir` and `is_file` don't work if the path does not
         # exist, we use this heuristic to identify paths vs folders.
-        if self.path.suffix != "":
-            return str(self.path.parent)
+        if path.suffix != "":
+            return str(path.parent)
         else:
-            return str(self.path)
+            return str(path)
+
+    def _manifests_dir(self) -> Path:
+        return Path(self.root_dir) / self._azureml_dataset / MANIFESTS_DIR
 
-    def _construct_dataset(self) -> AbstractDataset:
+    def _manifest_path(self, version: str) -> Path:
+        return self._manifests_dir() / f"{self._local_dir_name(version)}.json"
+
+    def _find_previous_local_copy(self, version: str) -> Optional[Tuple[str, Manifest]]:
+        """Returns the download path and the manifest of the most recent version
+        of the asset downloaded locally, other than ``version``"""
+        current = self._manifest_path(version)
+        local_copies = []
+        for manifest_path in self._manifests_dir().glob("*.json"):
+            download_path = self._download_path(
+                Path(self.root_dir)
+                / self._azureml_dataset
+                / manifest_path.stem
+                / self._asset_relative_path
+            )
+            if (
+                manifest_path != current
+                and Path(download_path).exists()
+                and (manifest := load_manifest(manifest_path)) is not None
+            ):
+                local_copies.append((download_path, manifest))
+        return max(
+            local_copies,
+            key=lambda c: _version_sort_key(c[1].version),
+            default=None,
+        )
+
+    def _construct_dataset(self, path: Optional[Path] = None) -> AbstractDataset:
         dataset_config = self._dataset_config.copy()
-        dataset_config[self._filepath_arg] = str(self.path)
+        dataset_config[self._filepath_arg] = str(self.path if path is None else path)
         return self._dataset_type(**dataset_config)
 
+    def _partition_path(self, partition: str) -> Path:
+        return Path(self.path) / partition / self._dataset_config[self._filepath_arg]
+
     def _get_latest_version(self) -> str:
         try:
             with _get_azureml_client(
@@ -182,61 +463,446 @@ class AzureMLAssetDataset(AzureMLPipelineDataset, AbstractVersionedDataset):
         except ResourceNotFoundError:
             raise DatasetNotFoundError(f"Did not find Azure ML Data Asset for {self}")
 
-    @cachedmethod(cache=attrgetter("_version_cache"), key=partial(hashkey, "load"))
+    @cachedmethod(
+        cache=attrgetter("_version_cache"),
+        key=partial(hashkey, "load"),
+        lock=attrgetter("_lock"),
+    )
     def _fetch_latest_load_version(self) -> str:
         return self._get_latest_version()
 
     def _resolve_azureml_version(self) -> str:
         """Resolve the Azure ML dataset version to use.
 
-        Returns the explicit azureml_version if provided, otherwise fetches the latest version.
+        Returns the explicit azureml_version if provided, otherwise fetches the latest version
+        (once, so all the loads of the dataset use the same version).
+        Intermediate datasets of local runs are saved as a "local" version.
         """
+        if self._version == LOCAL_VERSION:
+            return LOCAL_VERSION.load
         if self._azureml_version is not None:
             return str(self._azureml_version)
-        return self._get_latest_version()
+        return self._fetch_latest_load_version()
 
-    def _get_azureml_dataset(self):
+    def _get_azureml_dataset(self, version: Optional[str] = None):
         with _get_azureml_client(
             subscription_id=None, config=self._azureml_config
         ) as ml_client:
             return ml_client.data.get(
-                self._azureml_dataset, version=self._resolve_azureml_version()
+                self._azureml_dataset,
+                version=version or self._resolve_azureml_version(),
             )
 
-    def _load(self) -> Any:
-        if self._download:
-            try:
-                azureml_ds = self._get_azureml_dataset()
-            except ResourceNotFoundError:
-                raise VersionNotFoundError(
-                    f"Did not find version {self._resolve_azureml_version()} for {self}"
-                )
+    def _get_azureml_dataset_or_raise(self, version: Optional[str] = None):
+        try:
+            return self._get_azureml_dataset(version)
+        except ResourceNotFoundError:
+            raise VersionNotFoundError(
+                f"Did not find version {version or self._resolve_azureml_version()} for {self}"
+            )
 
-            # Use Azure ML v2 SDK native download functionality
-            # This avoids the ARM64 compatibility issues with azureml-fsspec
+    @property
+    def _needs_download(self) -> bool:
+        return self._download and self._download_asset
+
+    def _construct_streaming_dataset(
+        self, version: Optional[str] = None
+    ) -> AbstractDataset:
+        azureml_ds = self._get_azureml_dataset_or_raise(version)
+        if self._azureml_type == "mltable":
+            # mltable reads azureml:// URIs (and authenticates) by itself
+            path, storage_options = azureml_ds.path, {}
+        else:
             with _get_azureml_client(
                 subscription_id=None, config=self._azureml_config
             ) as ml_client:
-                logger.info(
-                    f"Downloading dataset {self._azureml_dataset} version "
-                    f"{self._resolve_azureml_version()} for local execution"
+                path, storage_options = get_abfs_location(
+                    azureml_ds.path, ml_client.datastores
                 )
-                artifact_utils.download_artifact_from_aml_uri(
-                    uri=azureml_ds.path,
-                    destination=self.download_path,
-                    datastore_operation=ml_client.datastores,
+        if self._azureml_type == "uri_folder":
+            protocol, remote_path = path.split("://", 1)
+            path = f"{protocol}://" + posixpath.normpath(
+                posixpath.join(
+                    remote_path,
+                    self._asset_relative_path.as_posix(),
                 )
+            )
+        logger.info(
+            f"Streaming dataset {self._azureml_dataset} version "
+            f"{azureml_ds.version} from {path}"
+        )
+        dataset_config = self._dataset_config.copy()
+        dataset_config[self._filepath_arg] = path
+        if storage_options:
+            dataset_config["credentials"] = {
+                **(dataset_config.get("credentials") or {}),
+                **storage_options,
+            }
+        return self._dataset_type(**dataset_config)
+
+    @staticmethod
+    def _get_partitions(azureml_ds) -> Optional[List[str]]:
+        """Returns the partitions of an asset version registered in the `append` mode"""
+        partitions = (getattr(azureml_ds, "tags", None) or {}).get(PARTITIONS_TAG)
+        return json.loads(partitions) if isinstance(partitions, str) else None
+
+    def _download_azureml_dataset(self) -> None:
+        azureml_ds = self._get_azureml_dataset_or_raise()
+        self._partitions = partitions = self._get_partitions(azureml_ds)
+
+        # Use Azure ML v2 SDK native download functionality
+        # This avoids the ARM64 compatibility issues with azureml-fsspec
+        with _get_azureml_client(
+            subscription_id=None, config=self._azureml_config
+        ) as ml_client:
+            logger.info(
+                f"Downloading dataset {self._azureml_dataset} version "
+                f"{self._resolve_azureml_version()} for local execution"
+            )
+            local_run_config = self._local_run_config
+            if (
+                local_run_config.download_engine == "parallel"
+                or local_run_config.incremental_sync
+                or self._include
+                or self._exclude
+                or partitions is not None
+            ):
+                try:
+                    self._download_files(
+                        azureml_ds.path, ml_client, local_run_config, partitions
+                    )
+                    return
+                except UnsupportedDatastoreError as e:
+                    if self._include or self._exclude:
+                        raise DatasetError(
+                            f"{e}, 'include' and 'exclude' cannot be used with {self}"
+                        ) from e
+                    if partitions is not None:
+                        raise DatasetError(
+                            f"{e}, partitions of version {azureml_ds.version} "
+                            f"cannot be selected for {self}"
+                        ) from e
+                    logger.warning(
+                        f"{e}, falling back to Azure ML SDK download for {self._azureml_dataset}"
+                    )
+            artifact_utils.download_artifact_from_aml_uri(
+                uri=azureml_ds.path,
+                destination=self.download_path,
+                datastore_operation=ml_client.datastores,
+            )
+
+    def _download_files(
+        self,
+        uri: str,
+        ml_client,
+        local_run_config: LocalRunConfig,
+        partitions: Optional[List[str]] = None,
+    ) -> None:
+        version = self._resolve_azureml_version()
+        downloader = AzureMLAssetDownloader(
+            uri,
+            ml_client.datastores,
+            max_workers=local_run_config.download_workers,
+            max_retries=local_run_config.download_retries,
+            include=self._include,
+            exclude=self._exclude,
+        )
+        files = downloader.list_files()
+        if partitions is not None:
+            # the folder of an appended asset also holds the partitions of its later versions
+            files = [f for f in files if f.relative_path.split("/")[0] in partitions]
+        if local_run_config.incremental_sync and (
+            previous := self._find_previous_local_copy(version)
+        ):
+            previous_download_path, previous_manifest = previous
+            logger.info(
+                f"Syncing {self._azureml_dataset} version {version} incrementally "
+                f"from locally cached version {previous_manifest.version}"
+            )
+            downloader.sync(
+                self.download_path,
+                previous_download_path,
+                previous_manifest.files,
+                files,
+            )
+        else:
+            downloader.download(self.download_path, files)
+        save_manifest(
+            self._manifest_path(version),
+            Manifest(version, files, self._include, self._exclude),
+        )
+
+    def _ensure_downloaded(self) -> None:
+        # concurrent loads (and the prefetch) of the dataset share a single download, also across
+        # the processes using pickled copies of the dataset, e.g. the workers of ParallelRunner
+        with self._download_lock:
+            if self._downloaded:
+                return
+            session_dir = (
+                self._download_session_dir or self._default_download_session_dir
+            )
+            marker = session_dir / f"{self._download_session}.done"
+            with interprocess_lock(session_dir / f"{self._download_session}.lock"):
+                if not marker.is_file():
+                    self._download_azureml_dataset()
+                    marker.touch()
+            self._downloaded = True
+
+    @property
+    def _default_download_session_dir(self) -> Path:
+        return (
+            Path(tempfile.gettempdir())
+            / "kedro-azureml"
+            / "downloads"
+            / self._download_session
+        )
+
+    def use_download_session_dir(self, session_dir: Path) -> None:
+        """Keeps the download locks and markers in the given folder, e.g. the one of the Kedro run"""
+        with self._lock:
+            self._download_session_dir = session_dir
+
+    def prefetch(self, executor: Executor) -> Optional[Future]:
+        """Starts downloading the dataset in the background using the given executor.
+        The next ``load`` waits for this download instead of starting its own.
+        """
+        with self._lock:
+            if self._needs_download and self._prefetched is None:
+                self._prefetched = executor.submit(self._ensure_downloaded)
+            return self._prefetched
+
+    def _load(self) -> Any:
+        if not self._local_run and (
+            reused_version := self._read_reused_version(Path(self.root_dir))
+        ):
+            # the step saving this dataset found the data unchanged and re-used a registered version
+            return self._construct_streaming_dataset(reused_version).load()
+        if not self._local_run and self._save_mode == "append":
+            return self._construct_dataset(self._get_partitions_path()).load()
+        if self._download and not self._download_asset:
+            return self._construct_streaming_dataset().load()
+        if self._needs_download:
+            with self._lock:
+                prefetched, self._prefetched = self._prefetched, None
+            if prefetched is not None and not prefetched.cancelled():
+                prefetched.result()
+            else:
+                self._ensure_downloaded()
         return self._construct_dataset().load()
 
+    def _get_partitions_path(self) -> Path:
+        """Folder with the partitions of the loaded version of the asset saved in the `append` mode.
+        The mounted folder is shared by all the versions of the asset, so it also holds the partitions
+        of the versions appended later - these are left out by linking only the partitions of the version.
+        """
+        folder = Path(self.path)
+        with self._lock:
+            self._partitions = partitions = self._get_partitions(
+                self._get_azureml_dataset_or_raise()
+            )
+        if partitions is None or set(partitions) >= {
+            p.name for p in folder.iterdir() if p.is_dir()
+        }:
+            return folder
+        with self._lock:
+            if self._partitions_view is None:
+                view = Path(tempfile.mkdtemp(prefix="kedro-azureml-partitions-"))
+                for partition in partitions:
+                    (view / partition).symlink_to(
+                        folder / partition, target_is_directory=True
+                    )
+                # the loaded data may read the partitions lazily, so the view lives as long as
+                # the dataset (or until the interpreter exits)
+                weakref.finalize(self, shutil.rmtree, view, ignore_errors=True)
+                self._partitions_view = view
+            return self._partitions_view
+
     def _save(self, data: Any) -> None:
-        self._construct_dataset().save(data)
+        if self._save_mode == "append":
+            self._append(data)
+        elif self._skip_unchanged and not self._local_run:
+            self._save_if_changed(data)
+        else:
+            self._construct_dataset().save(data)
+
+    @staticmethod
+    def _read_reused_version(folder: Path) -> Optional[str]:
+        marker = folder / REUSED_VERSION_MARKER
+        return marker.read_text().strip() if marker.is_file() else None
+
+    def _save_if_changed(self, data: Any) -> None:
+        output_dir = Path(self.root_dir)
+        with tempfile.TemporaryDirectory(prefix="kedro-azureml-") as staging_dir:
+            self._construct_dataset(Path(staging_dir) / self._asset_relative_path).save(
+                data
+            )
+            fingerprint = compute_fingerprint(Path(staging_dir))
+            with _get_azureml_client(
+                subscription_id=None, config=self._azureml_config
+            ) as ml_client:
+                try:
+                    latest = ml_client.data.get(self._azureml_dataset, label="latest")
+                except ResourceNotFoundError:
+                    latest = None
+                if (
+                    latest is not None
+                    and (latest.tags or {}).get(FINGERPRINT_TAG) == fingerprint
+                ):
+                    logger.info(
+                        f"Data of {self._azureml_dataset} did not change, "
+                        f"re-using version {latest.version}"
+                    )
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    (output_dir / REUSED_VERSION_MARKER).write_text(latest.version)
+                    return
+
+                if not (run_id := os.environ.get(KEDRO_AZURE_RUN_ID)):
+                    raise DatasetError(
+                        f"{KEDRO_AZURE_RUN_ID} environment variable is not set, {self} can save "
+                        "with 'skip_unchanged' only in the steps of Azure ML pipelines run by kedro-azureml"
+                    )
+                output_uri = self.get_output_uri(run_id)
+                shutil.copytree(staging_dir, output_dir, dirs_exist_ok=True)
+                # the version is registered only once all the files are uploaded,
+                # so that a failed upload does not leave an incomplete version behind
+                self._wait_for_upload(ml_client, output_uri, Path(staging_dir))
+                registered = ml_client.data.create_or_update(
+                    Data(
+                        name=self._azureml_dataset,
+                        type="uri_folder",
+                        path=output_uri,
+                        tags={FINGERPRINT_TAG: fingerprint},
+                    )
+                )
+                logger.info(
+                    f"Registered version {registered.version} of {self._azureml_dataset}"
+                )
+
+    def _wait_for_upload(self, ml_client, output_uri: str, local_dir: Path) -> None:
+        """Waits until the files of ``local_dir`` are uploaded to ``output_uri``"""
+        expected = {
+            path.relative_to(local_dir).as_posix(): path.stat().st_size
+            for path in local_dir.rglob("*")
+            if path.is_file()
+        }
+        downloader = AzureMLAssetDownloader(output_uri, ml_client.datastores)
+
+        def is_uploaded() -> bool:
+            uploaded = {f.relative_path: f.size for f in downloader.list_files()}
+            return all(uploaded.get(name) == size for name, size in expected.items())
+
+        timeout = self._output_args["upload_timeout"]
+        try:
+            done = backoff.on_predicate(
+                backoff.expo, lambda done: not done, max_time=timeout
+            )(is_uploaded)()
+        except UnsupportedDatastoreError as e:
+            raise DatasetError(
+                f"{e}, {self} cannot register its own versions "
+                "('skip_unchanged' or the 'append' save mode)"
+            ) from e
+        if not done:
+            raise DatasetError(
+                f"Upload of {self._azureml_dataset} to {output_uri} did not complete "
+                f"within {timeout:g} seconds, no version was registered"
+            )
+
+    def _new_partition_name(self) -> str:
+        partition = self._output_args["partition"].format(
+            timestamp=datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        )
+        if not partition or "/" in partition or partition in (".", ".."):
+            raise DatasetError(
+                f"Invalid partition name '{partition}' for {self}, "
+                "it has to be a single folder name"
+            )
+        return partition
+
+    def _append(self, data: Any) -> None:
+        partition = self._new_partition_name()
+        if self._local_run:
+            partitions = sorted(p.name for p in Path(self.path).glob("*") if p.is_dir())
+            self._check_new_partition(partition, partitions)
+            self._construct_dataset(self._partition_path(partition)).save(data)
+            self._partitions = partitions + [partition]
+            return
+
+        with _get_azureml_client(
+            subscription_id=None, config=self._azureml_config
+        ) as ml_client:
+            partitions = self._get_latest_partitions(ml_client)
+            self._check_new_partition(partition, partitions)
+            self._construct_dataset(self._partition_path(partition)).save(data)
+            self._wait_for_upload(
+                ml_client,
+                f"{self.append_uri.rstrip('/')}/{partition}/",
+                Path(self.path) / partition,
+            )
+            # concurrent appends read the same latest version, so the partitions of the version
+            # registered last win - the partition is registered again on top of the versions
+            # registered in the meantime, until the latest version includes it
+            for _ in range(APPEND_RETRIES):
+                self._partitions = [p for p in partitions if p != partition] + [
+                    partition
+                ]
+                # the new version points to the same folder as the previous ones,
+                # so none of the previously saved partitions is uploaded again
+                registered = ml_client.data.create_or_update(
+                    Data(
+                        name=self._azureml_dataset,
+                        type="uri_folder",
+                        path=self.append_uri,
+                        description=f"Partitions: {', '.join(self._partitions)}",
+                        tags={PARTITIONS_TAG: json.dumps(self._partitions)},
+                    )
+                )
+                partitions = self._get_latest_partitions(ml_client)
+                if partition in partitions:
+                    break
+                logger.info(
+                    f"Version {registered.version} of {self._azureml_dataset} was superseded "
+                    f"by a concurrent append, registering partition {partition} again"
+                )
+            else:
+                raise DatasetError(
+                    f"Partition {partition} of {self._azureml_dataset} was superseded by "
+                    f"concurrent appends {APPEND_RETRIES} times, no version includes it"
+                )
+            logger.info(
+                f"Appended partition {partition} to {self._azureml_dataset}, "
+                f"registered version {registered.version}"
+            )
+
+    def _get_latest_partitions(self, ml_client) -> List[str]:
+        try:
+            latest = ml_client.data.get(self._azureml_dataset, label="latest")
+        except ResourceNotFoundError:
+            return []
+        return self._get_partitions(latest) or []
+
+    def _check_new_partition(self, partition: str, partitions: List[str]) -> None:
+        if partition in partitions:
+            raise DatasetError(
+                f"Partition {partition} already exists in {self._azureml_dataset}"
+            )
+
+    def _describe(self) -> Dict[str, Any]:
+        return {
+            **super()._describe(),
+            "azureml_dataset": self._azureml_dataset,
+            "azureml_type": self._azureml_type,
+            "save_mode": self._save_mode,
+            "partitions": self._partitions,
+        }
 
     def as_local_intermediate(self):
-        self._download = False
-        # for local runs we want the data to be saved as a "local version"
-        self._version = Version("local", "local")
+        with self._lock:
+            self._download = False
+            # for local runs we want the data to be saved as a "local version"
+            self._version = LOCAL_VERSION
 
     def as_remote(self):
-        self._version = None
-        self._local_run = False
-        self._download = False
+        with self._lock:
+            self._version = None
+            self._local_run = False
+            self._download = False
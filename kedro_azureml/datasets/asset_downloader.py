@@ -0,0 +1,381 @@
+import fnmatch
+import json
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import backoff
+from azure.ai.ml._artifacts._artifact_utilities import get_datastore_info
+from azure.ai.ml._utils._storage_utils import AzureMLDatastorePathUri
+from azure.storage.blob import BlobServiceClient, ContainerClient
+from kedro.io.core import DatasetError
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_DOWNLOAD_SUFFIX = ".kedro-azureml-part"
+SUPPORTED_DATASTORE_TYPES = ("AzureBlob", "AzureDataLakeGen2")
+
+
+class UnsupportedDatastoreError(Exception):
+    pass
+
+
+def _get_blob_datastore_info(datastore_operations, datastore_name: str) -> dict:
+    datastore_info = get_datastore_info(datastore_operations, datastore_name)
+    if datastore_info["storage_type"] not in SUPPORTED_DATASTORE_TYPES:
+        raise UnsupportedDatastoreError(
+            f"Datastore type {datastore_info['storage_type']} is not supported"
+        )
+    # ADLS Gen2 accounts expose the same data through the blob endpoint
+    datastore_info["account_url"] = datastore_info["account_url"].replace(
+        ".dfs.", ".blob."
+    )
+    return datastore_info
+
+
+def get_abfs_location(uri: str, datastore_operations) -> Tuple[str, Dict[str, Any]]:
+    """Translates ``azureml://`` URI of a data asset into ``abfs://`` path and fsspec storage options,
+    which let the datasets read the data directly from the storage account behind the datastore.
+    """
+    parsed_uri = AzureMLDatastorePathUri(uri)
+    datastore_info = _get_blob_datastore_info(
+        datastore_operations, parsed_uri.datastore
+    )
+    storage_options = {
+        "account_name": datastore_info["storage_account"],
+        "account_host": urlparse(datastore_info["account_url"]).netloc,
+    }
+    if isinstance(credential := datastore_info["credential"], str):
+        # SAS token or account key of the datastore
+        storage_options["credential"] = credential
+    else:
+        # identity-based datastore - adlfs needs async credentials, so let it resolve them by itself
+        storage_options["anon"] = False
+    return (
+        f"abfs://{datastore_info['container_name']}/{parsed_uri.path}",
+        storage_options,
+    )
+
+
+@dataclass(frozen=True)
+class RemoteFile:
+    name: str  # full blob name in the container
+    relative_path: str  # path relative to the download destination
+    size: int
+    etag: str
+    content_md5: Optional[str] = None
+
+
+@dataclass
+class DownloadStats:
+    files_total: int = 0
+    files_downloaded: int = 0
+    files_skipped: int = 0
+    bytes_downloaded: int = 0
+    seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_downloaded / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class Manifest:
+    """Records the files of a completely downloaded asset version
+    and the include/exclude patterns used to select them"""
+
+    version: str
+    files: List[RemoteFile] = field(default_factory=list)
+    include: Optional[List[str]] = None
+    exclude: Optional[List[str]] = None
+
+
+def save_manifest(path: Path, manifest: Manifest) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(asdict(manifest)))
+
+
+def load_manifest(path: Path) -> Optional[Manifest]:
+    try:
+        manifest = Manifest(**json.loads(path.read_text()))
+        manifest.files = [RemoteFile(**f) for f in manifest.files]
+        return manifest
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def filter_files(
+    files: List[RemoteFile],
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+) -> List[RemoteFile]:
+    """Selects the files whose relative paths match any of the ``include``
+    and none of the ``exclude`` glob patterns"""
+    return [
+        f
+        for f in files
+        if (not include or any(fnmatch.fnmatch(f.relative_path, p) for p in include))
+        and not any(fnmatch.fnmatch(f.relative_path, p) for p in (exclude or []))
+    ]
+
+
+def is_same_file(remote_file: RemoteFile, other: RemoteFile) -> bool:
+    if (
+        remote_file.relative_path != other.relative_path
+        or remote_file.size != other.size
+    ):
+        return False
+    if remote_file.content_md5 and other.content_md5:
+        return remote_file.content_md5 == other.content_md5
+    # without MD5 only the very same blob can be considered unchanged
+    return remote_file.name == other.name and remote_file.etag == other.etag
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        # e.g. different file systems or no hard-link support
+        shutil.copy2(source, target)
+
+
+@contextmanager
+def interprocess_lock(path: Path):
+    """Exclusive lock on the given file, shared by all the processes of the machine
+    (e.g. workers of ``ParallelRunner``)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after 10 seconds
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class AzureMLAssetDownloader:
+    """
+    Downloads the files of an Azure ML data asset straight from the storage container behind its datastore.
+    Files are downloaded in parallel, the ones already present locally are skipped (so interrupted downloads
+    can be resumed) and failed files are retried one by one.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        datastore_operations,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        progress_interval: float = 10.0,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ):
+        self.uri = AzureMLDatastorePathUri(uri)
+        self.include = include
+        self.exclude = exclude
+        self.prefix = self.uri.path
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.progress_interval = progress_interval
+        self._datastore_operations = datastore_operations
+        self._container_client: Optional[ContainerClient] = None
+
+    @property
+    def container_client(self) -> ContainerClient:
+        if self._container_client is None:
+            datastore_info = _get_blob_datastore_info(
+                self._datastore_operations, self.uri.datastore
+            )
+            self._container_client = BlobServiceClient(
+                account_url=datastore_info["account_url"],
+                credential=datastore_info["credential"],
+            ).get_container_client(datastore_info["container_name"])
+        return self._container_client
+
+    def _relative_path(self, blob_name: str) -> Optional[str]:
+        remainder = blob_name[len(self.prefix) :]
+        if remainder and not (self.prefix.endswith("/") or remainder.startswith("/")):
+            # blob only shares the name prefix, e.g. `data_v2/x` for `data` prefix
+            return None
+        return remainder.lstrip("/") or Path(self.prefix).name
+
+    def list_files(self) -> List[RemoteFile]:
+        files = []
+        for blob in self.container_client.list_blobs(
+            name_starts_with=self.prefix, include="metadata"
+        ):
+            if (blob.metadata or {}).get("hdi_isfolder") == "true":
+                continue
+            if (relative_path := self._relative_path(blob.name)) is None:
+                continue
+            content_settings = getattr(blob, "content_settings", None)
+            content_md5 = getattr(content_settings, "content_md5", None)
+            files.append(
+                RemoteFile(
+                    name=blob.name,
+                    relative_path=relative_path,
+                    size=blob.size,
+                    etag=blob.etag,
+                    content_md5=bytes(content_md5).hex() if content_md5 else None,
+                )
+            )
+        return filter_files(files, self.include, self.exclude)
+
+    @staticmethod
+    def is_complete(remote_file: RemoteFile, destination: Path) -> bool:
+        target = destination / remote_file.relative_path
+        return target.is_file() and target.stat().st_size == remote_file.size
+
+    @staticmethod
+    def _target_path(remote_file: RemoteFile, destination: Path) -> Optional[Path]:
+        target = (destination / remote_file.relative_path).resolve()
+        try:
+            target.relative_to(destination.resolve())
+        except ValueError:
+            logger.warning(
+                f"Skipping blob {remote_file.name}: path is outside of {destination}"
+            )
+            return None
+        return target
+
+    def _download_file(self, remote_file: RemoteFile, destination: Path) -> int:
+        if (target := self._target_path(remote_file, destination)) is None:
+            return 0
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so an interrupted download is never mistaken for a complete one
+        partial = target.with_name(target.name + PARTIAL_DOWNLOAD_SUFFIX)
+        with partial.open("wb") as f:
+            size = self.container_client.download_blob(
+                remote_file.name, max_concurrency=1
+            ).readinto(f)
+        os.replace(partial, target)
+        return size
+
+    def _download_file_with_retries(
+        self, remote_file: RemoteFile, destination: Path
+    ) -> int:
+        return backoff.on_exception(
+            backoff.expo,
+            Exception,
+            max_tries=self.max_retries,
+            logger=logger,
+        )(self._download_file)(remote_file, destination)
+
+    def download(
+        self, destination: str, files: Optional[List[RemoteFile]] = None
+    ) -> DownloadStats:
+        destination = Path(destination)
+        files = self.list_files() if files is None else files
+        stats = DownloadStats(files_total=len(files))
+        missing = [f for f in files if not self.is_complete(f, destination)]
+        stats.files_skipped = len(files) - len(missing)
+        if stats.files_skipped:
+            logger.info(
+                f"{stats.files_skipped}/{stats.files_total} files of {self.uri.uri} are already downloaded"
+            )
+
+        started = last_report = time.monotonic()
+        failed = []
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="kedro-azureml-download"
+        ) as executor:
+            futures = {
+                executor.submit(self._download_file_with_retries, f, destination): f
+                for f in missing
+            }
+            for future in as_completed(futures):
+                try:
+                    stats.bytes_downloaded += future.result()
+                    stats.files_downloaded += 1
+                except Exception as e:
+                    logger.error(f"Failed to download {futures[future].name}: {e}")
+                    failed.append(futures[future])
+
+                stats.seconds = (now := time.monotonic()) - started
+                if now - last_report >= self.progress_interval:
+                    last_report = now
+                    logger.info(
+                        f"Downloaded {stats.files_downloaded + stats.files_skipped}/{stats.files_total} files "
+                        f"({_format_bytes(stats.bytes_downloaded)}, "
+                        f"{_format_bytes(stats.bytes_per_second)}/s)"
+                    )
+
+        stats.seconds = time.monotonic() - started
+        logger.info(
+            f"Downloaded {stats.files_downloaded} files ({_format_bytes(stats.bytes_downloaded)}) "
+            f"from {self.uri.uri} in {stats.seconds:.1f}s "
+            f"({_format_bytes(stats.bytes_per_second)}/s), skipped {stats.files_skipped}"
+        )
+        if failed:
+            raise DatasetError(
+                f"Failed to download {len(failed)} files from {self.uri.uri}, "
+                f"e.g. {', '.join(f.name for f in failed[:5])}. "
+                "Downloaded files are kept, re-run to resume the download."
+            )
+        return stats
+
+    def sync(
+        self,
+        destination: str,
+        previous_destination: str,
+        previous_files: List[RemoteFile],
+        files: Optional[List[RemoteFile]] = None,
+    ) -> DownloadStats:
+        """Downloads the asset into ``destination``, re-using the unchanged files of a previously
+        downloaded version (hard-linked when possible, copied otherwise) instead of downloading them again.
+        """
+        destination, previous_destination = Path(destination), Path(
+            previous_destination
+        )
+        files = self.list_files() if files is None else files
+        previous = {f.relative_path: f for f in previous_files}
+        reused = 0
+        for remote_file in files:
+            if (
+                (old := previous.get(remote_file.relative_path)) is not None
+                and is_same_file(remote_file, old)
+                and self.is_complete(old, previous_destination)
+                and not self.is_complete(remote_file, destination)
+                and (target := self._target_path(remote_file, destination)) is not None
+            ):
+                link_or_copy(previous_destination / old.relative_path, target)
+                reused += 1
+        logger.info(
+            f"Re-used {reused}/{len(files)} unchanged files from {previous_destination}"
+        )
+        return self.download(str(destination), files)
@@ -0,0 +1,84 @@
+import logging
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict
+
+from kedro.io import AbstractDataset
+from kedro.io.core import DatasetError
+
+logger = logging.getLogger(__name__)
+
+
+class MLTableDataset(AbstractDataset):
+    """
+    Read-only dataset loading Azure ML `MLTable`_ lazily, using the ``mltable`` package.
+    Column selection and row filters from ``load_args`` are applied to the table definition,
+    so only the selected data is read when the table is materialized.
+    Use it as the underlying dataset of ``AzureMLAssetDataset`` with ``azureml_type: mltable``.
+
+    Args
+    ----
+
+     | - ``filepath``: Folder containing the ``MLTable`` file or ``azureml://`` URI of the table.
+     | - ``load_args``: Optional ``columns`` (list of columns to keep), ``filter`` (MLTable filter expression),
+        ``take`` (number of rows) and ``materialize`` (return ``pandas.DataFrame`` instead of lazy ``MLTable``).
+
+    Example
+    -------
+
+    Example of a catalog.yml entry:
+
+    .. code-block:: yaml
+
+        my_table:
+          type: kedro_azureml.datasets.AzureMLAssetDataset
+          azureml_dataset: my_azureml_table
+          azureml_type: mltable
+          dataset:
+            type: kedro_azureml.datasets.MLTableDataset
+            filepath: "."
+            load_args:
+              columns: [id, value]
+              filter: "col('value') > 10"
+
+    .. _`MLTable`: https://learn.microsoft.com/en-us/azure/machine-learning/how-to-mltable
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        load_args: Dict[str, Any] = None,
+        metadata: Dict[str, Any] = None,
+    ):
+        self._filepath = str(filepath)
+        self._load_args = deepcopy(load_args) or {}
+        self.metadata = metadata
+
+    def _load(self) -> Any:
+        try:
+            import mltable
+        except ImportError as e:
+            raise DatasetError(
+                "MLTableDataset requires the `mltable` package, "
+                "install it with `pip install mltable`"
+            ) from e
+
+        table = mltable.load(self._filepath)
+        if columns := self._load_args.get("columns"):
+            table = table.keep_columns(columns)
+        if row_filter := self._load_args.get("filter"):
+            table = table.filter(row_filter)
+        if (take := self._load_args.get("take")) is not None:
+            table = table.take(take)
+        if self._load_args.get("materialize", False):
+            return table.to_pandas_dataframe()
+        return table
+
+    def _save(self, data: Any) -> None:
+        raise DatasetError(f"{self.__class__.__name__} is a read-only dataset")
+
+    def _describe(self) -> Dict[str, Any]:
+        return {"filepath": self._filepath, "load_args": self._load_args}
+
+    def _exists(self) -> bool:
+        return "://" in self._filepath or (Path(self._filepath) / "MLTable").exists()
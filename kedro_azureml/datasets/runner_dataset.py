@@ -1,7 +1,6 @@
 import bz2  # TODO: consider zstandard?
 import logging
 import os
-from functools import lru_cache
 from sys import version_info
 from typing import Any, Dict
 
@@ -35,11 +34,9 @@ class KedroAzureRunnerDataset(AbstractDataset):
         self.storage_account_name = storage_account_name
         self.pickle_protocol = None if version_info[:2] > (3, 8) else 4
 
-    @lru_cache()
     def _get_target_path(self):
         return f"abfs://{self.storage_container}/{KEDRO_AZURE_BLOB_TEMP_DIR_NAME}/{self.run_id}/{self.dataset_name}.bin"
 
-    @lru_cache()
     def _get_storage_options(self):
         return {
             "account_name": self.storage_account_name,
@@ -60,6 +57,12 @@ class KedroAzureRunnerDataset(AbstractDataset):
             with bz2.open(f, "wb") as stream:
                 cloudpickle.dump(data, stream, protocol=self.pickle_protocol)
 
+    def _exists(self) -> bool:
+        fs, path = fsspec.core.url_to_fs(
+            self._get_target_path(), **self._get_storage_options()
+        )
+        return fs.exists(path)
+
     def _describe(self) -> Dict[str, Any]:
         return {
             "info": "for use only within Azure ML Pipelines",
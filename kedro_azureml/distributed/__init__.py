@@ -1,4 +1,9 @@
-from .config import DistributedNodeConfig
-from .decorators import distributed_job
+from .config import DistributedNodeConfig, ParallelNodeConfig
+from .decorators import distributed_job, parallel
 
-_ = (DistributedNodeConfig, distributed_job)  # make flake8 happy
+_ = (
+    DistributedNodeConfig,
+    ParallelNodeConfig,
+    distributed_job,
+    parallel,
+)  # make flake8 happy
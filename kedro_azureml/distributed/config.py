@@ -22,3 +22,15 @@ class DistributedNodeConfig:
 
     def __str__(self):
         return self.__repr__()
+
+
+@dataclass
+class ParallelNodeConfig:
+    instance_count: Union[str, int]
+    mini_batch_size: Optional[Union[str, int]] = None
+
+    def __repr__(self):
+        return json.dumps(asdict(self))
+
+    def __str__(self):
+        return self.__repr__()
@@ -1,8 +1,22 @@
+import inspect
 from functools import wraps
-from typing import Union
+from typing import Optional, Union
 
-from kedro_azureml.constants import DISTRIBUTED_CONFIG_FIELD
-from kedro_azureml.distributed.config import DistributedNodeConfig, Framework
+from kedro_azureml.constants import (
+    DISTRIBUTED_CONFIG_FIELD,
+    PARALLEL_CONFIG_FIELD,
+)
+from kedro_azureml.distributed.config import (
+    DistributedNodeConfig,
+    Framework,
+    ParallelNodeConfig,
+)
+from kedro_azureml.distributed.parallel import (
+    ParallelShard,
+    iter_mini_batches,
+    merge_partitions,
+    select_shard,
+)
 
 
 def distributed_job(framework: Framework, num_nodes: Union[str, int], **kwargs):
@@ -22,3 +36,42 @@ def distributed_job(framework: Framework, num_nodes: Union[str, int], **kwargs):
         return wrapper
 
     return _decorator
+
+
+def parallel(
+    instance_count: Union[str, int],
+    mini_batch_size: Optional[Union[str, int]] = None,
+):
+    """
+    Fans the node out over the partitions of its first input (a dict, e.g. loaded from PartitionedDataset, or a list)
+    in Azure ML: the node runs in ``instance_count`` steps, each processing a contiguous part of the partitions,
+    in mini-batches of ``mini_batch_size`` partitions. The function is called once per mini-batch and has to return
+    the outputs of the partitions it got, as a dict or a list. A merge step combines the outputs of the steps.
+    """
+
+    def _decorator(func):
+        config = ParallelNodeConfig(instance_count, mini_batch_size)
+        setattr(func, PARALLEL_CONFIG_FIELD, config)
+        signature = inspect.signature(func)
+        partitions_argument = next(iter(signature.parameters))
+
+        @wraps(func)
+        def wrapper(*args, **kws):
+            shard = ParallelShard.from_env()
+            if shard is not None:
+                batch_size = shard.mini_batch_size
+            else:  # not resolved outside of Azure ML, if taken from the parameters
+                batch_size = (
+                    mini_batch_size if isinstance(mini_batch_size, int) else None
+                )
+            arguments = signature.bind(*args, **kws)
+            partitions = select_shard(arguments.arguments[partitions_argument], shard)
+            results = []
+            for batch in iter_mini_batches(partitions, batch_size):
+                arguments.arguments[partitions_argument] = batch
+                results.append(func(*arguments.args, **arguments.kwargs))
+            return merge_partitions(results)
+
+        return wrapper
+
+    return _decorator
@@ -0,0 +1,78 @@
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Iterator, List, Optional, Sequence, Union
+
+from kedro_azureml.constants import KEDRO_AZURE_PARALLEL_SHARD
+
+Partitions = Union[dict, list]
+
+
+@dataclass
+class ParallelShard:
+    """Part of the partitions processed by one of the steps of a parallel node"""
+
+    index: int
+    count: int
+    mini_batch_size: Optional[int] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_env(cls) -> Optional["ParallelShard"]:
+        """The shard processed by the current step, None if the node does not run as a shard"""
+        if shard := os.environ.get(KEDRO_AZURE_PARALLEL_SHARD):
+            return cls(**json.loads(shard))
+        return None
+
+
+def get_shard_dataset_name(dataset_name: str, index: int) -> str:
+    """Name under which the shard saves its part of the output of the parallel node"""
+    return f"{dataset_name}__shard_{index}"
+
+
+def _validate(partitions) -> Partitions:
+    if not isinstance(partitions, (dict, list)):
+        raise TypeError(
+            "Parallel nodes process dicts (e.g. loaded from PartitionedDataset) or lists, "
+            f"got {type(partitions).__name__}"
+        )
+    return partitions
+
+
+def select_shard(partitions: Partitions, shard: Optional[ParallelShard]) -> Partitions:
+    """Contiguous part of the partitions processed by the shard, all of them without a shard"""
+    if shard is None:
+        return _validate(partitions)
+    keys = list(_validate(partitions))
+    start = shard.index * len(keys) // shard.count
+    end = (shard.index + 1) * len(keys) // shard.count
+    if isinstance(partitions, dict):
+        return {key: partitions[key] for key in keys[start:end]}
+    return partitions[start:end]
+
+
+def iter_mini_batches(
+    partitions: Partitions, mini_batch_size: Optional[int]
+) -> Iterator[Partitions]:
+    if not mini_batch_size or len(partitions) <= mini_batch_size:
+        yield partitions
+        return
+    keys: List = list(partitions)
+    for start in range(0, len(keys), mini_batch_size):
+        if isinstance(partitions, dict):
+            yield {
+                key: partitions[key] for key in keys[start : start + mini_batch_size]
+            }
+        else:
+            yield partitions[start : start + mini_batch_size]
+
+
+def merge_partitions(results: Sequence[Partitions]) -> Partitions:
+    """Merges the outputs of the mini-batches or of the shards of a parallel node"""
+    if all(isinstance(_validate(result), dict) for result in results):
+        return {key: value for result in results for key, value in result.items()}
+    elif all(isinstance(result, list) for result in results):
+        return [item for result in results for item in result]
+    raise TypeError("Cannot merge the outputs of a parallel node of different types")
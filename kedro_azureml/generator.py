@@ -1,6 +1,27 @@
+import functools
+import hashlib
+import inspect
+import json
 import logging
+import os
 import re
-from typing import Any, Dict, Optional, Type, Union
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib.metadata import version
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import uuid4
 
 from azure.ai.ml import (
@@ -12,12 +33,14 @@ from azure.ai.ml import (
     command,
 )
 from azure.ai.ml.dsl import pipeline as azure_pipeline
-from azure.ai.ml.entities import Environment, Job
-from azure.ai.ml.entities._builders import Command
+from azure.ai.ml.entities import Environment, Job, PipelineComponent
 from kedro.io import DataCatalog
+from kedro.io.core import DatasetError
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
 
+from kedro_azureml import __version__
+from kedro_azureml.components import ComponentRegistry
 from kedro_azureml.config import (
     ComputeConfig,
     KedroAzureMLConfig,
@@ -25,20 +48,97 @@ from kedro_azureml.config import (
 )
 from kedro_azureml.constants import (
     DISTRIBUTED_CONFIG_FIELD,
+    KEDRO_AZURE_LOAD_VERSIONS,
+    KEDRO_AZURE_PARALLEL_SHARD,
+    KEDRO_AZURE_RUN_ID,
+    KEDRO_AZURE_RUN_ID_TAG,
     KEDRO_AZURE_RUNNER_CONFIG,
+    KEDRO_AZURE_STEP_FINGERPRINT,
+    PARALLEL_CONFIG_FIELD,
     PARAMS_PREFIX,
 )
-from kedro_azureml.datasets import AzureMLAssetDataset
+from kedro_azureml.datasets import (
+    AzureMLAssetDataset,
+    AzureMLPipelineDataset,
+    KedroAzureRunnerDataset,
+)
 from kedro_azureml.distributed import DistributedNodeConfig
-from kedro_azureml.distributed.config import Framework
+from kedro_azureml.distributed.config import Framework, ParallelNodeConfig
+from kedro_azureml.distributed.parallel import (
+    ParallelShard,
+    get_shard_dataset_name,
+)
 
 logger = logging.getLogger(__name__)
 
+INPUT_ONLY_ASSET_TYPES = ("uri_file", "mltable")
+GROUP_TAG_PREFIX = "group."
+NON_DETERMINISTIC_TAG = "non-deterministic"
+NAMESPACE_INPUT = "kedro_namespace"
+RESUME_CHECK_WORKERS = 16
+# fsspec protocols of the catalog datasets which are not saved by the runs in Azure ML
+LOCAL_PROTOCOLS = ("file", "local", "memory")
+
 
 class ConfigException(BaseException):
     pass
 
 
+class _PipelineIndex:
+    """Lookups of a Kedro pipeline used during the generation, computed once per pipeline"""
+
+    def __init__(self, pipeline: Pipeline):
+        self.pipeline = pipeline
+        self.nodes: List[Node] = pipeline.nodes  # sorted topologically
+        self.inputs: Set[str] = pipeline.inputs()
+        self.outputs: Set[str] = pipeline.outputs()
+        self.producers: Dict[str, Node] = {
+            output: node for node in self.nodes for output in node.outputs
+        }
+        self.consumers: Dict[str, List[Node]] = defaultdict(list)
+        for node in self.nodes:
+            for node_input in node.inputs:
+                self.consumers[node_input].append(node)
+        # Azure ML steps (name -> nodes), sorted topologically, see AzureMLPipelineGenerator._get_steps
+        self.steps: Optional[Dict[str, List[Node]]] = None
+        self.node_steps: Dict[str, str] = {}
+        self.step_dependencies: Dict[str, Set[str]] = {}
+        self.step_namespaces: Dict[str, Optional[str]] = {}
+
+
+# Where the value of an input (or output) of a unit comes from:
+# ("output", <unit position>, <output name>), ("input", <pipeline input name>),
+# ("dataset", <dataset not produced by the pipeline>) or ("value", <literal value>)
+_Source = Tuple[Any, ...]
+
+
+@dataclass
+class _Unit:
+    """Step, or a nested namespace compiled into a pipeline component, invoked in an Azure ML pipeline"""
+
+    name: str
+    inputs: Dict[str, _Source]
+    command_kwargs: Optional[
+        Dict[str, Any]
+    ] = None  # steps only, merge step of parallel nodes
+    component: Optional["_ComponentPlan"] = None  # nested namespaces only
+    shards: Optional[List[Dict[str, Any]]] = None  # steps of parallel nodes only
+
+
+@dataclass
+class _ComponentPlan:
+    """Azure ML pipeline (component) of a Kedro namespace, the root pipeline has no namespace"""
+
+    namespace: Optional[str]
+    name: str
+    inputs: Dict[str, Input]
+    outputs: Dict[str, _Source]
+    units: List[_Unit]
+    datasets: Dict[str, str]  # input -> dataset name
+    namespaces: Dict[str, str]  # input -> name of the namespace passed to the commands
+    key: str = ""  # fingerprint of the structure, namespaces with the same key share the component
+
+
 class AzureMLPipelineGenerator:
     def __init__(
         self,
@@ -53,6 +153,10 @@ class AzureMLPipelineGenerator:
         storage_account_key: Optional[str] = "",
         extra_env: Dict[str, str] = {},
         load_versions: Dict[str, str] = {},
+        pipeline_filters: Dict[str, Any] = {},
+        previous_run_id: Optional[str] = None,
+        resume_run_id: Optional[str] = None,
+        component_registry: Optional[ComponentRegistry] = None,
     ):
         self.storage_account_key = storage_account_key
         self.kedro_environment = kedro_environment
@@ -66,38 +170,730 @@ class AzureMLPipelineGenerator:
         self.pipeline_name = pipeline_name
         self.extra_env = extra_env
         self.load_versions = load_versions
+        # Kedro's slicing options (``tags``, ``from_nodes``, ``to_nodes``, ``node_names``, ``from_inputs``,
+        # ``to_outputs``), the sliced-off inputs not in the catalog are read from the previous run
+        self.pipeline_filters = {k: v for k, v in pipeline_filters.items() if v}
+        # the resumed run is sliced to the nodes of which the outputs are missing, it reads the other ones
+        # from (and saves the new ones to) the temporary storage of the run
+        self.resume_run_id = resume_run_id
+        self.previous_run_id = resume_run_id or previous_run_id
+        # with ``registered_components``, the steps are built from the components registered in the workspace
+        self.component_registry = component_registry
+        self._sliced_off_inputs: Set[str] = set()
+        self._index: Optional[_PipelineIndex] = None
+        self._catalog_names: Optional[Set[str]] = None
+        self._asset_datasets: Dict[str, Optional[AzureMLAssetDataset]] = {}
+        self._components: Dict[str, PipelineComponent] = {}
+        self._step_fingerprints: Dict[str, str] = {}
+        self.kedro_azure_run_id: Optional[str] = None
 
     def generate(self) -> Job:
-        pipeline = self.get_kedro_pipeline()
-        kedro_azure_run_id = uuid4().hex
+        pipeline, self._sliced_off_inputs = self._get_sliced_pipeline(resume=True)
+        self._validate_sliced_off_inputs()
+        kedro_azure_run_id = self.kedro_azure_run_id = self.resume_run_id or uuid4().hex
 
         logger.info(f"Translating {self.pipeline_name} to Azure ML Pipeline")
+        self._step_fingerprints = (
+            self._get_step_fingerprints(pipeline)
+            if self._is_step_reuse_enabled()
+            else {}
+        )
+        plan = self._plan_component(pipeline, None, kedro_azure_run_id)
+        self._components = {}
+        if self.component_registry is not None:
+            self.component_registry.register(
+                command(**kwargs).component
+                for kwargs in self._iter_command_kwargs(plan)
+            )
+
+        def kedro_azure_pipeline_fn(**pipeline_inputs):
+            return self._invoke_units(plan, pipeline_inputs)
+
+        kedro_azure_pipeline_fn.__signature__ = self._get_signature(plan.inputs)
+        kedro_azure_pipeline = azure_pipeline(name=self.pipeline_name)(
+            kedro_azure_pipeline_fn
+        )
+
+        azure_pipeline_job: Job = kedro_azure_pipeline()
+        azure_pipeline_job.tags = {
+            **(azure_pipeline_job.tags or {}),
+            KEDRO_AZURE_RUN_ID_TAG: kedro_azure_run_id,
+        }
+        return azure_pipeline_job
+
+    def get_fingerprint(self) -> str:
+        """
+        Fingerprint of everything the generated job depends on: the pipeline structure, the catalog entries
+        of its datasets, the plugin config, the Kedro environment, the parameters, the load versions,
+        the slicing options and, with step reuse, the step fingerprints. The Kedro Azure run ID and the storage
+        account key are not part of it.
+        """
+        pipeline, _ = self._get_sliced_pipeline()
+        fingerprint = hashlib.sha256()
+
+        def update(*values):
+            fingerprint.update(
+                json.dumps(values, sort_keys=True, default=str).encode() + b"\n"
+            )
+
+        update(
+            __version__,
+            version("azure-ai-ml"),
+            self.pipeline_name,
+            self.kedro_environment,
+            self.aml_env,
+            self.docker_image,
+            self.params,
+            self.extra_env,
+            self.load_versions,
+            self.pipeline_filters,
+            self.previous_run_id,
+        )
+        if self.component_registry is not None:
+            # the registered components pin the versions of the environment and the code
+            update(
+                str(self._resolve_azure_environment()),
+                self._resolve_code(),
+            )
+        update(self.config.model_dump(mode="json"), self.kedro_params)
+        for node in pipeline.nodes:
+            update(
+                node.name,
+                node.namespace,
+                sorted(node.tags),
+                node.inputs,
+                node.outputs,
+                getattr(node.func, DISTRIBUTED_CONFIG_FIELD, None),
+                getattr(node.func, PARALLEL_CONFIG_FIELD, None),
+            )
+        if self._is_step_reuse_enabled():
+            # the step fingerprints (e.g. the code of the nodes) are baked into the steps
+            update(self._get_step_fingerprints(pipeline))
+        for name in sorted(pipeline.datasets()):
+            if self._is_in_catalog(name):
+                dataset = self.catalog[name]
+                update(name, type(dataset).__module__, type(dataset).__qualname__)
+                update(repr(dataset))
+        return fingerprint.hexdigest()
+
+    def _get_index(self, pipeline: Pipeline) -> _PipelineIndex:
+        if self._index is None or self._index.pipeline is not pipeline:
+            self._index = _PipelineIndex(pipeline)
+        return self._index
+
+    def _get_steps(self, pipeline: Pipeline) -> Dict[str, List[Node]]:
+        """
+        Groups the nodes into Azure ML steps. Without node fusion, every node is a separate step.
+        With node fusion, nodes tagged with the same ``group.<name>`` tag run in the ``<name>`` step
+        and linear chains of the remaining nodes running on the same compute are fused into steps named after
+        the first node of the chain. Distributed nodes always run in separate steps.
+        """
+        index = self._get_index(pipeline)
+        if index.steps is not None:
+            return index.steps
+
+        fusion = self.config.azure.node_fusion
+        fusion_enabled = fusion is not None and fusion.enabled
+        steps: Dict[str, List[Node]] = {}
+        node_steps: Dict[str, str] = {}
+        for node in index.nodes:
+            if fusion_enabled and (group := self._get_group_tag(node)) is not None:
+                step = group
+            elif (
+                fusion_enabled
+                and fusion.linear_chains
+                and (parent := self._get_chain_parent(index, node))
+            ):
+                step = node_steps[parent.name]
+            else:
+                step = node.name
+            steps.setdefault(step, []).append(node)
+            node_steps[node.name] = step
+
+        if fusion_enabled:
+            self._validate_steps(steps)
+        index.steps = self._sort_steps(index, steps, node_steps)
+        index.node_steps = node_steps
+        index.step_namespaces = {
+            step: self._get_step_namespace(nodes) for step, nodes in index.steps.items()
+        }
+        return index.steps
+
+    def _get_group_tag(self, node: Node) -> Optional[str]:
+        groups = [
+            tag[len(GROUP_TAG_PREFIX) :]
+            for tag in node.tags
+            if tag.startswith(GROUP_TAG_PREFIX)
+        ]
+        if len(groups) > 1:
+            raise ConfigException(
+                f"Node {node.name} has more than one {GROUP_TAG_PREFIX} tag"
+            )
+        return groups[0] if groups else None
+
+    def _is_distributed(self, node: Node) -> bool:
+        return isinstance(
+            getattr(node.func, DISTRIBUTED_CONFIG_FIELD, None), DistributedNodeConfig
+        )
+
+    def _is_parallel(self, node: Node) -> bool:
+        return isinstance(
+            getattr(node.func, PARALLEL_CONFIG_FIELD, None), ParallelNodeConfig
+        )
+
+    def _runs_separately(self, node: Node) -> bool:
+        return self._is_distributed(node) or self._is_parallel(node)
+
+    def _get_chain_parent(self, index: _PipelineIndex, node: Node) -> Optional[Node]:
+        """Returns the only parent of ``node`` if ``node`` is its only child and they can run in the same step"""
+        dependencies = index.pipeline.node_dependencies[node]
+        if len(dependencies) != 1 or self._runs_separately(node):
+            return None
+        parent = next(iter(dependencies))
+        children = {
+            child for output in parent.outputs for child in index.consumers[output]
+        }
+        if (
+            children == {node}
+            and not self._runs_separately(parent)
+            and self._get_group_tag(parent) is None
+            and self.get_target_resource_from_node_tags(parent).cluster_name
+            == self.get_target_resource_from_node_tags(node).cluster_name
+        ):
+            return parent
+        return None
+
+    def _validate_steps(self, steps: Dict[str, List[Node]]):
+        for step, nodes in steps.items():
+            if len(nodes) == 1:
+                continue
+            if len({self._get_group_tag(n) for n in nodes}) > 1:
+                raise ConfigException(
+                    f"Group {step} has the same name as a node outside of the group, "
+                    f"rename the {GROUP_TAG_PREFIX}{step} tag"
+                )
+            if (
+                len(
+                    {
+                        self.get_target_resource_from_node_tags(n).cluster_name
+                        for n in nodes
+                    }
+                )
+                > 1
+            ):
+                raise ConfigException(
+                    f"Nodes of group {step} have to run on the same compute"
+                )
+            if any(self._runs_separately(n) for n in nodes):
+                raise ConfigException(
+                    f"Distributed and parallel nodes cannot be grouped with other nodes (group {step})"
+                )
+
+    def _sort_steps(
+        self,
+        index: _PipelineIndex,
+        steps: Dict[str, List[Node]],
+        node_steps: Dict[str, str],
+    ) -> Dict[str, List[Node]]:
+        index.step_dependencies = {
+            step: {
+                node_steps[parent.name]
+                for node in nodes
+                for parent in index.pipeline.node_dependencies[node]
+            }
+            - {step}
+            for step, nodes in steps.items()
+        }
+        sorted_steps = self._sort_topologically(index.step_dependencies)
+        if len(sorted_steps) != len(steps):
+            raise ConfigException(
+                "Groups of nodes depend on each other: "
+                + ", ".join(sorted(set(steps) - set(sorted_steps)))
+            )
+        return {step: steps[step] for step in sorted_steps}
 
-        def kedro_azure_pipeline_fn():
-            commands = {}
+    @staticmethod
+    def _sort_topologically(
+        dependencies: Dict[Hashable, Set[Hashable]]
+    ) -> List[Hashable]:
+        """Kahn's algorithm, the items which depend on each other are left out of the result"""
+        dependents = defaultdict(list)
+        for item, item_dependencies in dependencies.items():
+            for dependency in item_dependencies:
+                dependents[dependency].append(item)
 
-            for node in pipeline.nodes:
-                azure_command = self._construct_azure_command(
-                    pipeline, node, kedro_azure_run_id
+        remaining = {item: len(deps) for item, deps in dependencies.items()}
+        ready = deque(item for item, count in remaining.items() if count == 0)
+        sorted_items = []
+        while ready:
+            item = ready.popleft()
+            sorted_items.append(item)
+            for dependent in dependents[item]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        return sorted_items
+
+    def _is_step_reuse_enabled(self) -> bool:
+        return (
+            self.config.azure.step_reuse is not None
+            and self.config.azure.step_reuse.enabled
+        )
+
+    def _is_deterministic(
+        self, nodes: List[Node], step_fingerprint: Optional[str]
+    ) -> bool:
+        """
+        With step reuse, the steps with fingerprints are deterministic, otherwise the steps of which all nodes
+        are tagged as deterministic
+        """
+        if self._is_step_reuse_enabled():
+            return step_fingerprint is not None
+        return all("deterministic" in n.tags for n in nodes)
+
+    def _get_step_fingerprints(self, pipeline: Pipeline) -> Dict[str, str]:
+        """
+        Fingerprints of the reusable steps: the code of their nodes, the parameters they consume, the catalog
+        entries of their datasets and the fingerprints of the upstream steps. The steps with nodes tagged as
+        non-deterministic, registering the versions of their outputs or reading unversioned catalog datasets
+        are not reusable, neither are their downstream steps.
+        """
+        index = self._get_index(pipeline)
+        fingerprints = {}
+        for step, nodes in self._get_steps(pipeline).items():
+            if any(
+                NON_DETERMINISTIC_TAG in n.tags
+                or self._registers_own_versions(n)
+                or any(self._is_unversioned_input(name, pipeline) for name in n.inputs)
+                for n in nodes
+            ) or any(d not in fingerprints for d in index.step_dependencies[step]):
+                continue
+            datasets = sorted({name for n in nodes for name in n.inputs + n.outputs})
+            structure = [
+                step,
+                [
+                    [
+                        n.name,
+                        sorted(n.tags),
+                        n.inputs,
+                        n.outputs,
+                        self._get_function_fingerprint(n.func),
+                        repr(getattr(n.func, DISTRIBUTED_CONFIG_FIELD, None)),
+                        repr(getattr(n.func, PARALLEL_CONFIG_FIELD, None)),
+                    ]
+                    for n in nodes
+                ],
+                {
+                    name: self._get_kedro_param(name[len(PARAMS_PREFIX) :])
+                    if name.startswith(PARAMS_PREFIX)
+                    else repr(self.catalog[name])
+                    for name in datasets
+                    if name.startswith(PARAMS_PREFIX) or self._is_in_catalog(name)
+                },
+                sorted(fingerprints[d] for d in index.step_dependencies[step]),
+            ]
+            fingerprints[step] = hashlib.sha256(
+                json.dumps(structure, sort_keys=True, default=str).encode()
+            ).hexdigest()
+        return fingerprints
+
+    def _is_unversioned_input(self, dataset_name: str, pipeline: Pipeline) -> bool:
+        """
+        Whether the pipeline input is read by the step straight from the catalog, so it can change between
+        the runs unnoticed by Azure ML. AzureMLAssetDatasets are passed as the versions of the data assets.
+        """
+        return (
+            not dataset_name.startswith(PARAMS_PREFIX)
+            and dataset_name in self._get_index(pipeline).inputs
+            and self._is_in_catalog(dataset_name)
+            and not self._get_asset_dataset(dataset_name)
+            and dataset_name not in self.config.azure.step_reuse.static_inputs
+        )
+
+    @staticmethod
+    def _get_function_fingerprint(func) -> str:
+        """Source code of the node's function, or its bytecode if the source is not available"""
+        bound_arguments = ""
+        if isinstance(func, functools.partial):
+            bound_arguments = repr((func.args, func.keywords))
+            func = func.func
+        func = inspect.unwrap(func)
+        try:
+            return inspect.getsource(func) + bound_arguments
+        except (OSError, TypeError):
+            if code := getattr(func, "__code__", None):
+                return code.co_code.hex() + repr(code.co_consts) + bound_arguments
+            return getattr(func, "__qualname__", repr(func)) + bound_arguments
+
+    def _get_step_namespace(self, nodes: List[Node]) -> Optional[str]:
+        """The innermost namespace containing all nodes of the step, None if namespaces are not compiled"""
+        components = self.config.azure.namespace_components
+        if components is None or not components.enabled:
+            return None
+        common = os.path.commonprefix(
+            [(node.namespace or "").split(".") for node in nodes]
+        )
+        return ".".join(common) or None
+
+    @staticmethod
+    def _is_in_namespace(name: Optional[str], namespace: Optional[str]) -> bool:
+        return namespace is None or (
+            name is not None and (name == namespace or name.startswith(namespace + "."))
+        )
+
+    @staticmethod
+    def _get_relative_name(name: str, namespace: Optional[str]) -> str:
+        """Name of the node, dataset (or parameter) or nested namespace within the namespace"""
+        prefix = PARAMS_PREFIX if name.startswith(PARAMS_PREFIX) else ""
+        unprefixed = name[len(prefix) :]
+        if namespace is not None and unprefixed.startswith(namespace + "."):
+            return prefix + unprefixed[len(namespace) + 1 :]
+        return name
+
+    def _render_name(self, name: str, namespace: Optional[str]) -> str:
+        """Name used in the command, the namespace is passed to the component as an input"""
+        relative_name = self._get_relative_name(name, namespace)
+        if relative_name == name:
+            return name
+        return "${{inputs." + NAMESPACE_INPUT + "}}." + relative_name
+
+    def _get_port_name(self, dataset_name: str, namespace: Optional[str]) -> str:
+        return self._sanitize_param_name(
+            self._get_relative_name(dataset_name, namespace)
+        )
+
+    def _check_port_names(
+        self, dataset_names: Iterable[str], namespace: Optional[str]
+    ) -> None:
+        """
+        The port names are sanitized dataset names, so the different datasets (e.g. ``params:a.b`` and
+        ``params:a_b``) can map to the same input or output of the component.
+        """
+        datasets: Dict[str, str] = {}
+        for dataset_name in sorted(set(dataset_names)):
+            port = self._get_port_name(dataset_name, namespace)
+            if datasets.setdefault(port, dataset_name) != dataset_name:
+                raise ConfigException(
+                    f"Datasets {datasets[port]} and {dataset_name} are both passed as the Azure ML "
+                    f"input/output {port}, rename one of them"
                 )
 
-                commands[node.name] = azure_command
+    def _get_namespace_port_name(self, namespace: str, parent: str) -> str:
+        return (
+            f"{NAMESPACE_INPUT}_"
+            f"{self._sanitize_param_name(self._get_relative_name(namespace, parent))}"
+        )
 
-            # wire the commands into execution graph
-            invoked_components = self._connect_commands(pipeline, commands)
+    def _plan_component(
+        self, pipeline: Pipeline, namespace: Optional[str], kedro_azure_run_id: str
+    ) -> _ComponentPlan:
+        """
+        Plans the Azure ML pipeline of the namespace: the steps of the namespace and the pipeline components of
+        the nested namespaces, in which order they are invoked and how their inputs and outputs are connected.
+        The names within a namespace are relative to it, so the namespaces with the same structure get the same key.
+        """
+        index = self._get_index(pipeline)
+        steps = self._get_steps(pipeline)
+        units: Dict[Tuple[bool, str], Optional[str]] = {}  # (is namespace, name)
+        step_units: Dict[str, Tuple[bool, str]] = {}
+        descendants = set()
+        for step, step_namespace in index.step_namespaces.items():
+            if not self._is_in_namespace(step_namespace, namespace):
+                continue
+            if step_namespace == namespace:
+                unit = (False, step)
+            else:
+                relative_name = self._get_relative_name(step_namespace, namespace)
+                parts = relative_name.split(".")
+                prefix = f"{namespace}." if namespace else ""
+                unit = (True, prefix + parts[0])
+                descendants.update(
+                    prefix + ".".join(parts[: i + 1]) for i in range(len(parts))
+                )
+            step_units[step] = unit
+            units.setdefault(unit, None)
 
-            # pipeline outputs
-            azure_pipeline_outputs = self._gather_pipeline_outputs(
-                pipeline, invoked_components
+        dependencies = {unit: set() for unit in units}
+        for step, unit in step_units.items():
+            dependencies[unit].update(
+                step_units[dependency]
+                for dependency in index.step_dependencies[step]
+                if dependency in step_units
+            )
+            dependencies[unit].discard(unit)
+        sorted_units = self._sort_topologically(dependencies)
+        if len(sorted_units) != len(units):
+            raise ConfigException(
+                "Namespaces depend on each other through the nodes outside of them, "
+                "cannot compile them into pipeline components: "
+                + ", ".join(sorted(name for _, name in set(units) - set(sorted_units)))
             )
-            return azure_pipeline_outputs
+        positions = {unit: position for position, unit in enumerate(sorted_units)}
 
-        kedro_azure_pipeline = azure_pipeline(name=self.pipeline_name)(
-            kedro_azure_pipeline_fn
+        inputs: Dict[str, Input] = {}
+        datasets: Dict[str, str] = {}
+        namespaces: Dict[str, str] = {}
+        if namespace is not None:
+            namespaces[NAMESPACE_INPUT] = namespace
+            for descendant in sorted(descendants):
+                namespaces[
+                    self._get_namespace_port_name(descendant, namespace)
+                ] = descendant
+            inputs.update((port, Input(type="string")) for port in namespaces)
+
+        def get_source(dataset_name: str, input_type: Input) -> _Source:
+            if (producer := index.producers.get(dataset_name)) and (
+                unit := step_units.get(index.node_steps[producer.name])
+            ):
+                is_namespace, name = unit
+                return (
+                    "output",
+                    positions[unit],
+                    self._get_port_name(
+                        dataset_name, name if is_namespace else namespace
+                    ),
+                )
+            elif namespace is not None:
+                port = self._get_port_name(dataset_name, namespace)
+                inputs[port] = input_type
+                datasets[port] = dataset_name
+                return ("input", port)
+            elif dataset_name.startswith(PARAMS_PREFIX):
+                # the parameters are the inputs of the root pipeline, defaulting to their values
+                port = self._get_port_name(dataset_name, namespace)
+                inputs[port] = self._get_param_input(dataset_name, with_default=True)
+                datasets[port] = dataset_name
+                return ("input", port)
+            else:
+                return ("dataset", dataset_name)
+
+        def get_namespace_source(nested_namespace: str) -> _Source:
+            if namespace is None:
+                return ("value", nested_namespace)
+            return (
+                "input",
+                self._get_namespace_port_name(nested_namespace, namespace),
+            )
+
+        plan_units = []
+        outputs = {}
+        output_datasets = []
+        for is_namespace, name in sorted_units:
+            if is_namespace:
+                component = self._plan_component(pipeline, name, kedro_azure_run_id)
+                unit_inputs = {
+                    port: get_namespace_source(component.namespaces[port])
+                    if port in component.namespaces
+                    else get_source(component.datasets[port], input_type)
+                    for port, input_type in component.inputs.items()
+                }
+                plan_units.append(_Unit(name, unit_inputs, component=component))
+            else:
+                nodes = steps[name]
+                unit_inputs = {
+                    self._get_port_name(dataset_name, namespace): get_source(
+                        dataset_name, self._get_input(dataset_name, pipeline)
+                    )
+                    for dataset_name in self._get_step_inputs(pipeline, nodes)
+                }
+                if namespace is not None:
+                    unit_inputs[NAMESPACE_INPUT] = ("input", NAMESPACE_INPUT)
+                command_kwargs = self._get_command_kwargs(
+                    pipeline, name, nodes, kedro_azure_run_id, namespace
+                )
+                shards = None
+                if len(nodes) == 1 and self._is_parallel(nodes[0]):
+                    shards, command_kwargs = self._get_parallel_command_kwargs(
+                        pipeline, nodes[0], command_kwargs, namespace
+                    )
+                plan_units.append(
+                    _Unit(
+                        name, unit_inputs, command_kwargs=command_kwargs, shards=shards
+                    )
+                )
+
+        for step, unit in step_units.items():
+            is_namespace, name = unit
+            for dataset_name in self._get_step_outputs(pipeline, steps[step]):
+                if dataset_name in index.outputs or any(
+                    not self._is_in_namespace(
+                        index.step_namespaces[index.node_steps[consumer.name]],
+                        namespace,
+                    )
+                    for consumer in index.consumers[dataset_name]
+                ):
+                    output_datasets.append(dataset_name)
+                    outputs[self._get_port_name(dataset_name, namespace)] = (
+                        "output",
+                        positions[unit],
+                        self._get_port_name(
+                            dataset_name, name if is_namespace else namespace
+                        ),
+                    )
+
+        self._check_port_names([*datasets.values(), *output_datasets], namespace)
+        plan = _ComponentPlan(
+            namespace,
+            self._get_relative_name(namespace, namespace.rpartition(".")[0] or None)
+            if namespace
+            else self.pipeline_name,
+            inputs,
+            outputs,
+            plan_units,
+            datasets,
+            namespaces,
         )
+        if namespace is not None:
+            plan.key = self._get_component_key(plan)
+        return plan
 
-        azure_pipeline_job: Job = kedro_azure_pipeline()
-        return azure_pipeline_job
+    def _get_component_key(self, plan: _ComponentPlan) -> str:
+        structure = {
+            "inputs": plan.inputs,
+            "outputs": plan.outputs,
+            "units": [
+                {
+                    "name": self._get_relative_name(unit.name, plan.namespace),
+                    "inputs": unit.inputs,
+                    "command": unit.command_kwargs,
+                    "shards": unit.shards,
+                    "component": unit.component.key if unit.component else None,
+                }
+                for unit in plan.units
+            ],
+        }
+        return hashlib.sha256(
+            json.dumps(
+                structure,
+                sort_keys=True,
+                default=lambda o: o._to_dict() if hasattr(o, "_to_dict") else vars(o),
+            ).encode()
+        ).hexdigest()
+
+    def _invoke_units(
+        self, plan: _ComponentPlan, inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Invokes the steps and the components of the plan, so the Azure's DSL builds the execution graph"""
+        invoked = []
+
+        def resolve(source: _Source):
+            kind, *value = source
+            if kind == "output":
+                position, port = value
+                return invoked[position].outputs[port]
+            elif kind == "input":
+                return inputs[value[0]]
+            elif kind == "dataset" and (ds := self._get_asset_dataset(value[0])):
+                return Input(
+                    type=ds._azureml_type,
+                    path=self._get_versioned_azureml_dataset_name(
+                        value[0], ds._azureml_dataset
+                    ),
+                )
+            else:
+                # literal value or a dummy input for the datasets which are not passed by Azure ML
+                return value[0]
+
+        for unit in plan.units:
+            unit_inputs = {
+                port: resolve(source) for port, source in unit.inputs.items()
+            }
+            if unit.shards:
+                shard_steps = [
+                    self._invoke_command(kwargs, unit_inputs) for kwargs in unit.shards
+                ]
+                merge_inputs = {
+                    self._get_shard_port_name(port, shard_index): step.outputs[port]
+                    for shard_index, step in enumerate(shard_steps)
+                    for port in unit.command_kwargs["outputs"]
+                }
+                if NAMESPACE_INPUT in unit_inputs:
+                    merge_inputs[NAMESPACE_INPUT] = unit_inputs[NAMESPACE_INPUT]
+                invoked.append(self._invoke_command(unit.command_kwargs, merge_inputs))
+            elif unit.component is None:
+                invoked.append(self._invoke_command(unit.command_kwargs, unit_inputs))
+            else:
+                invoked.append(self._invoke_component(unit.component, unit_inputs))
+        return {port: resolve(source) for port, source in plan.outputs.items()}
+
+    def _iter_command_kwargs(self, plan: _ComponentPlan) -> Iterator[Dict[str, Any]]:
+        for unit in plan.units:
+            if unit.component is not None:
+                yield from self._iter_command_kwargs(unit.component)
+            else:
+                yield from unit.shards or []
+                yield unit.command_kwargs
+
+    def _invoke_command(self, command_kwargs: Dict[str, Any], inputs: Dict[str, Any]):
+        """Invokes the step, built from its registered component with ``registered_components``"""
+        step = command(**command_kwargs)
+        if self.component_registry is None:
+            return step(**inputs)
+        invoked = self.component_registry.get(step.component)(**inputs)
+        # the settings of the step are not a part of its component
+        for attr in (
+            "name",
+            "display_name",
+            "compute",
+            "environment_variables",
+            "resources",
+            "distribution",
+        ):
+            setattr(invoked, attr, getattr(step, attr))
+        for port, output in command_kwargs["outputs"].items():
+            invoked.outputs[port] = output
+        return invoked
+
+    def _invoke_component(self, plan: _ComponentPlan, inputs: Dict[str, Any]):
+        """Invokes the pipeline component of the namespace, which is defined once for all namespaces with its key"""
+        if component := self._components.get(plan.key):
+            invoked = component(**inputs)
+        else:
+
+            def kedro_azure_component_fn(**component_inputs):
+                return self._invoke_units(plan, component_inputs)
+
+            kedro_azure_component_fn.__signature__ = self._get_signature(plan.inputs)
+            invoked = azure_pipeline(name=self._sanitize_azure_name(plan.name))(
+                kedro_azure_component_fn
+            )(**inputs)
+            self._components[plan.key] = invoked.component
+        invoked.name = self._sanitize_azure_name(plan.name)
+        invoked.display_name = plan.namespace
+        return invoked
+
+    @staticmethod
+    def _get_signature(inputs: Dict[str, Input]) -> inspect.Signature:
+        """Signature of the pipeline function, so the Azure's DSL creates the (typed) inputs of the pipeline"""
+        return inspect.Signature(
+            [
+                inspect.Parameter(
+                    port,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    annotation=input_type,
+                    default=inspect.Parameter.empty
+                    if input_type.default is None
+                    else input_type.default,
+                )
+                for port, input_type in inputs.items()
+            ]
+        )
+
+    def _get_asset_dataset(self, dataset_name: str) -> Optional[AzureMLAssetDataset]:
+        """Returns the catalog dataset if it's an ``AzureMLAssetDataset``, None otherwise"""
+        if dataset_name not in self._asset_datasets:
+            self._asset_datasets[dataset_name] = (
+                ds
+                if self._is_in_catalog(dataset_name)
+                and isinstance(ds := self.catalog[dataset_name], AzureMLAssetDataset)
+                else None
+            )
+        return self._asset_datasets[dataset_name]
+
+    def _is_in_catalog(self, dataset_name: str) -> bool:
+        if self._catalog_names is None:
+            self._catalog_names = set(self.catalog.filter())
+        return dataset_name in self._catalog_names
 
     def get_kedro_pipeline(self) -> Pipeline:
         from kedro.framework.project import pipelines
@@ -105,6 +901,125 @@ class AzureMLPipelineGenerator:
         pipeline: Pipeline = pipelines[self.pipeline_name]
         return pipeline
 
+    def _get_sliced_pipeline(self, resume: bool = False) -> Tuple[Pipeline, Set[str]]:
+        """
+        The pipeline sliced with the Kedro's filters (and to the part which has to be run again, with ``resume``)
+        and its inputs produced by the sliced-off nodes
+        """
+        pipeline = self.get_kedro_pipeline()
+        sliced_pipeline = (
+            pipeline.filter(**self.pipeline_filters)
+            if self.pipeline_filters
+            else pipeline
+        )
+        if resume and self.resume_run_id:
+            sliced_pipeline = self._get_resumed_pipeline(sliced_pipeline)
+        if sliced_pipeline is pipeline:
+            return pipeline, set()
+        logger.info(
+            f"Sliced {self.pipeline_name} to {len(sliced_pipeline.nodes)} "
+            f"of {len(pipeline.nodes)} nodes"
+        )
+        return sliced_pipeline, sliced_pipeline.inputs() & pipeline.all_outputs()
+
+    def _get_resumed_pipeline(self, pipeline: Pipeline) -> Pipeline:
+        """
+        The part of the pipeline which has to be run again to resume the run: the nodes of which some outputs
+        are missing (or which have no outputs) and their descendants
+        """
+        if (
+            self.config.azure.pipeline_data_passing is not None
+            and self.config.azure.pipeline_data_passing.enabled
+        ) or self._is_step_reuse_enabled():
+            raise ConfigException(
+                "Only the runs which pass the data through the temporary storage can be resumed, "
+                "without pipeline_data_passing and step_reuse"
+            )
+        outputs = sorted(pipeline.all_outputs())
+        with ThreadPoolExecutor(max_workers=RESUME_CHECK_WORKERS) as executor:
+            existing = {
+                name
+                for name, exists in zip(
+                    outputs, executor.map(self._resumed_output_exists, outputs)
+                )
+                if exists
+            }
+        missing = [
+            node.name
+            for node in pipeline.nodes
+            if not node.outputs or not existing.issuperset(node.outputs)
+        ]
+        if not missing:
+            raise ConfigException(
+                f"All the outputs of run {self.resume_run_id} exist, there is nothing to resume"
+            )
+        resumed_pipeline = pipeline.from_nodes(*missing)
+        logger.info(
+            f"Resuming run {self.resume_run_id}: {len(existing)} of {len(outputs)} outputs exist, "
+            f"running {len(resumed_pipeline.nodes)} of {len(pipeline.nodes)} nodes"
+        )
+        return resumed_pipeline
+
+    def _resumed_output_exists(self, dataset_name: str) -> bool:
+        """
+        Whether the output was saved by the resumed run: the temporary datasets are looked up in the temporary
+        storage of the run, the catalog datasets in the catalog. Only the catalog datasets saved to remote storage
+        (fsspec datasets with a remote protocol, e.g. ``abfs://``) are looked up - the local files and the in-memory
+        data on the submitting machine were not saved by the run.
+        The outputs of the Azure ML jobs (``AzureMLPipelineDataset``) are not available to the other jobs,
+        so they never exist.
+        """
+        if self._is_in_catalog(dataset_name):
+            dataset = self.catalog[dataset_name]
+            protocol = getattr(dataset, "_protocol", None)
+            if (
+                isinstance(dataset, AzureMLPipelineDataset)
+                or protocol is None
+                or protocol in LOCAL_PROTOCOLS
+            ):
+                return False
+        else:
+            dataset = KedroAzureRunnerDataset(
+                self.config.azure.temporary_storage.account_name,
+                self.config.azure.temporary_storage.container,
+                self.storage_account_key,
+                dataset_name,
+                self.resume_run_id,
+            )
+        try:
+            return dataset.exists()
+        except DatasetError:
+            logger.warning(
+                f"Cannot check whether {dataset_name} exists, running its node again",
+                exc_info=True,
+            )
+            return False
+
+    def _get_temporary_sliced_off_inputs(self) -> List[str]:
+        """Sliced-off inputs, which are not in the catalog, so they are read from the previous run"""
+        return sorted(
+            name for name in self._sliced_off_inputs if not self._is_in_catalog(name)
+        )
+
+    def _validate_sliced_off_inputs(self):
+        if not (temporary_inputs := self._get_temporary_sliced_off_inputs()):
+            return
+        names = ", ".join(temporary_inputs)
+        if (
+            self.config.azure.pipeline_data_passing is not None
+            and self.config.azure.pipeline_data_passing.enabled
+        ) or self._is_step_reuse_enabled():
+            raise ConfigException(
+                f"Inputs {names} are produced by the sliced-off nodes and they are not in the catalog, "
+                "they can be read from the temporary storage of a previous run only without "
+                "pipeline_data_passing and step_reuse"
+            )
+        if not self.previous_run_id:
+            raise ConfigException(
+                f"Inputs {names} are produced by the sliced-off nodes and they are not in the catalog, "
+                "pass the Kedro Azure run ID of the run which produced them (--previous-run-id)"
+            )
+
     def get_target_resource_from_node_tags(self, node: Node) -> ComputeConfig:
         resource_tags = set(node.tags).intersection(
             set(self.config.azure.compute.keys())
@@ -141,8 +1056,22 @@ class AzureMLPipelineGenerator:
         ):
             logger.info(f"Using docker image: {image} to run the pipeline.")
             return Environment(image=image)
-        else:
-            return self.aml_env or self.config.azure.environment_name
+        environment = self.aml_env or self.config.azure.environment_name
+        if self.component_registry is not None:
+            return self.component_registry.resolve_environment(environment)
+        return environment
+
+    def _resolve_code(self) -> Optional[str]:
+        code_directory = self.config.azure.code_directory
+        if self.component_registry is not None and code_directory:
+            if code_id := self.component_registry.resolve_code(code_directory):
+                return code_id
+            # the version of the components would not change with the code
+            raise ConfigException(
+                "registered_components require the code directory to be registered as a code asset, "
+                "which is not supported by the installed azure-ai-ml, disable registered_components"
+            )
+        return code_directory
 
     def _get_versioned_azureml_dataset_name(
         self, catalog_name: str, azureml_dataset_name: str
@@ -154,27 +1083,79 @@ class AzureMLPipelineGenerator:
             suffix = ":" + version
         return azureml_dataset_name + suffix
 
+    def _get_param_type_and_value(self, dataset_name: str) -> Tuple[str, Any]:
+        """
+        Type (one of ``PARAM_INPUT_TYPES``) and value of the Azure ML pipeline input of the parameter.
+        The parameters which are not scalars (or contain quotes) are passed as JSON strings, with the quotes
+        escaped, as the values are passed to the command in single quotes.
+        """
+        value = self._get_kedro_param(dataset_name[len(PARAMS_PREFIX) :])
+        if isinstance(value, bool):  # before int, bool is a subclass of int
+            return "boolean", value
+        elif isinstance(value, int):
+            return "integer", value
+        elif isinstance(value, float):
+            return "number", value
+        elif isinstance(value, str) and "'" not in value:
+            return "string", value
+        else:
+            return "json", json.dumps(value, default=str).replace("'", "\\u0027")
+
+    def _get_param_input(self, dataset_name: str, with_default: bool = False) -> Input:
+        param_type, value = self._get_param_type_and_value(dataset_name)
+        return Input(
+            type="string" if param_type == "json" else param_type,
+            default=value if with_default else None,
+        )
+
     def _get_input(self, dataset_name: str, pipeline: Pipeline) -> Input:
-        if self._is_param_or_root_non_azureml_asset_dataset(dataset_name, pipeline):
+        if dataset_name.startswith(PARAMS_PREFIX):
+            return self._get_param_input(dataset_name)
+        elif self._is_param_or_root_non_azureml_asset_dataset(dataset_name, pipeline):
             return Input(type="string")
-        elif dataset_name in self.catalog.filter() and isinstance(
-            ds := self.catalog[dataset_name], AzureMLAssetDataset
-        ):
-            if ds._azureml_type == "uri_file" and dataset_name not in pipeline.inputs():
+        elif ds := self._get_asset_dataset(dataset_name):
+            if (
+                ds._azureml_type in INPUT_ONLY_ASSET_TYPES
+                and dataset_name not in self._get_index(pipeline).inputs
+            ):
                 raise ValueError(
-                    "AzureMLAssetDatasets with azureml_type 'uri_file' can only be used as pipeline inputs"
+                    f"AzureMLAssetDatasets with azureml_type '{ds._azureml_type}' can only be used as pipeline inputs"
                 )
             return Input(type=ds._azureml_type)
         else:
             return Input(type="uri_folder")
 
-    def _get_output(self, name):
-        if name in self.catalog.filter() and isinstance(
-            ds := self.catalog[name], AzureMLAssetDataset
-        ):
-            if ds._azureml_type == "uri_file":
+    def _get_appended_load_versions(self, nodes: List[Node]) -> Dict[str, str]:
+        """Versions of the inputs saved in the `append` mode pinned with ``load_versions``,
+        the steps read only the partitions of these versions from the folder shared by all the versions
+        """
+        return {
+            name: version
+            for name, version in sorted(self.load_versions.items())
+            if version != "latest"
+            and any(name in n.inputs for n in nodes)
+            and (ds := self._get_asset_dataset(name))
+            and ds._save_mode == "append"
+        }
+
+    def _registers_own_versions(self, node: Node) -> bool:
+        return any(
+            (ds := self._get_asset_dataset(name)) and ds.registers_own_versions
+            for name in node.outputs
+        )
+
+    def _get_output(self, name, kedro_azure_run_id: str):
+        if ds := self._get_asset_dataset(name):
+            if ds._azureml_type in INPUT_ONLY_ASSET_TYPES:
                 raise ValueError(
-                    "AzureMLAssetDatasets with azureml_type 'uri_file' cannot be used as outputs"
+                    f"AzureMLAssetDatasets with azureml_type '{ds._azureml_type}' cannot be used as outputs"
+                )
+            if ds.registers_own_versions:
+                # the new asset version (if any) is registered by the dataset itself
+                return Output(
+                    type="uri_folder",
+                    path=ds.get_output_uri(kedro_azure_run_id),
+                    mode="rw_mount",
                 )
             # TODO: add versioning
             return Output(type=ds._azureml_type, name=ds._azureml_dataset)
@@ -207,53 +1188,211 @@ class AzureMLPipelineGenerator:
         self, dataset_name: str, pipeline: Pipeline
     ) -> bool:
         return dataset_name.startswith(PARAMS_PREFIX) or (
-            dataset_name in pipeline.inputs()
-            and dataset_name in self.catalog.filter()
-            and not isinstance(self.catalog[dataset_name], AzureMLAssetDataset)
+            dataset_name in self._get_index(pipeline).inputs
+            and (
+                self._is_in_catalog(dataset_name)
+                or dataset_name in self._sliced_off_inputs
+            )
+            and not self._get_asset_dataset(dataset_name)
+        )
+
+    def _get_step_inputs(self, pipeline: Pipeline, nodes: List[Node]) -> List[str]:
+        """Inputs of the nodes, which are not produced by the nodes of the same step"""
+        node_names = {node.name for node in nodes}
+        producers = self._get_index(pipeline).producers
+        return list(
+            dict.fromkeys(
+                name
+                for node in nodes
+                for name in node.inputs
+                if name not in producers or producers[name].name not in node_names
+            )
         )
 
-    def _construct_azure_command(
+    def _get_step_outputs(self, pipeline: Pipeline, nodes: List[Node]) -> List[str]:
+        """
+        Outputs of the nodes, which are used outside of the step (or are pipeline outputs) or have to be saved
+        to the paths provided by Azure ML. The other ones are passed between the nodes of the step in memory.
+        """
+        if len(nodes) == 1:
+            return list(nodes[0].outputs)
+        index = self._get_index(pipeline)
+        node_names = {node.name for node in nodes}
+        return [
+            name
+            for node in nodes
+            for name in node.outputs
+            if name in index.outputs
+            or any(c.name not in node_names for c in index.consumers[name])
+            or (
+                self._is_in_catalog(name)
+                and isinstance(self.catalog[name], AzureMLPipelineDataset)
+            )
+        ]
+
+    def _get_command_kwargs(
         self,
         pipeline: Pipeline,
-        node: Node,
+        step_name: str,
+        nodes: List[Node],
         kedro_azure_run_id: str,
-    ):
+        namespace: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        node = nodes[0]
         command_kwargs = {}
-        command_kwargs.update(self._get_distributed_azure_command_kwargs(node))
+        step_fingerprint = self._step_fingerprints.get(step_name)
+        if len(nodes) == 1:
+            command_kwargs.update(self._get_distributed_azure_command_kwargs(node))
         pipeline_data_passing = (
             self.config.azure.pipeline_data_passing is not None
             and self.config.azure.pipeline_data_passing.enabled
         )
 
-        return command(
-            name=self._sanitize_azure_name(node.name),
-            display_name=node.name,
-            command=self._prepare_command(node, pipeline),
+        step_name = self._get_relative_name(step_name, namespace)
+        self._check_port_names(
+            [
+                *self._get_step_inputs(pipeline, nodes),
+                *self._get_step_outputs(pipeline, nodes),
+            ],
+            namespace,
+        )
+        inputs = {
+            self._get_port_name(name, namespace): self._get_input(name, pipeline)
+            for name in self._get_step_inputs(pipeline, nodes)
+        }
+        if namespace is not None:
+            inputs[NAMESPACE_INPUT] = Input(type="string")
+
+        return dict(
+            name=self._sanitize_azure_name(step_name),
+            display_name=step_name
+            if len(nodes) == 1
+            else f"{step_name} ({len(nodes)} nodes)",
+            command=self._prepare_command(nodes, pipeline, namespace),
             compute=self.get_target_resource_from_node_tags(node).cluster_name,
             environment_variables={
                 KEDRO_AZURE_RUNNER_CONFIG: KedroAzureRunnerConfig(
                     temporary_storage=self.config.azure.temporary_storage,
-                    run_id=kedro_azure_run_id,
+                    # the reused steps cannot depend on the run ID
+                    run_id=step_fingerprint or kedro_azure_run_id,
                     storage_account_key=self.storage_account_key,
+                    input_run_ids={
+                        name: self.previous_run_id
+                        for name in self._get_temporary_sliced_off_inputs()
+                        if any(name in n.inputs for n in nodes)
+                    },
                 ).model_dump_json()
                 if not pipeline_data_passing
                 else "",
+                **(
+                    {KEDRO_AZURE_STEP_FINGERPRINT: step_fingerprint}
+                    if step_fingerprint
+                    else {}
+                ),
+                **(
+                    {KEDRO_AZURE_RUN_ID: kedro_azure_run_id}
+                    if any(self._registers_own_versions(n) for n in nodes)
+                    else {}
+                ),
+                **(
+                    {KEDRO_AZURE_LOAD_VERSIONS: json.dumps(load_versions)}
+                    if (load_versions := self._get_appended_load_versions(nodes))
+                    else {}
+                ),
                 **self.extra_env,
             },
             environment=self._resolve_azure_environment(),  # TODO: check whether Environment exists
-            inputs={
-                self._sanitize_param_name(name): self._get_input(name, pipeline)
-                for name in node.inputs
-            },
+            inputs=inputs,
             outputs={
-                self._sanitize_param_name(name): self._get_output(name)
-                for name in node.outputs
+                self._get_port_name(name, namespace): self._get_output(
+                    name, kedro_azure_run_id
+                )
+                for name in self._get_step_outputs(pipeline, nodes)
             },
-            code=self.config.azure.code_directory,
-            is_deterministic=("deterministic" in node.tags),
+            code=self._resolve_code(),
+            is_deterministic=self._is_deterministic(nodes, step_fingerprint),
             **command_kwargs,
         )
 
+    @staticmethod
+    def _get_shard_port_name(port: str, shard_index: int) -> str:
+        return f"{port}_shard_{shard_index}"
+
+    def _get_parallel_command_kwargs(
+        self,
+        pipeline: Pipeline,
+        node: Node,
+        command_kwargs: Dict[str, Any],
+        namespace: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Splits the step of the parallel node into the steps processing the shards of the partitions, saving
+        their parts of the output under the shard datasets' names, and the step merging them into the output
+        """
+        config: ParallelNodeConfig = getattr(node.func, PARALLEL_CONFIG_FIELD)
+        if self._is_distributed(node):
+            raise ConfigException(
+                f"Node {node.name} cannot be both distributed and parallel"
+            )
+        if len(node.outputs) != 1:
+            raise ConfigException(
+                f"Parallel node {node.name} has to have exactly one output"
+            )
+        instance_count: int = self._from_params_or_value(
+            node.namespace, config.instance_count, hint="instance_count"
+        )
+        mini_batch_size: Optional[int] = (
+            self._from_params_or_value(
+                node.namespace, config.mini_batch_size, hint="mini_batch_size"
+            )
+            if config.mini_batch_size is not None
+            else None
+        )
+        if instance_count < 1:
+            raise ValueError(
+                f"Expected a positive instance_count of parallel node {node.name}, got {instance_count}"
+            )
+
+        name, display_name = command_kwargs["name"], command_kwargs["display_name"]
+        shards = [
+            dict(
+                command_kwargs,
+                name=f"{name}_shard_{shard_index}",
+                display_name=f"{display_name} [{shard_index + 1}/{instance_count}]",
+                command=self._prepare_command(
+                    [node], pipeline, namespace, shard=shard_index
+                ),
+                environment_variables={
+                    **command_kwargs["environment_variables"],
+                    KEDRO_AZURE_PARALLEL_SHARD: ParallelShard(
+                        shard_index, instance_count, mini_batch_size
+                    ).to_json(),
+                },
+                outputs={
+                    port: Output(type="uri_folder")
+                    for port in command_kwargs["outputs"]
+                },
+            )
+            for shard_index in range(instance_count)
+        ]
+        merge_inputs = {
+            self._get_shard_port_name(port, shard_index): Input(type="uri_folder")
+            for shard_index in range(instance_count)
+            for port in command_kwargs["outputs"]
+        }
+        if NAMESPACE_INPUT in command_kwargs["inputs"]:
+            merge_inputs[NAMESPACE_INPUT] = Input(type="string")
+        merge = dict(
+            command_kwargs,
+            name=f"{name}_merge",
+            display_name=f"{display_name} (merge)",
+            command=self._prepare_command(
+                [node], pipeline, namespace, merged_shards=instance_count
+            ),
+            inputs=merge_inputs,
+        )
+        return shards, merge
+
     def _get_distributed_azure_command_kwargs(self, node) -> dict:
         azure_command_kwargs = {}
         if hasattr(node.func, DISTRIBUTED_CONFIG_FIELD) and isinstance(
@@ -292,85 +1431,62 @@ class AzureMLPipelineGenerator:
             }[distributed_config.framework]
         return azure_command_kwargs
 
-    def _gather_pipeline_outputs(self, pipeline: Pipeline, invoked_components):
-        azure_pipeline_outputs = {}
-        for pipeline_output in pipeline.outputs():
-            sanitized_output_name = self._sanitize_param_name(pipeline_output)
-            source_node = next(
-                (n for n in pipeline.nodes if pipeline_output in n.outputs), None
-            )
-            assert (
-                source_node is not None
-            ), f"There is no node which outputs `{pipeline_output}` dataset"
-            azure_pipeline_outputs[sanitized_output_name] = invoked_components[
-                source_node.name
-            ].outputs[sanitized_output_name]
-        return azure_pipeline_outputs
-
-    def _connect_commands(self, pipeline: Pipeline, commands: Dict[str, Command]):
+    def _prepare_command(
+        self,
+        nodes: List[Node],
+        pipeline,
+        namespace: Optional[str] = None,
+        shard: Optional[int] = None,
+        merged_shards: Optional[int] = None,
+    ):
         """
-        So far, only standalone commands were constructed, this method
-        connects command inputs with command outputs, to build the actual execution graph.
-        Connection is done by "invoking" the commands, so the Azure's DSL builds them here
-        :param pipeline:
-        :param commands:
-        :return:
+        Command of the step. The shards of the parallel node save the output under the shard datasets' names,
+        the merge step reads the shard datasets instead of the inputs of the node.
         """
-        node_deps = pipeline.node_dependencies
-        invoked_components = {}
-        for node in pipeline.nodes:  # pipeline.nodes are sorted topologically
-            dependencies = node_deps[node]
-            azure_inputs = {}
-            for node_input in node.inputs:
-                # 1. try to find output in dependencies
-                sanitized_input_name = self._sanitize_param_name(node_input)
-                output_from_deps = next(
-                    (d for d in dependencies if node_input in d.outputs), None
+        if merged_shards:
+            input_data_paths = [
+                f"--az-input={get_shard_dataset_name(self._render_name(name, namespace), shard_index)} "
+                + "${{inputs."
+                + self._get_shard_port_name(
+                    self._get_port_name(name, namespace), shard_index
                 )
-                if output_from_deps:
-                    parent_outputs = invoked_components[output_from_deps.name].outputs
-                    azure_output = parent_outputs[sanitized_input_name]
-                    azure_inputs[sanitized_input_name] = azure_output
-                # 2. try to find AzureMLAssetDataset in catalog
-                elif node_input in self.catalog.filter() and isinstance(
-                    ds := self.catalog[node_input], AzureMLAssetDataset
-                ):
-                    azure_inputs[sanitized_input_name] = Input(
-                        type=ds._azureml_type,
-                        path=self._get_versioned_azureml_dataset_name(
-                            node_input, ds._azureml_dataset
-                        ),
-                    )
-                # 3. if not found, provide dummy input
-                else:
-                    azure_inputs[sanitized_input_name] = node_input
-            invoked_components[node.name] = commands[node.name](**azure_inputs)
-        return invoked_components
-
-    def _prepare_command(self, node, pipeline):
-        input_data_paths = (
-            [
-                f"--az-input={name} "
+                + "}}"
+                for shard_index in range(merged_shards)
+                for name in self._get_step_outputs(pipeline, nodes)
+            ]
+            params = [f"--merge-shards={merged_shards}"]
+        else:
+            input_data_paths = [
+                f"--az-input={self._render_name(name, namespace)} "
                 + "${{inputs."
-                + self._sanitize_param_name(name)
+                + self._get_port_name(name, namespace)
                 + "}}"
-                for name in node.inputs
+                for name in self._get_step_inputs(pipeline, nodes)
                 if not self._is_param_or_root_non_azureml_asset_dataset(name, pipeline)
             ]
-            if node.inputs
-            else []
-        )
-        output_data_paths = (
-            [
-                f"--az-output={name} "
-                + "${{outputs."
-                + self._sanitize_param_name(name)
-                + "}}"
-                for name in node.outputs
+            # the values of the parameters are read from the ``AZURE_ML_INPUT_<port>`` environment variables,
+            # they can be set to anything when the pipeline is re-submitted and cannot be quoted in the command
+            params = [
+                f"--az-param-input={self._render_name(name[len(PARAMS_PREFIX):], namespace)} "
+                + f"{self._get_param_type_and_value(name)[0]} "
+                + self._get_port_name(name, namespace)
+                for name in self._get_step_inputs(pipeline, nodes)
+                if name.startswith(PARAMS_PREFIX)
             ]
-            if node.outputs
-            else []
-        )
+
+        def render_output_name(name: str) -> str:
+            rendered_name = self._render_name(name, namespace)
+            if shard is None:
+                return rendered_name
+            return get_shard_dataset_name(rendered_name, shard)
+
+        output_data_paths = [
+            f"--az-output={render_output_name(name)} "
+            + "${{outputs."
+            + self._get_port_name(name, namespace)
+            + "}}"
+            for name in self._get_step_outputs(pipeline, nodes)
+        ]
         return (
             (
                 f"cd {self.config.azure.working_directory} && "
@@ -378,7 +1494,16 @@ class AzureMLPipelineGenerator:
                 and self.config.azure.code_directory is None
                 else ""
             )
-            + f"kedro azureml -e {self.kedro_environment} execute --pipeline={self.pipeline_name} --node={node.name} "  # noqa
-            + " ".join(input_data_paths + output_data_paths)
-            + (f" --params='{self.params}'" if self.params else "")
+            + f"kedro azureml -e {self.kedro_environment} execute --pipeline={self.pipeline_name} "  # noqa
+            + "".join(
+                f"--node={self._render_name(node.name, namespace)} " for node in nodes
+            )
+            + " ".join(input_data_paths + output_data_paths + params)
+            # the whole set of the runtime params is needed by the config (e.g. ``${runtime_params:...}``)
+            # and the hooks of the steps, the typed ``--az-param-input`` inputs override it
+            + (
+                " --params='" + self.params.replace("'", "\\u0027") + "'"
+                if self.params
+                else ""
+            )
         ).strip()
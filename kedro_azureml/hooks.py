@@ -1,13 +1,27 @@
+import logging
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
 from kedro.framework.hooks import hook_impl
 
 from kedro_azureml.config import AzureMLConfig
 from kedro_azureml.datasets.asset_dataset import AzureMLAssetDataset
 from kedro_azureml.runner import AzurePipelinesRunner
 
+logger = logging.getLogger(__name__)
+
 
 class AzureMLLocalRunHook:
     """Hook class that allows local runs using AML datasets."""
 
+    def __init__(self):
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        # download locks and markers of the assets loaded by the current run
+        self._download_session_dir: Optional[Path] = None
+
     @hook_impl
     def after_context_created(self, context) -> None:
         if "azureml" not in context.config_loader.config_patterns.keys():
@@ -32,10 +46,16 @@ class AzureMLLocalRunHook:
             pipeline: The ``Pipeline`` object representing the pipeline to be run.
             catalog: The ``DataCatalog`` from which to fetch data.
         """
+        is_local_run = AzurePipelinesRunner.__name__ not in run_params["runner"]
+        self._remove_download_session_dir()
+        self._download_session_dir = Path(
+            tempfile.mkdtemp(prefix="kedro-azureml-downloads-")
+        )
         for dataset_name in catalog.filter():
             dataset = catalog[dataset_name]
             if isinstance(dataset, AzureMLAssetDataset):
-                if AzurePipelinesRunner.__name__ not in run_params["runner"]:
+                dataset.use_download_session_dir(self._download_session_dir)
+                if is_local_run:
                     # when running locally using an AzureMLAssetDataset
                     # as an intermediate dataset we don't want download
                     # but still set to run local with a local version.
@@ -49,5 +69,65 @@ class AzureMLLocalRunHook:
 
                 catalog[dataset_name] = dataset
 
+        local_run_config = self.azure_config.local_run
+        if is_local_run and local_run_config is not None and local_run_config.prefetch:
+            self._prefetch_pipeline_inputs(
+                pipeline, catalog, local_run_config.prefetch_workers
+            )
+
+    @hook_impl
+    def after_pipeline_run(self):
+        self._stop_prefetching()
+        self._remove_download_session_dir()
+
+    @hook_impl
+    def on_pipeline_error(self):
+        self._stop_prefetching()
+        self._remove_download_session_dir()
+
+    def _remove_download_session_dir(self):
+        if self._download_session_dir is not None:
+            shutil.rmtree(self._download_session_dir, ignore_errors=True)
+            self._download_session_dir = None
+
+    def _get_datasets_to_prefetch(self, pipeline, catalog) -> List[str]:
+        """Returns names of the AzureMLAssetDatasets which are pipeline inputs,
+        ordered by the topological position of the first node consuming them.
+        """
+        pipeline_inputs = pipeline.inputs()
+        catalog_names = set(catalog.filter())
+        to_prefetch = []
+        for node in pipeline.nodes:  # pipeline.nodes are sorted topologically
+            for dataset_name in node.inputs:
+                if (
+                    dataset_name in pipeline_inputs
+                    and dataset_name in catalog_names
+                    and dataset_name not in to_prefetch
+                    and isinstance(catalog[dataset_name], AzureMLAssetDataset)
+                    and catalog[dataset_name]._needs_download
+                ):
+                    to_prefetch.append(dataset_name)
+        return to_prefetch
+
+    def _prefetch_pipeline_inputs(self, pipeline, catalog, max_workers: int):
+        if not (to_prefetch := self._get_datasets_to_prefetch(pipeline, catalog)):
+            return
+
+        logger.info(
+            f"Prefetching {len(to_prefetch)} Azure ML data assets in the background: "
+            f"{', '.join(to_prefetch)}"
+        )
+        self._stop_prefetching()
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kedro-azureml-prefetch"
+        )
+        for dataset_name in to_prefetch:
+            catalog[dataset_name].prefetch(self._prefetch_executor)
+
+    def _stop_prefetching(self):
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
 
 azureml_local_run_hook = AzureMLLocalRunHook()
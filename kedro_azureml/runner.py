@@ -1,26 +1,54 @@
+import json
 import logging
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from kedro.io import AbstractDataset, DataCatalog
-from kedro.pipeline import Pipeline
+from kedro.pipeline import Pipeline, node
+from kedro.pipeline import pipeline as modular_pipeline
 from kedro.runner import SequentialRunner
 from kedro_datasets.pickle import PickleDataset
 from pluggy import PluginManager
 
 from kedro_azureml.config import KedroAzureRunnerConfig
-from kedro_azureml.constants import KEDRO_AZURE_RUNNER_CONFIG
+from kedro_azureml.constants import (
+    KEDRO_AZURE_LOAD_VERSIONS,
+    KEDRO_AZURE_RUNNER_CONFIG,
+)
 from kedro_azureml.datasets import (
     AzureMLPipelineDataset,
     KedroAzureRunnerDataset,
     KedroAzureRunnerDistributedDataset,
 )
 from kedro_azureml.datasets.asset_dataset import AzureMLAssetDataset
+from kedro_azureml.distributed.parallel import (
+    ParallelShard,
+    get_shard_dataset_name,
+    merge_partitions,
+)
 from kedro_azureml.distributed.utils import is_distributed_environment
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_MARKER_FILE = "output.txt"
+
+
+def read_output_marker(data_path: str) -> Optional[str]:
+    """Run ID under which the step saved the output to the temporary storage, None if it's not a step output"""
+    marker = Path(data_path) / OUTPUT_MARKER_FILE
+    if not marker.is_file():
+        return None
+    return marker.read_text().strip() or None
+
+
+def write_output_marker(data_path: str, run_id: str):
+    (Path(data_path) / OUTPUT_MARKER_FILE).write_text(run_id)
+
+
+def _merge_shards(*shards):
+    return merge_partitions(shards)
+
 
 class AzurePipelinesRunner(SequentialRunner):
     def __init__(
@@ -28,6 +56,8 @@ class AzurePipelinesRunner(SequentialRunner):
         is_async: bool = False,
         data_paths: Optional[Dict[str, str]] = None,
         pipeline_data_passing: bool = False,
+        storage_run_id: Optional[str] = None,
+        input_storage_run_ids: Optional[Dict[str, str]] = None,
     ):
         super().__init__(is_async)
         self.pipeline_data_passing = pipeline_data_passing
@@ -38,6 +68,19 @@ class AzurePipelinesRunner(SequentialRunner):
             else None
         )
         self.data_paths = data_paths if data_paths is not None else {}
+        # run ID under which the outputs are saved to the temporary storage and the ones under which
+        # the inputs were saved (the steps reused by Azure ML were run with different run IDs)
+        self.storage_run_id = storage_run_id or (
+            self.runner_config.run_id if self.runner_config else None
+        )
+        self.input_storage_run_ids = {
+            **(self.runner_config.input_run_ids if self.runner_config else {}),
+            **(input_storage_run_ids or {}),
+        }
+        # pinned versions of the inputs saved in the `append` mode
+        self.load_versions: Dict[str, str] = json.loads(
+            os.environ.get(KEDRO_AZURE_LOAD_VERSIONS, "{}")
+        )
 
     def run(
         self,
@@ -47,6 +90,16 @@ class AzurePipelinesRunner(SequentialRunner):
         only_missing_outputs: bool = False,
         run_id: str = None,
     ) -> Dict[str, Any]:
+        if (shard := ParallelShard.from_env()) is not None:
+            # the shard of the parallel node saves its part of the output under the shard dataset's name
+            pipeline = modular_pipeline(
+                pipeline,
+                outputs={
+                    name: get_shard_dataset_name(name, shard.index)
+                    for name in pipeline.outputs()
+                },
+            )
+
         # Preserve Azure configs from existing datasets before copying
         azure_configs = {}
         for ds_name in catalog.filter():
@@ -84,6 +137,11 @@ class AzurePipelinesRunner(SequentialRunner):
                         ds.root_dir = str(Path(azure_dataset_path).parent)
                     else:
                         ds.root_dir = azure_dataset_path
+                    if (
+                        isinstance(ds, AzureMLAssetDataset)
+                        and ds_name in self.load_versions
+                    ):
+                        ds._azureml_version = self.load_versions[ds_name]
                     updated_catalog[ds_name] = ds
             else:
                 updated_catalog[ds_name] = self.create_default_data_set(ds_name)
@@ -101,6 +159,31 @@ class AzurePipelinesRunner(SequentialRunner):
             run_id=run_id,
         )
 
+    def merge_shards(
+        self, pipeline: Pipeline, catalog: DataCatalog, shard_count: int
+    ) -> Dict[str, Any]:
+        """Merges the parts of the outputs of the parallel node, saved by its shards, into the outputs"""
+        merge_pipeline = Pipeline(
+            [
+                node(
+                    _merge_shards,
+                    inputs=[
+                        get_shard_dataset_name(name, index)
+                        for index in range(shard_count)
+                    ],
+                    outputs=name,
+                    name=f"merge_shards_of_{name}",
+                )
+                for name in sorted(pipeline.outputs())
+            ]
+        )
+        for name in merge_pipeline.outputs():
+            if name in catalog.filter() and isinstance(
+                ds := catalog[name], AzureMLAssetDataset
+            ):
+                ds.as_remote()
+        return self.run(merge_pipeline, catalog)
+
     def create_default_data_set(self, ds_name: str) -> AbstractDataset:
         if self.pipeline_data_passing:
             return AzureMLPipelineDataset(
@@ -124,5 +207,5 @@ class AzurePipelinesRunner(SequentialRunner):
                 self.runner_config.temporary_storage.container,
                 self.runner_config.storage_account_key,
                 ds_name,
-                self.runner_config.run_id,
+                self.input_storage_run_ids.get(ds_name, self.storage_run_id),
             )
@@ -26,3 +26,14 @@ def update_dict(dictionary, *kv_pairs):
     for k, v in kv_pairs:
         traverse(updated, k, v)
     return updated
+
+
+def merge_dicts(dictionary, overrides):
+    """Return a deep copy of dictionary with values recursively overridden by the ones from overrides"""
+    merged = deepcopy(dictionary)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_dicts(merged[key], value)
+        else:
+            merged[key] = deepcopy(value)
+    return merged
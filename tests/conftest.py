@@ -1,6 +1,8 @@
+import hashlib
 import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -11,6 +13,7 @@ from kedro.io.core import Version
 from kedro.pipeline import Pipeline, node, pipeline
 from kedro_datasets.pandas import CSVDataset, ParquetDataset
 
+from kedro_azureml.auth.utils import clear_credentials_cache
 from kedro_azureml.config import (
     _CONFIG_TEMPLATE,
     AzureTempStorageConfig,
@@ -19,11 +22,31 @@ from kedro_azureml.config import (
 )
 from kedro_azureml.constants import KEDRO_AZURE_RUNNER_CONFIG
 from kedro_azureml.datasets import AzureMLAssetDataset, KedroAzureRunnerDataset
+from kedro_azureml.generator import AzureMLPipelineGenerator
 from kedro_azureml.runner import AzurePipelinesRunner
 from kedro_azureml.utils import CliContext
 from tests.utils import identity
 
 
+@pytest.fixture(autouse=True)
+def isolated_compile_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "kedro_azureml.compile_cache.COMPILE_CACHE_DIR", tmp_path / "compile-cache"
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_azure_credentials(tmp_path, monkeypatch):
+    """Every test resolves the credentials anew and does not touch the user's auth state"""
+    monkeypatch.setattr(
+        "kedro_azureml.auth.utils.AUTH_STATE_PATH",
+        tmp_path / ".kedro-azureml-auth.json",
+    )
+    clear_credentials_cache()
+    yield
+    clear_credentials_cache()
+
+
 @pytest.fixture()
 def dummy_pipeline() -> Pipeline:
     return pipeline(
@@ -74,6 +97,32 @@ def dummy_plugin_config() -> KedroAzureMLConfig:
     return _CONFIG_TEMPLATE.model_copy(deep=True)
 
 
+@pytest.fixture()
+def generator_factory(request, dummy_pipeline, dummy_plugin_config):
+    """
+    Creates the generators of ``dummy_pipeline`` (or of the Kedro pipeline passed) with ``dummy_plugin_config``,
+    the keyword arguments and the indirect parameters of the fixture override the arguments of the generator
+    """
+    defaults = {
+        "pipeline_name": "dummy_pipeline",
+        "kedro_environment": "unit_test_env",
+        "config": dummy_plugin_config,
+        "kedro_params": {},
+        "catalog": DataCatalog(),
+        "aml_env": "unit_test_aml_env@latest",
+        **getattr(request, "param", {}),
+    }
+
+    def factory(kedro_pipeline=None, **kwargs) -> AzureMLPipelineGenerator:
+        generator = AzureMLPipelineGenerator(**{**defaults, **kwargs})
+        generator.get_kedro_pipeline = MagicMock(
+            return_value=dummy_pipeline if kedro_pipeline is None else kedro_pipeline
+        )
+        return generator
+
+    return factory
+
+
 @pytest.fixture()
 def patched_kedro_package():
     with patch("kedro.framework.project.PACKAGE_NAME", "tests") as patched_package:
@@ -301,3 +350,50 @@ def multi_catalog():
         version=Version(None, None),
     )
     return DataCatalog({"input_data": csv, "i2": parq})
+
+
+class FakeContainerClient:
+    """In-memory stand-in for azure.storage.blob.ContainerClient"""
+
+    def __init__(self, blobs: dict, failures: dict = None):
+        self.blobs = blobs
+        self.failures = failures or {}
+        self.downloads = []
+
+    def list_blobs(self, name_starts_with="", include=None):
+        for name, content in sorted(self.blobs.items()):
+            if name.startswith(name_starts_with):
+                yield SimpleNamespace(
+                    name=name,
+                    size=len(content),
+                    etag=f"etag-{hash(content)}",
+                    metadata={},
+                    content_settings=SimpleNamespace(
+                        content_md5=hashlib.md5(content).digest()
+                    ),
+                )
+
+    def download_blob(self, name, max_concurrency=1):
+        self.downloads.append(name)
+        if self.failures.get(name, 0) > 0:
+            self.failures[name] -= 1
+            raise IOError(f"Simulated failure for {name}")
+        content = self.blobs[name]
+
+        def readinto(stream):
+            stream.write(content)
+            return len(content)
+
+        return SimpleNamespace(readinto=readinto)
+
+
+@pytest.fixture
+def fake_container_client():
+    return FakeContainerClient(
+        {
+            "assets/events/part=1/data.parquet": b"partition 1",
+            "assets/events/part=2/data.parquet": b"partition 2",
+            "assets/events/part=3/data.parquet": b"partition 3",
+            "assets/events_old/data.parquet": b"other asset",
+        }
+    )
@@ -0,0 +1,85 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from azure.identity import AzureCliCredential, ChainedTokenCredential
+
+from kedro_azureml.auth import utils
+from kedro_azureml.auth.utils import get_azureml_credentials
+from kedro_azureml.config import AuthConfig
+
+
+@pytest.fixture()
+def default_credential():
+    with patch("kedro_azureml.auth.utils.DefaultAzureCredential") as default:
+        default.return_value._successful_credential = AzureCliCredential()
+        yield default
+
+
+def test_credentials_are_resolved_once_per_process(default_credential):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        credentials = list(executor.map(lambda _: get_azureml_credentials(), range(32)))
+
+    assert all(c is credentials[0] for c in credentials)
+    default_credential.assert_called_once()
+    default_credential.return_value.get_token.assert_called_once()
+
+
+def test_credentials_are_resolved_per_auth_config(default_credential):
+    with patch("kedro_azureml.auth.utils._resolve_credentials") as resolve:
+        resolve.side_effect = lambda auth_config: object()
+        default = get_azureml_credentials()
+        assert get_azureml_credentials(AuthConfig()) is default
+        persistent = get_azureml_credentials(AuthConfig(persistent_token_cache=True))
+
+    assert persistent is not default
+    assert [c.args[0].persistent_token_cache for c in resolve.call_args_list] == [
+        False,
+        True,
+    ]
+
+
+def test_successful_chain_member_is_not_remembered_when_unknown(default_credential):
+    del default_credential.return_value._successful_credential
+    assert get_azureml_credentials() is default_credential.return_value
+    assert not utils.AUTH_STATE_PATH.exists()
+
+
+def test_successful_chain_member_is_remembered(default_credential):
+    get_azureml_credentials()
+    assert json.loads(utils.AUTH_STATE_PATH.read_text()) == {
+        "credential": "AzureCliCredential"
+    }
+
+    # next process
+    utils.clear_credentials_cache()
+    default_credential.reset_mock()
+    credential = get_azureml_credentials()
+
+    assert isinstance(credential, ChainedTokenCredential)
+    assert isinstance(credential.credentials[0], AzureCliCredential)
+    default_credential.return_value.get_token.assert_not_called()
+
+
+def test_falls_back_to_interactive_credential_with_persistent_cache():
+    with patch(
+        "kedro_azureml.auth.utils.DefaultAzureCredential", side_effect=ValueError()
+    ), patch("kedro_azureml.auth.utils.InteractiveBrowserCredential") as interactive:
+        interactive.return_value.authenticate.return_value.serialize.return_value = (
+            "record"
+        )
+        get_azureml_credentials(AuthConfig(persistent_token_cache=True))
+        assert interactive.call_args.kwargs["authentication_record"] is None
+        assert interactive.call_args.kwargs["cache_persistence_options"].name == (
+            utils.TOKEN_CACHE_NAME
+        )
+
+        # next process re-uses the login without probing DefaultAzureCredential
+        utils.clear_credentials_cache()
+        with patch(
+            "kedro_azureml.auth.utils.AuthenticationRecord"
+        ) as authentication_record:
+            get_azureml_credentials(AuthConfig(persistent_token_cache=True))
+        authentication_record.deserialize.assert_called_once_with("record")
+        interactive.return_value.authenticate.assert_called_once()
@@ -1,4 +1,6 @@
+import json
 import os
+import shlex
 from pathlib import Path
 from typing import List
 from unittest import mock
@@ -9,13 +11,26 @@ import pytest
 import yaml
 from click.testing import CliRunner
 from kedro.framework.startup import ProjectMetadata
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
 
 from kedro_azureml import cli
+from kedro_azureml.cli_functions import (
+    get_cluster_names,
+    get_step_storage_run_id,
+)
+from kedro_azureml.client import AzureMLWorkspaceConnection
+from kedro_azureml.compile_cache import RUN_ID_PLACEHOLDER
 from kedro_azureml.config import KedroAzureMLConfig
-from kedro_azureml.constants import KEDRO_AZURE_RUNNER_DATASET_TIMEOUT
-from kedro_azureml.generator import AzureMLPipelineGenerator
+from kedro_azureml.constants import (
+    KEDRO_AZURE_RUN_ID_TAG,
+    KEDRO_AZURE_RUNNER_DATASET_TIMEOUT,
+    KEDRO_AZURE_STEP_FINGERPRINT,
+)
+from kedro_azureml.generator import AzureMLPipelineGenerator, ConfigException
+from kedro_azureml.runner import read_output_marker, write_output_marker
 from kedro_azureml.utils import CliContext
-from tests.utils import create_kedro_conf_dirs
+from tests.utils import create_kedro_conf_dirs, identity
 
 
 @pytest.mark.parametrize(
@@ -161,14 +176,69 @@ def test_can_compile_pipeline(
             obj=cli_context,
         )
         assert result.exit_code == 0
+        assert "Compile cache miss for pipeline __default__" in result.output
         assert isinstance(p := yaml.safe_load(output_path.read_text()), dict) and all(
             k in p for k in ("display_name", "type", "jobs")
         )
 
+        result = runner.invoke(
+            cli.compile,
+            ["--output", str(output_path.absolute()), "--params", runtime_params],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0
+        assert "Compile cache hit for pipeline __default__" in result.output
+        assert (
+            yaml.safe_load(output_path.read_text())["jobs"].keys() == p["jobs"].keys()
+        )
+
         if not storage_account_key:
             click_prompt.assert_called()
 
 
+def test_can_compile_sliced_pipeline(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    dummy_plugin_config,
+    tmp_path: Path,
+):
+    with patch.object(
+        AzureMLPipelineGenerator, "get_kedro_pipeline", return_value=dummy_pipeline
+    ), patch(
+        "kedro_azureml.manager.KedroContextManager.plugin_config",
+        new_callable=mock.PropertyMock,
+        return_value=dummy_plugin_config,
+    ), patch.dict(
+        os.environ, {"AZURE_STORAGE_ACCOUNT_KEY": "dummy"}
+    ), patch.object(
+        Path, "cwd", return_value=tmp_path
+    ):
+        _ = create_kedro_conf_dirs(tmp_path)
+        runner = CliRunner()
+        output_path = tmp_path / "pipeline.yml"
+
+        def compile_jobs(*args):
+            result = runner.invoke(
+                cli.compile,
+                ["--output", str(output_path.absolute()), *args],
+                obj=cli_context,
+            )
+            assert result.exit_code == 0, result.output
+            return yaml.safe_load(output_path.read_text())
+
+        assert compile_jobs()["jobs"].keys() == {"node1", "node2", "node3"}
+        for _ in range(2):  # the sliced pipeline is cached separately
+            p = compile_jobs("--from-nodes", "node2", "--previous-run-id", "prev")
+            assert p["jobs"].keys() == {"node2", "node3"}
+            assert p["tags"][KEDRO_AZURE_RUN_ID_TAG] not in ("prev", RUN_ID_PLACEHOLDER)
+        p = compile_jobs("-n", "node1,node3", "--previous-run-id", "prev")
+        assert p["jobs"].keys() == {"node1", "node3"}
+
+        with pytest.raises(ConfigException, match="--previous-run-id"):
+            compile_jobs("--from-inputs", "i3", "--to-outputs", "output_data")
+
+
 @pytest.mark.parametrize(
     "distributed_env_variables,should_create_output",
     [
@@ -234,6 +304,242 @@ def test_can_invoke_execute_cli(
             ), "Output placeholders/datasets should not have been created"
 
 
+def test_execute_cli_runs_all_nodes_of_a_step(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    dummy_plugin_config,
+    patched_azure_runner,
+    tmp_path: Path,
+):
+    create_kedro_conf_dirs(tmp_path)
+    with patch(
+        "kedro_azureml.runner.AzurePipelinesRunner", new=patched_azure_runner
+    ), patch.dict(
+        "kedro.framework.project.pipelines", {"__default__": dummy_pipeline}
+    ), patch(
+        "kedro_azureml.manager.KedroContextManager.plugin_config",
+        new_callable=mock.PropertyMock,
+        return_value=dummy_plugin_config,
+    ), patch.object(
+        Path, "cwd", return_value=tmp_path
+    ), patch(
+        "kedro.framework.session.session.KedroSession.run"
+    ) as session_run:
+        runner = CliRunner()
+        result = runner.invoke(
+            cli.execute,
+            ["--node", "node1", "--node", "node2", "--az-output", "i3", str(tmp_path)],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+        assert session_run.call_args.kwargs["node_names"] == ["node1", "node2"]
+
+
+@pytest.mark.parametrize(
+    "step_fingerprint", (None, "fingerprint"), ids=("no step reuse", "step reuse")
+)
+def test_execute_cli_saves_outputs_under_the_storage_run_id(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    dummy_plugin_config,
+    patched_azure_runner,
+    tmp_path: Path,
+    step_fingerprint,
+):
+    create_kedro_conf_dirs(tmp_path)
+    input_path, output_path = tmp_path / "i2", tmp_path / "i3"
+    input_path.mkdir()
+    output_path.mkdir()
+    write_output_marker(str(input_path), "upstream_run_id")
+    with patch.dict(
+        "kedro.framework.project.pipelines", {"__default__": dummy_pipeline}
+    ), patch(
+        "kedro_azureml.manager.KedroContextManager.plugin_config",
+        new_callable=mock.PropertyMock,
+        return_value=dummy_plugin_config,
+    ), patch.object(
+        Path, "cwd", return_value=tmp_path
+    ), patch.dict(
+        os.environ,
+        {KEDRO_AZURE_STEP_FINGERPRINT: step_fingerprint} if step_fingerprint else {},
+    ), patch(
+        "kedro.framework.session.session.KedroSession.run"
+    ) as session_run:
+        runner = CliRunner()
+        result = runner.invoke(
+            cli.execute,
+            [
+                "--node",
+                "node2",
+                "--az-input",
+                "i2",
+                str(input_path),
+                "--az-output",
+                "i3",
+                str(output_path),
+            ],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+
+        azure_runner = session_run.call_args.kwargs["runner"]
+        assert azure_runner.input_storage_run_ids == {"i2": "upstream_run_id"}
+        if step_fingerprint:
+            expected_run_id = get_step_storage_run_id(
+                step_fingerprint, [], {"i2": "upstream_run_id"}
+            )
+        else:
+            expected_run_id = patched_azure_runner.runner_config.run_id
+        assert azure_runner.storage_run_id == expected_run_id
+        assert read_output_marker(str(output_path)) == expected_run_id
+        assert azure_runner.create_default_data_set("i2").run_id == "upstream_run_id"
+        assert azure_runner.create_default_data_set("i3").run_id == expected_run_id
+
+
+def test_execute_cli_passes_azure_params_as_runtime_params(
+    patched_kedro_package, cli_context, tmp_path: Path
+):
+    create_kedro_conf_dirs(tmp_path)
+    with patch.object(Path, "cwd", return_value=tmp_path), patch(
+        "kedro_azureml.cli.KedroContextManager"
+    ) as context_manager:
+        runner = CliRunner()
+        result = runner.invoke(
+            cli.execute,
+            [
+                "--node",
+                "node1",
+                "--params",
+                '{"alpha": 1, "model": {"depth": 1, "name": "m"}}',
+                "--az-param",
+                "model.depth",
+                "integer",
+                "3",
+                "--az-param",
+                "verbose",
+                "boolean",
+                "True",
+                "--az-param",
+                "lr",
+                "number",
+                "0.5",
+                "--az-param",
+                "layers",
+                "json",
+                "[1, 2]",
+            ],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+        assert context_manager.call_args.kwargs["runtime_params"] == {
+            "alpha": 1,
+            "model": {"depth": 3, "name": "m"},
+            "verbose": True,
+            "lr": 0.5,
+            "layers": [1, 2],
+        }
+
+
+def test_execute_cli_reads_azure_param_inputs_from_environment(
+    patched_kedro_package, cli_context, tmp_path: Path
+):
+    create_kedro_conf_dirs(tmp_path)
+    with patch.object(Path, "cwd", return_value=tmp_path), patch(
+        "kedro_azureml.cli.KedroContextManager"
+    ) as context_manager, patch.dict(
+        os.environ,
+        {"AZURE_ML_INPUT_params_name": '"it\'s"', "AZURE_ML_INPUT_params_lr": "0.5"},
+    ):
+        runner = CliRunner()
+        result = runner.invoke(
+            cli.execute,
+            [
+                "--node",
+                "node1",
+                "--az-param-input",
+                "name",
+                "json",
+                "params_name",
+                "--az-param-input",
+                "lr",
+                "number",
+                "params_lr",
+            ],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+        assert context_manager.call_args.kwargs["runtime_params"] == {
+            "name": "it's",
+            "lr": 0.5,
+        }
+
+        result = runner.invoke(
+            cli.execute,
+            ["--node", "node1", "--az-param-input", "depth", "integer", "params_x"],
+            obj=cli_context,
+        )
+        assert result.exit_code != 0
+        assert "AZURE_ML_INPUT_params_x" in result.output
+
+
+def test_execute_cli_resolves_runtime_params_in_catalog(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    dummy_plugin_config,
+    patched_azure_runner,
+    tmp_path: Path,
+):
+    config_path = create_kedro_conf_dirs(tmp_path)
+    (tmp_path / "input.txt").write_text("yolo")
+    (config_path / "catalog.yml").write_text(
+        yaml.safe_dump(
+            {
+                name: {
+                    "type": "text.TextDataset",
+                    "filepath": f"${{runtime_params:data_dir}}/{filename}",
+                }
+                for name, filename in (
+                    ("input_data", "input.txt"),
+                    ("i2", "${runtime_params:output_name}.txt"),
+                )
+            }
+        )
+    )
+    runtime_params = {"data_dir": str(tmp_path), "output_name": "it's here"}
+    with patch.object(
+        AzureMLPipelineGenerator, "get_kedro_pipeline", return_value=dummy_pipeline
+    ):
+        az_pipeline = AzureMLPipelineGenerator(
+            "__default__",
+            "base",
+            dummy_plugin_config,
+            runtime_params,
+            catalog=DataCatalog({"input_data": MemoryDataset()}),
+            aml_env="unit_test/aml_env@latest",
+            params=json.dumps(runtime_params),
+        ).generate()
+    command = az_pipeline.jobs["node1"].command.replace(
+        "${{outputs.i2}}", str(tmp_path)
+    )
+    args = shlex.split(command.split(" execute ", 1)[1])
+
+    with patch.dict(
+        "kedro.framework.project.pipelines", {"__default__": dummy_pipeline}
+    ), patch(
+        "kedro_azureml.manager.KedroContextManager.plugin_config",
+        new_callable=mock.PropertyMock,
+        return_value=dummy_plugin_config,
+    ), patch.object(
+        Path, "cwd", return_value=tmp_path
+    ):
+        result = CliRunner().invoke(cli.execute, args, obj=cli_context)
+        assert result.exit_code == 0, result.output
+    assert (tmp_path / "it's here.txt").read_text() == "yolo"
+
+
 @pytest.mark.parametrize(
     "wait_for_completion", (False, True), ids=("no wait", "wait for completion")
 )
@@ -316,7 +622,11 @@ def test_can_invoke_run(
         result = runner.invoke(
             cli.run,
             ["-s", "subscription_id"]
-            + (["--wait-for-completion"] if wait_for_completion else [])
+            + (
+                ["--wait-for-completion", "--stream-logs"]
+                if wait_for_completion
+                else []
+            )
             + (["--aml-env", aml_env] if aml_env else [])
             + (sum([["--env-var", k] for k in extra_env[0]], []))
             + (
@@ -436,6 +746,7 @@ def test_can_invoke_run_with_failed_pipeline(
                 "-s",
                 "subscription_id",
                 "--wait-for-completion",
+                "--stream-logs",
             ],
             obj=ProjectMetadata(
                 tmp_path,
@@ -454,6 +765,261 @@ def test_can_invoke_run_with_failed_pipeline(
         ml_client.jobs.stream.assert_called_once()
 
 
+def test_run_warms_up_cluster_during_generation(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    tmp_path: Path,
+):
+    create_kedro_conf_dirs(tmp_path)
+    with patch.dict(
+        "kedro.framework.project.pipelines", {"__default__": dummy_pipeline}
+    ), patch.object(Path, "cwd", return_value=tmp_path), patch(
+        "kedro_azureml.client.MLClient"
+    ) as ml_client_patched, patch(
+        "kedro_azureml.auth.utils.DefaultAzureCredential"
+    ), patch.dict(
+        os.environ, {"AZURE_STORAGE_ACCOUNT_KEY": "dummy_key"}
+    ), patch(
+        "kedro_azureml.cli.AzureMLWorkspaceConnection.start",
+        autospec=True,
+        side_effect=AzureMLWorkspaceConnection.start,
+    ) as start, patch.object(
+        AzureMLPipelineGenerator,
+        "generate",
+        autospec=True,
+        side_effect=lambda generator: start.assert_called_once() or MagicMock(),
+    ):
+        ml_client = ml_client_patched.from_config()
+        ml_client.compute.get.return_value.min_instances = 0
+
+        result = CliRunner().invoke(
+            cli.run,
+            ["-s", "subscription_id", "--warm-up", "--no-cache"],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+        # the nodes of the pipeline run on the default cluster only
+        assert start.call_args_list[0].args[2] == ["{cluster_name}"]
+        ml_client.compute.get.assert_called()
+        assert ml_client.compute.begin_update.call_count == 2
+        assert ml_client.compute.get.return_value.min_instances == 0
+
+
+@pytest.mark.parametrize(
+    "final_status, exit_code", (("Completed", 0), ("Failed", 1), ("Canceled", 1))
+)
+def test_run_waits_for_completion_by_polling(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    tmp_path: Path,
+    final_status: str,
+    exit_code: int,
+):
+    create_kedro_conf_dirs(tmp_path)
+    with patch.dict(
+        "kedro.framework.project.pipelines", {"__default__": dummy_pipeline}
+    ), patch.object(Path, "cwd", return_value=tmp_path), patch(
+        "kedro_azureml.client.MLClient"
+    ) as ml_client_patched, patch(
+        "kedro_azureml.auth.utils.DefaultAzureCredential"
+    ), patch.dict(
+        os.environ, {"AZURE_STORAGE_ACCOUNT_KEY": "dummy_key"}
+    ), patch(
+        "kedro_azureml.client.time.sleep"
+    ) as sleep:
+        ml_client = ml_client_patched.from_config()
+        ml_client.jobs.get.side_effect = [
+            MagicMock(status="Running"),
+            MagicMock(status=final_status),
+        ]
+        ml_client.jobs.list.return_value = []
+
+        result = CliRunner().invoke(
+            cli.run,
+            ["-s", "subscription_id", "--wait-for-completion"],
+            obj=cli_context,
+        )
+        assert result.exit_code == exit_code, result.output
+        ml_client.jobs.stream.assert_not_called()
+        assert ml_client.jobs.get.call_count == 2
+        sleep.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "params_matrix",
+    (
+        [{"alpha": 1}, {"alpha": 2, "nested": {"b": 3}}],
+        {"small": {"alpha": 1}, "large": {"alpha": 2, "nested": {"b": 3}}},
+    ),
+    ids=("list", "mapping"),
+)
+def test_can_run_multiple_pipelines_with_params_matrix(
+    patched_kedro_package,
+    cli_context,
+    dummy_pipeline,
+    tmp_path: Path,
+    params_matrix,
+):
+    params_pipeline = dummy_pipeline + pipeline(
+        [
+            node(
+                lambda x, *_: x,
+                inputs=["output_data", "params:alpha", "params:nested"],
+                outputs="params_output",
+                name="params_node",
+            )
+        ]
+    )
+    create_kedro_conf_dirs(tmp_path)
+    matrix_path = tmp_path / "matrix.yml"
+    matrix_path.write_text(yaml.safe_dump(params_matrix))
+    with patch.dict(
+        "kedro.framework.project.pipelines",
+        {"__default__": params_pipeline, "other": params_pipeline},
+    ), patch.object(Path, "cwd", return_value=tmp_path), patch(
+        "kedro_azureml.client.MLClient"
+    ) as ml_client_patched, patch(
+        "kedro_azureml.auth.utils.DefaultAzureCredential"
+    ), patch.dict(
+        os.environ, {"AZURE_STORAGE_ACCOUNT_KEY": "dummy_key"}
+    ):
+        ml_client = ml_client_patched.from_config()
+        ml_client.jobs.create_or_update.side_effect = lambda job, **_: MagicMock(
+            studio_url=f"https://ml.azure.com/{job.name}"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli.run,
+            [
+                "-s",
+                "subscription_id",
+                "-p",
+                "__default__",
+                "-p",
+                "other",
+                "--params",
+                '{"nested": {"a": 1}}',
+                "--params-matrix",
+                str(matrix_path),
+                "--max-concurrent-submissions",
+                "2",
+            ],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+        assert ml_client_patched.from_config.call_count == 2  # including the mock setup
+        ml_client.compute.get.assert_called_once()
+        assert ml_client.jobs.create_or_update.call_count == 4
+
+        submitted = [c[0][0] for c in ml_client.jobs.create_or_update.call_args_list]
+        pipeline_inputs = sorted(
+            (
+                (inputs := yaml.safe_load(str(job))["inputs"])["params_alpha"],
+                inputs["params_nested"],
+            )
+            for job in submitted
+        )
+        assert pipeline_inputs == sorted(2 * [(1, '{"a": 1}'), (2, '{"a": 1, "b": 3}')])
+        # the whole runtime params set is forwarded to the steps, next to the typed inputs
+        assert sorted(
+            json.loads(
+                shlex.split(job.jobs["params_node"].command.split("--params=", 1)[1])[0]
+            )["alpha"]
+            for job in submitted
+        ) == [1, 1, 2, 2]
+        assert sorted(
+            job.jobs["node1"].command.split("--pipeline=", 1)[1].split(" ")[0]
+            for job in submitted
+        ) == ["__default__", "__default__", "other", "other"]
+
+
+def test_params_matrix_resolves_runtime_params_per_params_set(
+    patched_kedro_package, cli_context, dummy_pipeline, tmp_path: Path
+):
+    config_path = create_kedro_conf_dirs(tmp_path)
+    catalog = yaml.safe_load((config_path / "catalog.yml").read_text())
+    catalog["output_data"] = {
+        "type": "pickle.PickleDataset",
+        "filepath": "data/output_${runtime_params:alpha, 0}.pickle",
+    }
+    (config_path / "catalog.yml").write_text(yaml.safe_dump(catalog))
+    (matrix_path := tmp_path / "matrix.yml").write_text(
+        yaml.safe_dump([{"alpha": 1}, {"alpha": 2}])
+    )
+    generated = []
+    with patch.dict(
+        "kedro.framework.project.pipelines", {"__default__": dummy_pipeline}
+    ), patch.object(Path, "cwd", return_value=tmp_path), patch(
+        "kedro_azureml.client.MLClient"
+    ), patch(
+        "kedro_azureml.auth.utils.DefaultAzureCredential"
+    ), patch.dict(
+        os.environ, {"AZURE_STORAGE_ACCOUNT_KEY": "dummy_key"}
+    ), patch.object(
+        AzureMLPipelineGenerator,
+        "generate",
+        autospec=True,
+        side_effect=lambda generator: generated.append(generator) or MagicMock(),
+    ):
+        result = CliRunner().invoke(
+            cli.run,
+            [
+                "-s",
+                "subscription_id",
+                "--params-matrix",
+                str(matrix_path),
+                "--no-cache",
+            ],
+            obj=cli_context,
+        )
+        assert result.exit_code == 0, result.output
+
+    assert [Path(g.catalog["output_data"]._filepath).name for g in generated] == [
+        "output_1.pickle",
+        "output_2.pickle",
+    ]
+    assert [g.kedro_params["alpha"] for g in generated] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "content", ("[]", "42", "[1, 2]", "{a: [1]}", "[{a: 1"), ids=str
+)
+def test_run_fails_with_invalid_params_matrix(
+    patched_kedro_package, cli_context, tmp_path: Path, content: str
+):
+    matrix_path = tmp_path / "matrix.yml"
+    matrix_path.write_text(content)
+    result = CliRunner().invoke(
+        cli.run, ["--params-matrix", str(matrix_path)], obj=cli_context
+    )
+    assert result.exit_code == 2
+    assert "params matrix" in result.output
+
+
+@pytest.mark.parametrize(
+    "args", (["-p", "a", "-p", "b"], ["--params-matrix", "matrix.yml"]), ids=str
+)
+def test_run_resumes_single_run_only(
+    patched_kedro_package, cli_context, tmp_path: Path, args
+):
+    (tmp_path / "matrix.yml").write_text("[{a: 1}, {a: 2}]")
+    with patch.object(Path, "cwd", return_value=tmp_path):
+        result = CliRunner().invoke(
+            cli.run,
+            [
+                "--resume",
+                "abc",
+                *[str(tmp_path / a) if a.endswith(".yml") else a for a in args],
+            ],
+            obj=cli_context,
+        )
+    assert result.exit_code == 2
+    assert "--resume resumes a single run" in result.output
+
+
 @pytest.mark.parametrize("env_var", ("INVALID", "2+2=4"))
 def test_fail_if_invalid_env_provided_in_run(
     patched_kedro_package,
@@ -540,3 +1106,27 @@ def test_fail_if_invalid_on_job_scheduled_provided_in_run(
                 "The attribute 'existing_attr' is not a callable function"
                 in result.output
             )
+
+
+def test_cluster_names_of_pipeline_nodes(dummy_plugin_config):
+    config = dummy_plugin_config.azure
+    config.compute["gpu"] = config.compute["__default__"].model_copy(
+        update={"cluster_name": "gpu-cluster"}
+    )
+    config.compute["unused"] = config.compute["__default__"].model_copy(
+        update={"cluster_name": "unused-cluster"}
+    )
+    tagged = pipeline(
+        [
+            node(identity, "a", "b", name="on_gpu", tags=["gpu"]),
+            node(identity, "b", "c", name="on_default"),
+        ]
+    )
+    with patch.dict("kedro.framework.project.pipelines", {"tagged": tagged}):
+        assert get_cluster_names(config, ["tagged"]) == [
+            "gpu-cluster",
+            "{cluster_name}",
+        ]
+        assert get_cluster_names(config, ["tagged"], {"node_names": ["on_gpu"]}) == [
+            "gpu-cluster"
+        ]
@@ -0,0 +1,265 @@
+import os
+import signal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+
+from kedro_azureml.client import (
+    AzureMLJobsWaiter,
+    AzureMLPipelinesClient,
+    AzureMLWorkspaceConnection,
+)
+from kedro_azureml.config import RegisteredComponentsConfig
+
+
+def _child(name, status):
+    child = MagicMock(display_name=name, status=status)
+    return child
+
+
+@pytest.fixture()
+def ml_client():
+    statuses = {
+        "job-a": iter(["Queued", "Running", "Running", "Running", "Completed"]),
+        "job-b": iter(["Running", "Failed"]),
+    }
+    steps = {
+        "job-a": iter(
+            [
+                [],
+                [_child("node1", "Running")],
+                [_child("node1", "Running")],
+                [_child("node1", "Running")],
+                [_child("node1", "Completed")],
+            ]
+        ),
+        "job-b": iter([[_child("node1", "Queued")], [_child("node1", "Failed")]]),
+    }
+    client = MagicMock()
+    client.jobs.get.side_effect = lambda name: MagicMock(status=next(statuses[name]))
+    client.jobs.list.side_effect = lambda parent_job_name: next(steps[parent_job_name])
+    return client
+
+
+def test_waiter_polls_jobs_with_backoff(ml_client):
+    waiter = AzureMLJobsWaiter(ml_client, poll_interval=1, max_poll_interval=3)
+    jobs = {"a": MagicMock(), "b": MagicMock()}
+    jobs["a"].name = "job-a"
+    jobs["b"].name = "job-b"
+
+    with patch("kedro_azureml.client.time.sleep") as sleep:
+        statuses = waiter.wait(jobs)
+
+    assert statuses == {"a": "Completed", "b": "Failed"}
+    # interval is reset after every change and grows while nothing changes
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 1, 2, 3]
+    assert ml_client.jobs.get.call_count == 7
+
+    progress = waiter.format_progress().splitlines()
+    assert progress[0].split() == ["Pipeline", "Step", "Status", "Duration"]
+    assert [line.split()[:3] for line in progress[1:]] == [
+        ["a", "-", "Completed"],
+        ["node1", "Completed", "0m00s"],
+        ["b", "-", "Failed"],
+        ["node1", "Failed", "0m00s"],
+    ]
+
+
+def test_waiter_retries_transient_polling_errors(ml_client):
+    get = ml_client.jobs.get.side_effect
+    errors = [ConnectionError(), HttpResponseError("service unavailable")]
+
+    def get_job(name):
+        if name == "job-a" and errors:
+            raise errors.pop(0)
+        return get(name)
+
+    ml_client.jobs.get.side_effect = get_job
+    waiter = AzureMLJobsWaiter(ml_client, poll_interval=1, max_poll_interval=3)
+    jobs = {"a": MagicMock(), "b": MagicMock()}
+    jobs["a"].name = "job-a"
+    jobs["b"].name = "job-b"
+
+    with patch("kedro_azureml.client.time.sleep"):
+        statuses = waiter.wait(jobs)
+
+    assert statuses == {"a": "Completed", "b": "Failed"}
+    assert ml_client.jobs.get.call_count == 9
+
+
+def test_waiter_reports_jobs_which_cannot_be_polled(ml_client):
+    get = ml_client.jobs.get.side_effect
+
+    def get_job(name):
+        if name == "job-a":
+            raise HttpResponseError("service unavailable")
+        return get(name)
+
+    ml_client.jobs.get.side_effect = get_job
+    waiter = AzureMLJobsWaiter(
+        ml_client, poll_interval=1, max_poll_interval=3, max_poll_tries=3
+    )
+    jobs = {"a": MagicMock(), "b": MagicMock()}
+    jobs["a"].name = "job-a"
+    jobs["b"].name = "job-b"
+
+    with patch("kedro_azureml.client.time.sleep"):
+        statuses = waiter.wait(jobs)
+
+    assert statuses == {"a": "Unknown", "b": "Failed"}
+    assert [c.args[0] for c in ml_client.jobs.get.call_args_list].count("job-a") == 3
+
+
+def test_run_fails_when_jobs_cannot_be_polled():
+    job = MagicMock()
+    with patch("kedro_azureml.client._get_azureml_client") as get_client, patch(
+        "kedro_azureml.client.time.sleep"
+    ):
+        ml_client = get_client.return_value.__enter__.return_value
+        ml_client.jobs.get.side_effect = HttpResponseError("service unavailable")
+
+        is_ok = AzureMLPipelinesClient(job, "subscription_id").run(
+            MagicMock(code_directory=None), wait_for_completion=True
+        )
+
+    assert not is_ok
+
+
+def test_run_does_not_wait_for_jobs_which_failed_to_submit():
+    jobs = {"a": MagicMock(), "b": MagicMock()}
+    with patch("kedro_azureml.client._get_azureml_client") as get_client, patch(
+        "kedro_azureml.client.AzureMLJobsWaiter"
+    ) as waiter:
+        ml_client = get_client.return_value.__enter__.return_value
+        submitted = MagicMock()
+        ml_client.jobs.create_or_update.side_effect = [submitted, ValueError()]
+        waiter.return_value.wait.return_value = {"a": "Completed"}
+
+        is_ok = AzureMLPipelinesClient(jobs, "subscription_id", 1).run(
+            MagicMock(code_directory=None), wait_for_completion=True
+        )
+
+    assert not is_ok
+    waiter.return_value.wait.assert_called_once_with({"a": submitted})
+
+
+def test_run_uses_registered_code_asset():
+    code_step, environment_step = MagicMock(code="."), MagicMock(code=None)
+    job = MagicMock(jobs={"node1": code_step, "node2": environment_step})
+    with patch("kedro_azureml.client._get_azureml_client"), patch(
+        "kedro_azureml.client.resolve_code_asset", return_value="azureml:code:1"
+    ) as resolve_code_asset:
+        assert AzureMLPipelinesClient(job, "subscription_id").run(
+            MagicMock(code_directory=".", registered_components=None)
+        )
+
+    resolve_code_asset.assert_called_once()
+    assert code_step.code == "azureml:code:1"
+    assert environment_step.code is None
+
+    # the code asset cannot be registered, the code directory is uploaded with the jobs
+    code_step.code = "."
+    with patch("kedro_azureml.client._get_azureml_client"), patch(
+        "kedro_azureml.client.resolve_code_asset", return_value=None
+    ):
+        assert AzureMLPipelinesClient(job, "subscription_id").run(
+            MagicMock(code_directory=".", registered_components=None)
+        )
+    assert code_step.code == "."
+
+
+def test_run_keeps_code_of_registered_components():
+    step = MagicMock(code=".")
+    config = MagicMock(
+        code_directory=".",
+        registered_components=RegisteredComponentsConfig(enabled=True),
+    )
+    with patch("kedro_azureml.client._get_azureml_client"), patch(
+        "kedro_azureml.client.resolve_code_asset"
+    ) as resolve_code_asset:
+        assert AzureMLPipelinesClient(MagicMock(jobs={"node1": step}), "s").run(config)
+
+    resolve_code_asset.assert_not_called()
+    assert step.code == "."
+
+
+@pytest.fixture()
+def clusters():
+    clusters = {
+        "cpu": MagicMock(min_instances=0),
+        "gpu": MagicMock(min_instances=2),
+        "unused": MagicMock(min_instances=0),
+    }
+    for name, cluster in clusters.items():
+        cluster.name = name
+    return clusters
+
+
+@pytest.fixture()
+def compute_config():
+    return MagicMock(
+        compute={
+            "__default__": MagicMock(cluster_name="cpu"),
+            "gpu": MagicMock(cluster_name="gpu"),
+            "unused": MagicMock(cluster_name="unused"),
+        }
+    )
+
+
+def test_connection_warms_up_and_restores_clusters(clusters, compute_config):
+    with patch("kedro_azureml.client._get_azureml_client") as get_client:
+        ml_client = get_client.return_value.__enter__.return_value
+        ml_client.compute.get.side_effect = lambda name: clusters[name]
+
+        with AzureMLWorkspaceConnection("subscription_id", warm_up=True) as connection:
+            assert connection.start(compute_config, ["cpu", "gpu", "cpu"]).get(
+                compute_config
+            ) == (ml_client, clusters["cpu"])
+            ml_client.compute.begin_update.assert_called_once_with(clusters["cpu"])
+            assert clusters["cpu"].min_instances == 1
+
+    assert ml_client.compute.begin_update.call_count == 2
+    assert clusters["cpu"].min_instances == 0
+    assert clusters["gpu"].min_instances == 2
+    # only the clusters used by the pipelines are warmed up
+    assert "unused" not in [c.args[0] for c in ml_client.compute.get.call_args_list]
+    get_client.assert_called_once()
+
+
+@pytest.mark.parametrize("interruption", ("sigterm", "atexit"))
+def test_connection_restores_clusters_when_interrupted(
+    clusters, compute_config, interruption
+):
+    previous_handler = signal.getsignal(signal.SIGTERM)
+    with patch("kedro_azureml.client._get_azureml_client") as get_client, patch(
+        "kedro_azureml.client.atexit"
+    ) as atexit:
+        ml_client = get_client.return_value.__enter__.return_value
+        ml_client.compute.get.side_effect = lambda name: clusters[name]
+
+        connection = AzureMLWorkspaceConnection("subscription_id", warm_up=True)
+        connection.get(compute_config)
+        assert clusters["cpu"].min_instances == 1
+        if interruption == "sigterm":
+            with pytest.raises(SystemExit), connection:
+                os.kill(os.getpid(), signal.SIGTERM)
+        else:
+            atexit.register.assert_called_once_with(connection.close)
+            atexit.register.call_args.args[0]()
+
+    assert clusters["cpu"].min_instances == 0
+    assert signal.getsignal(signal.SIGTERM) == previous_handler
+    atexit.unregister.assert_called_once_with(connection.close)
+
+
+def test_connection_does_not_warm_up_by_default():
+    with patch("kedro_azureml.client._get_azureml_client") as get_client:
+        ml_client = get_client.return_value.__enter__.return_value
+        ml_client.compute.get.return_value = MagicMock(min_instances=0)
+
+        with AzureMLWorkspaceConnection("subscription_id") as connection:
+            connection.get(MagicMock())
+
+    ml_client.compute.get.assert_called_once()
+    ml_client.compute.begin_update.assert_not_called()
@@ -0,0 +1,95 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from kedro_azureml import code_snapshot
+from kedro_azureml.code_snapshot import get_code_snapshot, resolve_code_asset
+
+
+@pytest.fixture()
+def code_directory(tmp_path: Path) -> Path:
+    directory = tmp_path / "project"
+    (directory / "src").mkdir(parents=True)
+    (directory / "data").mkdir()
+    (directory / "src" / "nodes.py").write_text("def node(): pass\n")
+    (directory / "src" / "large.bin").write_bytes(b"0" * 4096)
+    (directory / "data" / "raw.csv").write_text("a,b\n1,2\n")
+    (directory / ".amlignore").write_text("data/\n")
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def code_snapshots_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "code-snapshots.json"
+    monkeypatch.setattr(code_snapshot, "CODE_SNAPSHOTS_PATH", path)
+    return path
+
+
+def test_code_snapshot_respects_ignore_file(code_directory: Path):
+    snapshot = get_code_snapshot(code_directory)
+
+    assert [name for name, _ in snapshot.largest_files()] == [
+        "src/large.bin",
+        "src/nodes.py",
+        ".amlignore",
+    ]
+    assert snapshot.total_size == 4096 + 17 + 6
+
+
+def test_code_snapshot_fingerprint_changes_with_files(code_directory: Path):
+    fingerprint = get_code_snapshot(code_directory).fingerprint
+    assert get_code_snapshot(code_directory).fingerprint == fingerprint
+
+    (code_directory / "data" / "raw.csv").write_text("a,b\n1,2\n3,4\n")
+    assert get_code_snapshot(code_directory).fingerprint == fingerprint
+
+    nodes = code_directory / "src" / "nodes.py"
+    nodes.write_text("def node(): return 1\n")
+    os.utime(nodes, ns=(0, 0))
+    assert get_code_snapshot(code_directory).fingerprint != fingerprint
+
+
+def test_resolve_code_asset_reuses_registered_asset(
+    code_directory: Path, code_snapshots_path: Path
+):
+    ml_client = MagicMock(
+        subscription_id="sub", resource_group_name="rg", workspace_name="ws"
+    )
+    ml_client._code.create_or_update.return_value.id = "azureml:code:1"
+
+    assert resolve_code_asset(ml_client, code_directory) == "azureml:code:1"
+    assert resolve_code_asset(ml_client, code_directory) == "azureml:code:1"
+    ml_client._code.create_or_update.assert_called_once()
+    assert code_snapshots_path.exists()
+
+    (code_directory / "src" / "new.py").write_text("")
+    ml_client._code.create_or_update.return_value.id = "azureml:code:2"
+    assert resolve_code_asset(ml_client, code_directory) == "azureml:code:2"
+
+    ml_client.workspace_name = "other"
+    ml_client._code.create_or_update.return_value.id = "azureml:code:3"
+    assert resolve_code_asset(ml_client, code_directory) == "azureml:code:3"
+    assert ml_client._code.create_or_update.call_count == 3
+
+
+def test_code_snapshot_falls_back_without_private_api(
+    code_directory: Path, code_snapshots_path: Path, monkeypatch
+):
+    for name in ("get_ignore_file", "get_upload_files_from_folder", "Code"):
+        monkeypatch.setattr(code_snapshot, name, None)
+    ml_client = MagicMock(
+        subscription_id="sub", resource_group_name="rg", workspace_name="ws"
+    )
+
+    # without the ignore file, all the files are listed
+    assert sorted(name for name, _ in get_code_snapshot(code_directory).files) == [
+        ".amlignore",
+        "data/raw.csv",
+        "src/large.bin",
+        "src/nodes.py",
+    ]
+    assert resolve_code_asset(ml_client, code_directory) is None
+    ml_client._code.create_or_update.assert_not_called()
+    assert not code_snapshots_path.exists()
@@ -0,0 +1,107 @@
+from unittest.mock import patch
+
+import pytest
+from kedro.pipeline import node, pipeline
+
+from kedro_azureml import compile_cache
+from kedro_azureml.compile_cache import compile_pipeline
+from kedro_azureml.config import NamespaceComponentsConfig
+from kedro_azureml.generator import AzureMLPipelineGenerator
+from tests.utils import identity
+
+pytestmark = pytest.mark.parametrize(
+    "generator_factory",
+    [{"kedro_params": {"alpha": 1}, "storage_account_key": "secret-storage-key"}],
+    indirect=True,
+)
+
+
+def test_unchanged_pipeline_is_loaded_from_compile_cache(
+    generator_factory, multi_catalog
+):
+    generator = generator_factory(catalog=multi_catalog)
+    compiled = compile_pipeline(generator)
+    assert not compiled.cache_hit
+    (cached_spec_path,) = compile_cache.COMPILE_CACHE_DIR.glob("*.yaml")
+    cached_spec = cached_spec_path.read_text()
+    assert "secret-storage-key" not in cached_spec
+    assert generator.kedro_azure_run_id not in cached_spec
+
+    with patch.object(AzureMLPipelineGenerator, "generate") as generate:
+        cached = compile_pipeline(generator_factory(catalog=multi_catalog))
+    generate.assert_not_called()
+    assert cached.cache_hit
+    assert "secret-storage-key" in cached.spec
+    assert generator.kedro_azure_run_id not in cached.spec
+    assert list(cached.job.jobs) == list(compiled.job.jobs)
+
+
+@pytest.mark.parametrize(
+    "changed",
+    (
+        {"params": '{"alpha": 2}'},
+        {"storage_account_key": "other-storage-key"},
+    ),
+    ids=("params", "storage account key"),
+)
+def test_compile_cache_fingerprint(generator_factory, changed):
+    fingerprint = generator_factory().get_fingerprint()
+    assert fingerprint == generator_factory().get_fingerprint()
+    assert (fingerprint == generator_factory(**changed).get_fingerprint()) == (
+        "storage_account_key" in changed
+    )
+
+
+def test_compile_cache_can_be_disabled(generator_factory):
+    compiled = compile_pipeline(generator_factory(), use_cache=False)
+    assert not compiled.cache_hit
+    assert not compile_cache.COMPILE_CACHE_DIR.exists()
+
+
+def test_compile_cache_falls_back_to_generation(generator_factory):
+    compile_pipeline(generator_factory())
+    (cached_spec_path,) = compile_cache.COMPILE_CACHE_DIR.glob("*.yaml")
+    cached_spec_path.write_text("type: pipeline\njobs: not a mapping\n")
+
+    compiled = compile_pipeline(generator_factory(), eager_load=True)
+    assert not compiled.cache_hit
+    assert "node1" in compiled.job.jobs
+
+
+def test_resumed_runs_are_not_cached(generator_factory):
+    generator = generator_factory()
+    generator.resume_run_id = "resumed"
+    with patch.object(AzureMLPipelineGenerator, "generate") as generate:
+        compile_pipeline(generator)
+    generate.assert_called_once()
+    assert not compile_cache.COMPILE_CACHE_DIR.exists()
+
+
+def test_pipelines_with_namespace_components_are_not_cached(
+    generator_factory, dummy_plugin_config, caplog
+):
+    modular_pipeline = pipeline(
+        [
+            node(identity, "data", "features", name="featurize"),
+            node(identity, "features", "model", name="train"),
+        ]
+    )
+    kedro_pipeline = pipeline(
+        [node(identity, "input_data", "data", name="prep")]
+    ) + sum(
+        (
+            pipeline(modular_pipeline, namespace=namespace, inputs={"data"})
+            for namespace in ("model_a", "model_b")
+        ),
+        start=pipeline([]),
+    )
+    dummy_plugin_config.azure.namespace_components = NamespaceComponentsConfig(
+        enabled=True
+    )
+    for _ in range(2):
+        compiled = compile_pipeline(generator_factory(kedro_pipeline), eager_load=True)
+        assert not compiled.cache_hit
+        assert set(compiled.job.jobs) == {"prep", "model_a", "model_b"}
+        assert "featurize" in compiled.spec
+    assert not compile_cache.COMPILE_CACHE_DIR.exists()
+    assert "Cannot load the cached pipeline" not in caplog.text
@@ -0,0 +1,125 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from kedro.pipeline import pipeline
+
+from kedro_azureml import components
+from kedro_azureml.components import ComponentRegistry, iter_steps
+from kedro_azureml.config import NamespaceComponentsConfig
+from kedro_azureml.generator import ConfigException
+
+
+@pytest.fixture(autouse=True)
+def components_registry_path(tmp_path: Path, monkeypatch) -> Path:
+    path = tmp_path / "components.json"
+    monkeypatch.setattr(components, "COMPONENTS_REGISTRY_PATH", path)
+    return path
+
+
+@pytest.fixture()
+def ml_client():
+    ml_client = MagicMock(
+        subscription_id="sub", resource_group_name="rg", workspace_name="ws"
+    )
+    environment = MagicMock(version="1")
+    environment.name = "unit_test_aml_env"
+    ml_client.environments.get.return_value = environment
+    workspace = {}
+
+    def create_or_update(component):
+        workspace[(component.name, component.version)] = component
+        return component
+
+    def get(name, version):
+        if (name, version) not in workspace:
+            raise ResourceNotFoundError()
+        return workspace[(name, version)]
+
+    ml_client.components.create_or_update.side_effect = create_or_update
+    ml_client.components.get.side_effect = get
+    ml_client.workspace = workspace
+    return ml_client
+
+
+def _registered(ml_client):
+    return [
+        f"{c.args[0].name}:{c.args[0].version}"
+        for c in ml_client.components.create_or_update.call_args_list
+    ]
+
+
+def test_steps_reference_registered_components(ml_client, generator_factory):
+    job = generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+
+    assert sorted(name.split(":")[0] for name in _registered(ml_client)) == [
+        "kedro_node1",
+        "kedro_node2",
+        "kedro_node3",
+    ]
+    for step in iter_steps(job):
+        assert f"{step.component.name}:{step.component.version}" in _registered(
+            ml_client
+        )
+        assert step.component.environment == "azureml:unit_test_aml_env:1"
+    ml_client.environments.get.assert_called_once_with(
+        "unit_test_aml_env", label="latest"
+    )
+
+
+def test_unchanged_components_are_not_registered_again(ml_client, generator_factory):
+    generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+    first = _registered(ml_client)
+    ml_client.components.create_or_update.reset_mock()
+
+    job = generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+    ml_client.components.create_or_update.assert_not_called()
+    assert sorted(
+        f"{step.component.name}:{step.component.version}" for step in iter_steps(job)
+    ) == sorted(first)
+
+    # a new version of the environment published under the same label
+    ml_client.environments.get.return_value.version = "2"
+    generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+    assert len(_registered(ml_client)) == 3
+    assert set(_registered(ml_client)).isdisjoint(first)
+
+
+def test_components_missing_in_workspace_are_registered_again(
+    ml_client, generator_factory
+):
+    generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+    ml_client.components.create_or_update.reset_mock()
+    ml_client.workspace.clear()
+
+    generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+    assert ml_client.components.create_or_update.call_count == 3
+
+
+def test_registers_steps_of_namespace_components(
+    ml_client, generator_factory, dummy_pipeline, dummy_plugin_config
+):
+    dummy_plugin_config.azure.namespace_components = NamespaceComponentsConfig(
+        enabled=True
+    )
+    job = generator_factory(
+        pipeline(dummy_pipeline, namespace="a")
+        + pipeline(dummy_pipeline, namespace="b"),
+        component_registry=ComponentRegistry(ml_client),
+    ).generate()
+
+    # both namespaces share the pipeline component, so its steps are registered once
+    assert len(_registered(ml_client)) == 3
+    assert len(list(iter_steps(job))) == 6
+
+
+def test_components_require_code_asset(
+    ml_client, generator_factory, dummy_plugin_config
+):
+    dummy_plugin_config.azure.code_directory = "."
+    with patch(
+        "kedro_azureml.components.resolve_code_asset", return_value=None
+    ), pytest.raises(ConfigException, match="code asset"):
+        generator_factory(component_registry=ComponentRegistry(ml_client)).generate()
+    ml_client.components.create_or_update.assert_not_called()
@@ -1,20 +1,53 @@
+import gc
+import json
+import multiprocessing
+import os
+import pickle
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from multiprocessing.reduction import ForkingPickler
 from pathlib import Path
-from typing import Type
+from typing import List, Type
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import numpy as np
 import pandas as pd
 import pytest
+from kedro.io import SharedMemoryDataCatalog
 from kedro.io.core import VERSIONED_FLAG_KEY, DatasetError, Version
+from kedro.pipeline import node, pipeline
+from kedro.runner import ParallelRunner
 from kedro_datasets.pandas import ParquetDataset
 from kedro_datasets.pickle import PickleDataset
 
-from kedro_azureml.constants import KEDRO_AZURE_BLOB_TEMP_DIR_NAME
+from kedro_azureml.config import AzureMLConfig, LocalRunConfig
+from kedro_azureml.constants import (
+    KEDRO_AZURE_BLOB_TEMP_DIR_NAME,
+    KEDRO_AZURE_RUN_ID,
+)
 from kedro_azureml.datasets import (
     AzureMLAssetDataset,
     AzureMLPipelineDataset,
     KedroAzureRunnerDataset,
     KedroAzureRunnerDistributedDataset,
+    MLTableDataset,
+)
+from kedro_azureml.datasets.asset_dataset import (
+    FINGERPRINT_TAG,
+    PARTITIONS_TAG,
+    REUSED_VERSION_MARKER,
+    compute_fingerprint,
+)
+from kedro_azureml.datasets.asset_downloader import (
+    PARTIAL_DOWNLOAD_SUFFIX,
+    AzureMLAssetDownloader,
+    RemoteFile,
+    UnsupportedDatastoreError,
+    load_manifest,
 )
 
 
@@ -45,6 +78,12 @@ def test_azure_dataset_config(dataset_class: Type):
     assert all(k in cfg for k in ("account_name", "account_key")), "Invalid ABFS config"
 
 
+def test_azure_dataset_exists(patched_azure_dataset):
+    assert not patched_azure_dataset.exists()
+    patched_azure_dataset.save({"data": 1})
+    assert patched_azure_dataset.exists()
+
+
 @pytest.mark.parametrize(
     "dataset_type,path_in_aml,path_locally,download_path,local_run,download,mock_azureml_client",
     [
@@ -360,7 +399,7 @@ def test_azureml_asset_dataset(
 
 
 def test_azureml_assetdataset_raises_DatasetError_azureml_type():
-    with pytest.raises(DatasetError, match="mltable"):
+    with pytest.raises(DatasetError, match="uri_table"):
         AzureMLAssetDataset(
             dataset={
                 "type": PickleDataset,
@@ -368,7 +407,7 @@ def test_azureml_assetdataset_raises_DatasetError_azureml_type():
             },
             azureml_dataset="test_dataset",
             version=Version(None, None),
-            azureml_type="mltable",
+            azureml_type="uri_table",
         )
 
 
@@ -468,3 +507,917 @@ def test_can_save_python_objects_using_fspec(obj, comparer, patched_azure_datase
         Path(ds._get_target_path()).stat().st_size > 0
     ), "File does not seem to be saved"
     assert comparer(obj, ds.load()), "Objects are not the same after deserialization"
+
+
+def test_azureml_asset_dataset_load_waits_for_prefetch(tmp_path: Path):
+    ds = AzureMLAssetDataset(
+        dataset={
+            "type": PickleDataset,
+            "filepath": "test.pickle",
+        },
+        azureml_dataset="test_dataset",
+        root_dir=str(tmp_path),
+        azureml_version="1",
+    )
+
+    def fake_download():
+        Path(ds.download_path).mkdir(parents=True, exist_ok=True)
+        ds._construct_dataset().save("prefetched")
+
+    with patch.object(
+        ds, "_download_azureml_dataset", side_effect=fake_download
+    ) as download, ThreadPoolExecutor(max_workers=1) as executor:
+        future = ds.prefetch(executor)
+        assert ds.prefetch(executor) is future, "Download should be scheduled once"
+        assert ds._load() == "prefetched"
+        assert download.call_count == 1
+        assert ds._prefetched is None
+
+
+def test_azureml_asset_dataset_concurrent_loads_share_one_download(tmp_path: Path):
+    ds = AzureMLAssetDataset(
+        dataset={"type": PickleDataset, "filepath": "test.pickle"},
+        azureml_dataset="test_dataset",
+        root_dir=str(tmp_path),
+    )
+    downloads = []
+
+    def slow_download():
+        downloads.append(threading.get_ident())
+        time.sleep(0.2)
+        Path(ds.download_path).mkdir(parents=True, exist_ok=True)
+        ds._construct_dataset().save("downloaded")
+
+    with patch.object(
+        ds, "_get_latest_version", side_effect=lambda: time.sleep(0.01) or "3"
+    ) as get_latest_version, patch.object(
+        ds, "_download_azureml_dataset", side_effect=slow_download
+    ), ThreadPoolExecutor(
+        max_workers=32
+    ) as executor:
+        futures = [executor.submit(ds.load) for _ in range(200)]
+        futures += [executor.submit(ds.prefetch, executor) for _ in range(20)]
+        results = [f.result(timeout=30) for f in futures[:200]]
+
+    assert results == ["downloaded"] * 200
+    assert len(downloads) == 1, "Concurrent loads should share a single download"
+    assert get_latest_version.call_count == 1
+    assert ds.path == tmp_path / "test_dataset" / "3" / "test.pickle"
+
+
+class DownloadCountingAssetDataset(AzureMLAssetDataset):
+    """Records its downloads in ``downloads.log`` file, which is shared by the processes"""
+
+    def _download_azureml_dataset(self) -> None:
+        with (Path(self.root_dir) / "downloads.log").open("a") as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(0.2)
+        Path(self.download_path).mkdir(parents=True, exist_ok=True)
+        self._construct_dataset().save(pd.DataFrame({"value": [1, 2, 3]}))
+
+
+def _sum_values(df: pd.DataFrame) -> int:
+    return int(df["value"].sum())
+
+
+def test_asset_datasets_are_picklable(tmp_path: Path):
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="test_dataset",
+        azureml_version="1",
+        root_dir=str(tmp_path),
+    )
+    ds.azure_config = AzureMLConfig(
+        subscription_id="123",
+        resource_group="456",
+        workspace_name="best",
+        experiment_name="test",
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor, patch.object(
+        ds, "_download_azureml_dataset"
+    ):
+        ds.prefetch(executor).result()
+    runner_ds = KedroAzureRunnerDataset("account", "container", "key", "name", "run")
+    catalog = SharedMemoryDataCatalog({"asset": ds, "runner": runner_ds})
+    catalog.validate_catalog()
+
+    restored = pickle.loads(ForkingPickler.dumps(ds))
+    assert restored.path == ds.path
+    assert restored.azure_config == ds.azure_config
+    assert restored._download_session == ds._download_session
+    assert restored._prefetched is None
+    with restored._lock, restored._download_lock:
+        pass
+    restored_runner_ds = pickle.loads(ForkingPickler.dumps(runner_ds))
+    assert restored_runner_ds._get_target_path() == runner_ds._get_target_path()
+
+
+def test_asset_dataset_removes_download_markers_without_run(tmp_path: Path):
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="test_dataset",
+        azureml_version="1",
+        root_dir=str(tmp_path),
+    )
+    with patch.object(ds, "_download_azureml_dataset"):
+        ds._ensure_downloaded()
+    session_dir = ds._default_download_session_dir
+    assert (session_dir / f"{ds._download_session}.done").is_file()
+
+    del ds
+    gc.collect()
+    assert not session_dir.exists()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_parallel_runner_downloads_asset_once(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("KEDRO_MP_CONTEXT", "fork")
+    ds = DownloadCountingAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "data.parquet"},
+        azureml_dataset="test_dataset",
+        azureml_version="1",
+        root_dir=str(tmp_path),
+    )
+    catalog = SharedMemoryDataCatalog(
+        {
+            "asset": ds,
+            **{
+                name: PickleDataset(filepath=str(tmp_path / f"{name}.pickle"))
+                for name in ("sum_1", "sum_2")
+            },
+        }
+    )
+    pipe = pipeline(
+        [
+            node(_sum_values, "asset", "sum_1", name="sum_1"),
+            node(_sum_values, "asset", "sum_2", name="sum_2"),
+        ]
+    )
+
+    ParallelRunner(max_workers=2).run(pipe, catalog)
+
+    assert catalog["sum_1"].load() == catalog["sum_2"].load() == 6
+    downloads = (tmp_path / "downloads.log").read_text().splitlines()
+    assert len(downloads) == 1, "Worker processes should share a single download"
+
+
+AML_URI_PREFIX = (
+    "azureml://subscriptions/1234/resourcegroups/dummy_rg/workspaces"
+    "/dummy_ws/datastores/some_datastore/paths/"
+)
+
+
+def test_asset_downloader_downloads_all_files_of_folder(
+    tmp_path: Path, fake_container_client
+):
+    downloader = AzureMLAssetDownloader(
+        AML_URI_PREFIX + "assets/events/", MagicMock(), max_workers=2
+    )
+    downloader._container_client = fake_container_client
+
+    stats = downloader.download(str(tmp_path))
+
+    assert stats.files_total == stats.files_downloaded == 3
+    assert stats.bytes_downloaded == len(b"partition 1") * 3
+    assert (tmp_path / "part=2" / "data.parquet").read_bytes() == b"partition 2"
+    assert not list(tmp_path.rglob(f"*{PARTIAL_DOWNLOAD_SUFFIX}"))
+
+
+def test_asset_downloader_ignores_blobs_sharing_name_prefix(fake_container_client):
+    downloader = AzureMLAssetDownloader(AML_URI_PREFIX + "assets/events", MagicMock())
+    downloader._container_client = fake_container_client
+    assert {f.relative_path for f in downloader.list_files()} == {
+        "part=1/data.parquet",
+        "part=2/data.parquet",
+        "part=3/data.parquet",
+    }
+
+
+def test_asset_downloader_resumes_and_retries(tmp_path: Path, fake_container_client):
+    (tmp_path / "part=1").mkdir()
+    (tmp_path / "part=1" / "data.parquet").write_bytes(b"partition 1")
+    fake_container_client.failures = {"assets/events/part=2/data.parquet": 1}
+    downloader = AzureMLAssetDownloader(
+        AML_URI_PREFIX + "assets/events/", MagicMock(), max_retries=2
+    )
+    downloader._container_client = fake_container_client
+
+    with patch("backoff._sync.time.sleep"):
+        stats = downloader.download(str(tmp_path))
+
+    assert stats.files_skipped == 1 and stats.files_downloaded == 2
+    assert "assets/events/part=1/data.parquet" not in fake_container_client.downloads
+    assert (
+        fake_container_client.downloads.count("assets/events/part=2/data.parquet") == 2
+    )
+
+
+def test_asset_downloader_raises_after_retries_exhausted(
+    tmp_path: Path, fake_container_client
+):
+    fake_container_client.failures = {"assets/events/part=3/data.parquet": 5}
+    downloader = AzureMLAssetDownloader(
+        AML_URI_PREFIX + "assets/events/", MagicMock(), max_retries=2
+    )
+    downloader._container_client = fake_container_client
+
+    with patch("backoff._sync.time.sleep"), pytest.raises(DatasetError, match="resume"):
+        downloader.download(str(tmp_path))
+    assert (tmp_path / "part=1" / "data.parquet").exists()
+    assert not (tmp_path / "part=3" / "data.parquet").exists()
+
+
+@pytest.mark.parametrize(
+    "unsupported_datastore,mock_azureml_client",
+    [
+        (False, {"path": AML_URI_PREFIX + "test_folder/", "type": "uri_folder"}),
+        (True, {"path": AML_URI_PREFIX + "test_folder/", "type": "uri_folder"}),
+    ],
+    indirect=["mock_azureml_client"],
+)
+def test_azureml_asset_dataset_parallel_download_engine(
+    in_temp_dir, mock_azureml_client, unsupported_datastore
+):
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="test_dataset",
+    )
+    ds.azure_config = AzureMLConfig(
+        subscription_id="123",
+        resource_group="456",
+        workspace_name="best",
+        experiment_name="test",
+        local_run=LocalRunConfig(download_engine="parallel", download_workers=3),
+    )
+    with patch(
+        "kedro_azureml.datasets.asset_dataset.AzureMLAssetDownloader"
+    ) as downloader, patch(
+        "kedro_azureml.datasets.asset_dataset.artifact_utils.download_artifact_from_aml_uri"
+    ) as sdk_download:
+        downloader.return_value.list_files.return_value = []
+        if unsupported_datastore:
+            downloader.return_value.list_files.side_effect = UnsupportedDatastoreError()
+        ds._download_azureml_dataset()
+
+    assert downloader.call_args.kwargs["max_workers"] == 3
+    assert downloader.return_value.download.called != unsupported_datastore
+    assert sdk_download.called == unsupported_datastore
+    assert ds._manifest_path("1").exists() != unsupported_datastore
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": AML_URI_PREFIX + "assets/events/", "type": "uri_folder"}],
+    indirect=True,
+)
+def test_azureml_asset_dataset_incremental_sync(
+    in_temp_dir, mock_azureml_client, fake_container_client
+):
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="test_dataset",
+        azureml_version="1",
+    )
+    ds.azure_config = AzureMLConfig(
+        subscription_id="123",
+        resource_group="456",
+        workspace_name="best",
+        experiment_name="test",
+        local_run=LocalRunConfig(incremental_sync=True),
+    )
+    with patch.object(
+        AzureMLAssetDownloader, "container_client", fake_container_client
+    ):
+        ds._download_azureml_dataset()
+        assert len(fake_container_client.downloads) == 3
+
+        # version 2 has one modified and one new partition
+        fake_container_client.blobs["assets/events/part=3/data.parquet"] = b"changed"
+        fake_container_client.blobs["assets/events/part=4/data.parquet"] = b"new one"
+        fake_container_client.downloads.clear()
+        ds._azureml_version = "2"
+        previous_path, previous_manifest = ds._find_previous_local_copy("2")
+        assert previous_path == str(Path("data/test_dataset/1"))
+        assert previous_manifest.version == "1"
+        ds._download_azureml_dataset()
+
+    assert sorted(fake_container_client.downloads) == [
+        "assets/events/part=3/data.parquet",
+        "assets/events/part=4/data.parquet",
+    ]
+    v1, v2 = Path("data/test_dataset/1"), Path("data/test_dataset/2")
+    assert (v2 / "part=1/data.parquet").stat().st_ino == (
+        v1 / "part=1/data.parquet"
+    ).stat().st_ino, "Unchanged files should be hard-linked"
+    assert (v2 / "part=3/data.parquet").read_bytes() == b"changed"
+    assert (v1 / "part=3/data.parquet").read_bytes() == b"partition 3"
+
+
+@pytest.mark.parametrize(
+    "azureml_type,filepath,expected_path,mock_azureml_client",
+    [
+        (
+            "uri_folder",
+            ".",
+            "abfs://container/test_folder",
+            {"path": AML_URI_PREFIX + "test_folder/", "type": "uri_folder"},
+        ),
+        (
+            "uri_folder",
+            "random/subfolder/",
+            "abfs://container/test_folder/random/subfolder",
+            {"path": AML_URI_PREFIX + "test_folder/", "type": "uri_folder"},
+        ),
+        (
+            "uri_file",
+            "test.pickle",
+            "abfs://container/test_file/test.pickle",
+            {"path": AML_URI_PREFIX + "test_file/test.pickle", "type": "uri_file"},
+        ),
+    ],
+    indirect=["mock_azureml_client"],
+)
+def test_azureml_asset_dataset_streams_without_download(
+    in_temp_dir, mock_azureml_client, azureml_type, filepath, expected_path
+):
+    ds = AzureMLAssetDataset(
+        dataset={
+            "type": ParquetDataset,
+            "filepath": filepath,
+            "credentials": {"max_concurrency": 4},
+        },
+        azureml_dataset="test_dataset",
+        azureml_type=azureml_type,
+        download=False,
+    )
+    datastore_info = {
+        "storage_type": "AzureDataLakeGen2",
+        "storage_account": "account",
+        "account_url": "https://account.dfs.core.windows.net",
+        "container_name": "container",
+        "credential": "sas-token",
+    }
+    with patch(
+        "kedro_azureml.datasets.asset_downloader.get_datastore_info",
+        return_value=datastore_info,
+    ), patch.object(ds, "_dataset_type") as dataset_type, patch.object(
+        ds, "_download_azureml_dataset"
+    ) as download:
+        dataset_type.return_value.load.return_value = "streamed"
+        assert ds._load() == "streamed"
+
+    download.assert_not_called()
+    kwargs = dataset_type.call_args.kwargs
+    assert kwargs["filepath"] == expected_path
+    assert kwargs["credentials"] == {
+        "max_concurrency": 4,
+        "account_name": "account",
+        "account_host": "account.blob.core.windows.net",
+        "credential": "sas-token",
+    }
+    assert ds.prefetch(MagicMock()) is None
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": AML_URI_PREFIX + "assets/events/", "type": "uri_folder"}],
+    indirect=True,
+)
+def test_azureml_asset_dataset_downloads_selected_files_only(
+    in_temp_dir, mock_azureml_client, fake_container_client
+):
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="test_dataset",
+        azureml_version="1",
+        include=["part=1/*", "part=2/*"],
+        exclude="part=2/*",
+    )
+    ds.azure_config = AzureMLConfig(
+        subscription_id="123",
+        resource_group="456",
+        workspace_name="best",
+        experiment_name="test",
+    )
+    assert ds.path.name.startswith("1-subset-")
+    with patch.object(
+        AzureMLAssetDownloader, "container_client", fake_container_client
+    ):
+        ds._download_azureml_dataset()
+
+    assert fake_container_client.downloads == ["assets/events/part=1/data.parquet"]
+    assert [p.name for p in ds.path.iterdir()] == ["part=1"]
+    manifest = load_manifest(ds._manifest_path("1"))
+    assert manifest.include == ["part=1/*", "part=2/*"]
+    assert manifest.exclude == ["part=2/*"]
+    assert [f.relative_path for f in manifest.files] == ["part=1/data.parquet"]
+
+
+def test_azureml_asset_dataset_include_requires_uri_folder():
+    with pytest.raises(DatasetError, match="uri_folder"):
+        AzureMLAssetDataset(
+            dataset={"type": PickleDataset, "filepath": "test.pickle"},
+            azureml_dataset="test_dataset",
+            azureml_type="uri_file",
+            include=["*.pickle"],
+        )
+
+
+def _appended_dataset(**kwargs) -> AzureMLAssetDataset:
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "data.parquet"},
+        azureml_dataset="events",
+        save_mode="append",
+        **kwargs,
+    )
+    ds.azure_config = AzureMLConfig(
+        subscription_id="123",
+        resource_group="456",
+        workspace_name="best",
+        experiment_name="test",
+    )
+    return ds
+
+
+def test_azureml_asset_dataset_local_intermediate_uses_local_version(in_temp_dir):
+    ds = AzureMLAssetDataset(
+        dataset={"type": PickleDataset, "filepath": "data.pickle"},
+        azureml_dataset="features",
+    )
+    ds.as_local_intermediate()
+    with patch("kedro_azureml.datasets.asset_dataset._get_azureml_client") as client:
+        ds.save({"value": 1})
+        assert ds.load() == {"value": 1}
+
+    # the latest remote version is neither looked up nor overwritten
+    client.assert_not_called()
+    assert Path(ds.path) == Path("data/features/local/data.pickle")
+    assert Path(ds.path).is_file()
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": AML_URI_PREFIX + "features/", "type": "uri_folder"}],
+    indirect=True,
+)
+def test_azureml_asset_dataset_resolves_latest_version_once(mock_azureml_client):
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="features",
+    )
+
+    assert ds._resolve_azureml_version() == "1"
+    # a version registered in the meantime does not change the data loaded by the run
+    ml_client.data.get.return_value.version = "2"
+    assert ds._resolve_azureml_version() == "1"
+    assert ds.download_path == ds._download_path(ds._local_path("1"))
+    ml_client.data.get.assert_called_once_with("features", label="latest")
+
+    fresh = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "."},
+        azureml_dataset="features",
+    )
+    assert fresh._resolve_azureml_version() == "2"
+
+
+def test_azureml_asset_dataset_appends_partitions_locally(in_temp_dir):
+    ds = _appended_dataset()
+    ds.as_local_intermediate()
+    for partition, values in (("p1", [1, 2]), ("p2", [3])):
+        ds._output_args["partition"] = partition
+        ds.save(pd.DataFrame({"value": values}))
+
+    assert Path("data/events/local/p1/data.parquet").is_file()
+    assert Path("data/events/local/p2/data.parquet").is_file()
+    assert sorted(ds.load()["value"].tolist()) == [1, 2, 3]
+    assert ds._describe()["partitions"] == ["p1", "p2"]
+    with pytest.raises(DatasetError, match="already exists"):
+        ds.save(pd.DataFrame({"value": [4]}))
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": "azureml://datastores/store/paths/events/", "type": "uri_folder"}],
+    indirect=True,
+)
+def test_azureml_asset_dataset_registers_appended_version(
+    tmp_path: Path, mock_azureml_client
+):
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ml_client.data.get.return_value.tags = {PARTITIONS_TAG: '["p1"]'}
+
+    def create_or_update(data):
+        ml_client.data.get.return_value.tags = data.tags
+        return MagicMock(version="2")
+
+    ml_client.data.create_or_update.side_effect = create_or_update
+    ds = _appended_dataset(
+        output_args={
+            "datastore": "store",
+            "path": "events",
+            "partition": "p-{timestamp}",
+        }
+    )
+    ds.as_remote()
+    ds.root_dir = str(tmp_path)
+    with _uploaded_partitions(tmp_path) as downloader:
+        ds.save(pd.DataFrame({"value": [1]}))
+
+    (partition,) = [p.name for p in tmp_path.iterdir()]
+    assert partition.startswith("p-")
+    assert (tmp_path / partition / "data.parquet").is_file()
+    assert (
+        downloader.call_args.args[0]
+        == f"azureml://datastores/store/paths/events/{partition}/"
+    )
+    registered = ml_client.data.create_or_update.call_args.args[0]
+    assert registered.name == "events"
+    assert (
+        registered.path == ds.append_uri == "azureml://datastores/store/paths/events/"
+    )
+    assert json.loads(registered.tags[PARTITIONS_TAG]) == ["p1", partition]
+    assert partition in registered.description
+
+
+def _uploaded_partitions(folder: Path):
+    """Files saved to the mounted partitions show up in the datastore"""
+    return patch(
+        "kedro_azureml.datasets.asset_dataset.AzureMLAssetDownloader",
+        side_effect=lambda uri, datastores: MagicMock(
+            list_files=lambda: _remote_files(folder / uri.rstrip("/").rsplit("/", 1)[1])
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": "azureml://datastores/store/paths/events/", "type": "uri_folder"}],
+    indirect=True,
+)
+@pytest.mark.parametrize("uploaded", (True, False), ids=("uploaded", "not_uploaded"))
+def test_azureml_asset_dataset_registers_appended_version_after_upload(
+    tmp_path: Path, mock_azureml_client, monkeypatch, uploaded
+):
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ml_client.data.get.return_value.tags = {PARTITIONS_TAG: '["p1"]'}
+    # a concurrent append registers p2 on top of the version read before the save
+    concurrent = [{PARTITIONS_TAG: '["p1", "p2"]'}]
+
+    def create_or_update(data):
+        ml_client.data.get.return_value.tags = (
+            concurrent.pop() if concurrent else data.tags
+        )
+        return MagicMock(version="2")
+
+    ml_client.data.create_or_update.side_effect = create_or_update
+    ds = _appended_dataset(
+        output_args={
+            "datastore": "store",
+            "path": "events",
+            "partition": "p3",
+            "upload_timeout": 0,
+        }
+    )
+    ds.as_remote()
+    ds.root_dir = str(tmp_path)
+    with _uploaded_partitions(tmp_path if uploaded else tmp_path / "missing"):
+        if uploaded:
+            ds.save(pd.DataFrame({"value": [1]}))
+        else:
+            with pytest.raises(DatasetError, match="did not complete"):
+                ds.save(pd.DataFrame({"value": [1]}))
+
+    if uploaded:
+        assert [
+            json.loads(c.args[0].tags[PARTITIONS_TAG])
+            for c in ml_client.data.create_or_update.call_args_list
+        ] == [["p1", "p3"], ["p1", "p2", "p3"]]
+    else:
+        ml_client.data.create_or_update.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": "azureml://datastores/store/paths/events/", "type": "uri_folder"}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "partitions,expected",
+    [('["p1", "p2"]', [1, 2]), ('["p1", "p2", "p3"]', [1, 2, 3]), (None, [1, 2, 3])],
+    ids=("older_version", "latest_version", "not_appended_version"),
+)
+def test_azureml_asset_dataset_loads_partitions_of_version_remotely(
+    tmp_path: Path,
+    tmp_path_factory,
+    monkeypatch,
+    mock_azureml_client,
+    partitions,
+    expected,
+):
+    monkeypatch.setattr(
+        tempfile, "tempdir", str(temp_dir := tmp_path_factory.mktemp("tmp"))
+    )
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ml_client.data.get.return_value.tags = (
+        {PARTITIONS_TAG: partitions} if partitions else {}
+    )
+    # the mounted folder is shared by all the versions of the asset
+    for partition, value in (("p1", 1), ("p2", 2), ("p3", 3)):
+        ParquetDataset(filepath=str(tmp_path / partition / "data.parquet")).save(
+            pd.DataFrame({"value": [value]})
+        )
+    ds = _appended_dataset(azureml_version="2")
+    ds.as_remote()
+    ds.root_dir = str(tmp_path)
+
+    assert sorted(ds.load()["value"].tolist()) == expected
+    assert sorted(ds.load()["value"].tolist()) == expected
+    ml_client.data.get.assert_called_with("events", version="2")
+
+    views = list(temp_dir.iterdir())
+    assert len(views) == (1 if partitions and expected != [1, 2, 3] else 0)
+    del ds
+    gc.collect()
+    assert not any(view.exists() for view in views)
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": AML_URI_PREFIX + "assets/events/", "type": "uri_folder"}],
+    indirect=True,
+)
+def test_azureml_asset_dataset_downloads_partitions_of_version(
+    in_temp_dir, mock_azureml_client, fake_container_client
+):
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ml_client.data.get.return_value.tags = {PARTITIONS_TAG: '["part=1", "part=2"]'}
+    ds = _appended_dataset(azureml_version="1")
+    with patch.object(
+        AzureMLAssetDownloader, "container_client", fake_container_client
+    ):
+        ds._download_azureml_dataset()
+
+    assert sorted(fake_container_client.downloads) == [
+        "assets/events/part=1/data.parquet",
+        "assets/events/part=2/data.parquet",
+    ]
+    assert ds.path == Path("data/events/1")
+    assert ds._describe()["partitions"] == ["part=1", "part=2"]
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        ({"save_mode": "upsert"}, "Invalid save_mode"),
+        ({"save_mode": "append", "azureml_type": "uri_file"}, "uri_folder"),
+    ],
+)
+def test_azureml_asset_dataset_raises_for_invalid_save_mode(kwargs, match):
+    with pytest.raises(DatasetError, match=match):
+        AzureMLAssetDataset(
+            dataset={"type": PickleDataset, "filepath": "test.pickle"},
+            azureml_dataset="test_dataset",
+            **kwargs,
+        )
+
+
+def _fingerprinted_dataset(**output_args) -> AzureMLAssetDataset:
+    ds = AzureMLAssetDataset(
+        dataset={"type": ParquetDataset, "filepath": "data.parquet"},
+        azureml_dataset="features",
+        skip_unchanged=True,
+        output_args={"datastore": "store", **output_args},
+    )
+    ds.azure_config = AzureMLConfig(
+        subscription_id="123",
+        resource_group="456",
+        workspace_name="best",
+        experiment_name="test",
+    )
+    ds.as_remote()
+    return ds
+
+
+def test_compute_fingerprint(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x.txt").write_text("x")
+    (tmp_path / "y.txt").write_text("y")
+    fingerprint = compute_fingerprint(tmp_path)
+    assert fingerprint == compute_fingerprint(tmp_path)
+
+    (tmp_path / "y.txt").write_text("changed")
+    assert compute_fingerprint(tmp_path) != fingerprint
+    (tmp_path / "y.txt").rename(tmp_path / "z.txt")
+    assert compute_fingerprint(tmp_path) != fingerprint
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": "azureml://datastores/store/paths/features/", "type": "uri_folder"}],
+    indirect=True,
+)
+@pytest.mark.parametrize("changed", (True, False))
+def test_azureml_asset_dataset_skips_unchanged_output(
+    tmp_path: Path, mock_azureml_client, monkeypatch, changed
+):
+    data = pd.DataFrame({"value": [1, 2, 3]})
+    staging = tmp_path / "staging"
+    ParquetDataset(filepath=str(staging / "data.parquet")).save(data)
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ml_client.data.get.return_value.version = "7"
+    ml_client.data.get.return_value.tags = {
+        FINGERPRINT_TAG: "outdated" if changed else compute_fingerprint(staging)
+    }
+    monkeypatch.setenv(KEDRO_AZURE_RUN_ID, "run-1")
+
+    ds = _fingerprinted_dataset()
+    ds.root_dir = str(output_dir := tmp_path / "output")
+    with patch(
+        "kedro_azureml.datasets.asset_dataset.AzureMLAssetDownloader"
+    ) as downloader:
+        # files copied to the mounted output show up in the datastore
+        downloader.return_value.list_files.side_effect = lambda: _remote_files(
+            output_dir
+        )
+        ds.save(data)
+
+    if changed:
+        assert (output_dir / "data.parquet").is_file()
+        assert (
+            downloader.call_args.args[0]
+            == "azureml://datastores/store/paths/kedro-azureml/features/run-1/"
+        )
+        registered = ml_client.data.create_or_update.call_args.args[0]
+        assert (
+            registered.path
+            == "azureml://datastores/store/paths/kedro-azureml/features/run-1/"
+        )
+        assert registered.tags == {FINGERPRINT_TAG: compute_fingerprint(staging)}
+    else:
+        ml_client.data.create_or_update.assert_not_called()
+        assert [p.name for p in output_dir.iterdir()] == [REUSED_VERSION_MARKER]
+        downstream = _fingerprinted_dataset()
+        downstream.root_dir = str(output_dir)
+        with patch.object(downstream, "_construct_streaming_dataset") as streaming:
+            streaming.return_value.load.return_value = "reused"
+            assert downstream.load() == "reused"
+        streaming.assert_called_once_with("7")
+
+
+def _remote_files(folder: Path) -> List[RemoteFile]:
+    return [
+        RemoteFile(
+            name=p.as_posix(),
+            relative_path=p.relative_to(folder).as_posix(),
+            size=p.stat().st_size,
+            etag="etag",
+        )
+        for p in folder.rglob("*")
+        if p.is_file()
+    ]
+
+
+@pytest.mark.parametrize(
+    "mock_azureml_client",
+    [{"path": "azureml://datastores/store/paths/features/", "type": "uri_folder"}],
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    "failure,error",
+    (
+        ("save", "Failed while saving"),
+        ("upload", "did not complete within 0 seconds"),
+        ("unsupported_datastore", "cannot register its own versions"),
+        ("no_run_id", f"{KEDRO_AZURE_RUN_ID} environment variable is not set"),
+    ),
+    ids=("save", "upload", "unsupported_datastore", "no_run_id"),
+)
+def test_azureml_asset_dataset_does_not_register_failed_upload(
+    tmp_path: Path, mock_azureml_client, monkeypatch, failure, error
+):
+    ml_client = mock_azureml_client.return_value.__enter__.return_value
+    ml_client.data.get.return_value.tags = {FINGERPRINT_TAG: "outdated"}
+    if failure != "no_run_id":
+        monkeypatch.setenv(KEDRO_AZURE_RUN_ID, "run-1")
+    else:
+        monkeypatch.delenv(KEDRO_AZURE_RUN_ID, raising=False)
+
+    ds = _fingerprinted_dataset(upload_timeout=0)
+    ds.root_dir = str(output_dir := tmp_path / "output")
+    data = pd.DataFrame({"value": [1, 2, 3]})
+    with patch(
+        "kedro_azureml.datasets.asset_dataset.AzureMLAssetDownloader"
+    ) as downloader, pytest.raises(DatasetError, match=error):
+        list_files = downloader.return_value.list_files
+        if failure == "save":
+            data = "not a data frame"
+        elif failure == "upload":
+            # only a part of the file is uploaded
+            list_files.side_effect = lambda: [
+                replace(f, size=f.size - 1) for f in _remote_files(output_dir)
+            ]
+        else:
+            list_files.side_effect = UnsupportedDatastoreError()
+        ds.save(data)
+
+    ml_client.data.create_or_update.assert_not_called()
+
+
+def test_azureml_asset_dataset_validates_upload_timeout():
+    with pytest.raises(DatasetError, match="upload_timeout"):
+        _fingerprinted_dataset(upload_timeout="ten minutes")
+
+
+def test_azureml_asset_dataset_skip_unchanged_requires_overwrite():
+    with pytest.raises(DatasetError, match="skip_unchanged"):
+        AzureMLAssetDataset(
+            dataset={"type": ParquetDataset, "filepath": "data.parquet"},
+            azureml_dataset="test_dataset",
+            save_mode="append",
+            skip_unchanged=True,
+        )
+
+
+class FakeMLTable:
+    def __init__(self, path, steps=()):
+        self.path, self.steps = path, list(steps)
+
+    def keep_columns(self, columns):
+        return FakeMLTable(self.path, self.steps + [("keep_columns", columns)])
+
+    def filter(self, expression):
+        return FakeMLTable(self.path, self.steps + [("filter", expression)])
+
+    def take(self, count):
+        return FakeMLTable(self.path, self.steps + [("take", count)])
+
+    def to_pandas_dataframe(self):
+        return pd.DataFrame({"steps": [s[0] for s in self.steps]})
+
+
+@pytest.mark.parametrize("materialize", (False, True))
+def test_mltable_dataset_loads_table_lazily(materialize):
+    fake_mltable = MagicMock()
+    fake_mltable.load.side_effect = FakeMLTable
+    ds = MLTableDataset(
+        "data/table",
+        load_args={
+            "columns": ["a", "b"],
+            "filter": "col('a') > 1",
+            "take": 10,
+            "materialize": materialize,
+        },
+    )
+    with patch.dict("sys.modules", {"mltable": fake_mltable}):
+        table = ds.load()
+
+    fake_mltable.load.assert_called_once_with("data/table")
+    if materialize:
+        assert table["steps"].tolist() == ["keep_columns", "filter", "take"]
+    else:
+        assert table.steps == [
+            ("keep_columns", ["a", "b"]),
+            ("filter", "col('a') > 1"),
+            ("take", 10),
+        ]
+    with pytest.raises(DatasetError, match="read-only"):
+        ds.save(table)
+
+
+@pytest.mark.parametrize(
+    "download,expected_filepath,mock_azureml_client",
+    [
+        (
+            True,
+            str(Path("data/test_dataset/1")),
+            {"path": AML_URI_PREFIX + "table/", "type": "mltable"},
+        ),
+        (
+            False,
+            AML_URI_PREFIX + "table/",
+            {"path": AML_URI_PREFIX + "table/", "type": "mltable"},
+        ),
+    ],
+    indirect=["mock_azureml_client"],
+)
+def test_azureml_asset_dataset_with_mltable(
+    in_temp_dir, mock_azureml_client, download, expected_filepath
+):
+    ds = AzureMLAssetDataset(
+        dataset={"type": MLTableDataset, "filepath": "."},
+        azureml_dataset="test_dataset",
+        azureml_type="mltable",
+        download=download,
+    )
+    fake_mltable = MagicMock()
+    fake_mltable.load.side_effect = FakeMLTable
+    with patch.dict("sys.modules", {"mltable": fake_mltable}), patch.object(
+        ds, "_download_azureml_dataset"
+    ) as download_mock:
+        table = ds._load()
+
+    assert table.path == expected_filepath
+    assert download_mock.called == download
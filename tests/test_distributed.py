@@ -6,11 +6,17 @@ import pytest
 from azure.ai.ml.entities import Job
 from kedro.pipeline import node, pipeline
 
-from kedro_azureml.constants import DISTRIBUTED_CONFIG_FIELD
-from kedro_azureml.distributed import distributed_job
+from kedro_azureml.config import StepReuseConfig
+from kedro_azureml.constants import (
+    DISTRIBUTED_CONFIG_FIELD,
+    KEDRO_AZURE_PARALLEL_SHARD,
+    PARALLEL_CONFIG_FIELD,
+)
+from kedro_azureml.distributed import distributed_job, parallel
 from kedro_azureml.distributed.config import Framework
+from kedro_azureml.distributed.parallel import ParallelShard, merge_partitions
 from kedro_azureml.distributed.utils import is_distributed_master_node
-from kedro_azureml.generator import AzureMLPipelineGenerator
+from kedro_azureml.generator import AzureMLPipelineGenerator, ConfigException
 from tests.utils import identity
 
 
@@ -163,3 +169,144 @@ def test_can_detect_distributed_master_node(environment, expected_master):
         assert (
             status := is_distributed_master_node()
         ) == expected_master, f"Invalid master node status detected, should be {expected_master} but was {status}"
+
+
+@parallel(instance_count=3, mini_batch_size=2)
+def _double_partitions(partitions, factor=2):
+    assert len(partitions) <= 2, "Mini-batch is too large"
+    if isinstance(partitions, dict):
+        return {key: value * factor for key, value in partitions.items()}
+    return [value * factor for value in partitions]
+
+
+@pytest.mark.parametrize(
+    "partitions",
+    ({f"p{i}": i for i in range(7)}, list(range(7))),
+    ids=("dict", "list"),
+)
+def test_parallel_node_processes_partitions_in_mini_batches(partitions):
+    assert hasattr(_double_partitions, PARALLEL_CONFIG_FIELD)
+    expected = (
+        {key: value * 3 for key, value in partitions.items()}
+        if isinstance(partitions, dict)
+        else [value * 3 for value in partitions]
+    )
+    assert _double_partitions(partitions, factor=3) == expected
+
+    shard_outputs = []
+    for index in range(3):
+        shard = ParallelShard(index, 3, mini_batch_size=2)
+        with patch.dict(os.environ, {KEDRO_AZURE_PARALLEL_SHARD: shard.to_json()}):
+            shard_outputs.append(_double_partitions(partitions, 3))
+    assert [len(output) for output in shard_outputs] == [2, 2, 3]
+    assert merge_partitions(shard_outputs) == expected
+
+
+def test_parallel_node_rejects_non_partitioned_input():
+    with pytest.raises(TypeError, match="Parallel nodes process"):
+        _double_partitions(42)
+
+
+@pytest.mark.parametrize(
+    "instance_count,kedro_params",
+    [(2, {}), ("params:shards", {"shards": 4})],
+)
+def test_can_generate_azure_pipeline_with_parallel_node(
+    dummy_plugin_config, instance_count, kedro_params, multi_catalog
+):
+    @parallel(instance_count=instance_count, mini_batch_size=10)
+    def my_parallel_node(partitions):
+        return partitions
+
+    p = pipeline(
+        [
+            node(identity, inputs="input_data", outputs="i2", name="node1"),
+            node(my_parallel_node, inputs="i2", outputs="i3", name="parallel_node"),
+            node(identity, inputs="i3", outputs="output_data", name="node3"),
+        ]
+    )
+    with patch.object(AzureMLPipelineGenerator, "get_kedro_pipeline", return_value=p):
+        az_pipeline = AzureMLPipelineGenerator(
+            "dummy_pipeline",
+            "unit_test_env",
+            dummy_plugin_config,
+            kedro_params,
+            aml_env="unit_test/aml_env@latest",
+            catalog=multi_catalog,
+        ).generate()
+
+    expected_count = kedro_params.get("shards", instance_count)
+    shards = [f"parallel_node_shard_{i}" for i in range(expected_count)]
+    assert list(az_pipeline.jobs) == ["node1", *shards, "parallel_node_merge", "node3"]
+    for index, name in enumerate(shards):
+        shard = az_pipeline.jobs[name]
+        assert f"--az-output=i3__shard_{index} ${{{{outputs.i3}}}}" in shard.command
+        assert json.loads(shard.environment_variables[KEDRO_AZURE_PARALLEL_SHARD]) == {
+            "index": index,
+            "count": expected_count,
+            "mini_batch_size": 10,
+        }
+
+    merge = az_pipeline.jobs["parallel_node_merge"]
+    assert f"--merge-shards={expected_count}" in merge.command
+    assert set(merge.inputs) == {f"i3_shard_{i}" for i in range(expected_count)}
+    assert KEDRO_AZURE_PARALLEL_SHARD not in merge.environment_variables
+    downstream_input = az_pipeline.jobs["node3"].inputs["i3"]._data
+    assert downstream_input._owner is merge
+    assert downstream_input._port_name == "i3"
+
+
+def test_generator_raises_for_parallel_node_with_multiple_outputs(
+    dummy_plugin_config, multi_catalog
+):
+    @parallel(instance_count=2)
+    def my_parallel_node(partitions):
+        return partitions, partitions
+
+    p = pipeline(
+        [node(my_parallel_node, inputs="input_data", outputs=["a", "b"], name="n")]
+    )
+    with patch.object(AzureMLPipelineGenerator, "get_kedro_pipeline", return_value=p):
+        generator = AzureMLPipelineGenerator(
+            "dummy_pipeline",
+            "unit_test_env",
+            dummy_plugin_config,
+            {},
+            aml_env="unit_test/aml_env@latest",
+            catalog=multi_catalog,
+        )
+        with pytest.raises(ConfigException, match="exactly one output"):
+            generator.generate()
+
+
+@pytest.mark.parametrize(
+    "changed", ({"instance_count": 8}, {"mini_batch_size": 5}), ids=str
+)
+def test_parallel_node_config_is_fingerprinted(
+    dummy_plugin_config, multi_catalog, changed
+):
+    def get_fingerprints(**parallel_kwargs):
+        @parallel(**{"instance_count": 2, "mini_batch_size": 10, **parallel_kwargs})
+        def my_parallel_node(partitions):
+            return partitions
+
+        p = pipeline([node(my_parallel_node, inputs="i2", outputs="i3", name="n")])
+        dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=True)
+        with patch.object(
+            AzureMLPipelineGenerator, "get_kedro_pipeline", return_value=p
+        ):
+            generator = AzureMLPipelineGenerator(
+                "dummy_pipeline",
+                "unit_test_env",
+                dummy_plugin_config,
+                {},
+                aml_env="unit_test/aml_env@latest",
+                catalog=multi_catalog,
+            )
+            return generator.get_fingerprint(), generator._get_step_fingerprints(p)
+
+    fingerprint, step_fingerprints = get_fingerprints()
+    assert get_fingerprints() == (fingerprint, step_fingerprints)
+    changed_fingerprint, changed_step_fingerprints = get_fingerprints(**changed)
+    assert changed_fingerprint != fingerprint
+    assert changed_step_fingerprints["n"] != step_fingerprints["n"]
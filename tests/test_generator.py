@@ -1,10 +1,34 @@
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 from azure.ai.ml.entities import Job
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node as kedro_node
+from kedro.pipeline import pipeline
+from kedro_datasets.pandas import CSVDataset
 
-from kedro_azureml.config import ComputeConfig
+from kedro_azureml.config import (
+    ComputeConfig,
+    KedroAzureRunnerConfig,
+    NamespaceComponentsConfig,
+    NodeFusionConfig,
+    StepReuseConfig,
+)
+from kedro_azureml.constants import (
+    KEDRO_AZURE_LOAD_VERSIONS,
+    KEDRO_AZURE_RUN_ID,
+    KEDRO_AZURE_RUN_ID_TAG,
+    KEDRO_AZURE_RUNNER_CONFIG,
+    KEDRO_AZURE_STEP_FINGERPRINT,
+)
+from kedro_azureml.datasets import (
+    AzureMLAssetDataset,
+    KedroAzureRunnerDataset,
+    MLTableDataset,
+)
 from kedro_azureml.generator import AzureMLPipelineGenerator, ConfigException
+from tests.utils import identity
 
 
 @pytest.mark.parametrize(
@@ -196,3 +220,657 @@ def test_azure_pipeline_with_deterministic_node_tag(
             assert az_pipeline.jobs[node.name].component.is_deterministic == (
                 "deterministic" in node.tags
             ), "is_deterministic property does not match node tag"
+
+
+def _mltable_catalog():
+    return DataCatalog(
+        {
+            "input_data": AzureMLAssetDataset(
+                dataset={"type": MLTableDataset, "filepath": "."},
+                azureml_dataset="test_table",
+                azureml_type="mltable",
+            ),
+        }
+    )
+
+
+def test_azure_pipeline_with_mltable_input(generator_factory):
+    az_pipeline = generator_factory(catalog=_mltable_catalog()).generate()
+    az_input = az_pipeline.jobs["node1"].inputs["input_data"]._data
+    assert az_input.type == "mltable"
+    assert az_input.path == "test_table@latest"
+
+
+def test_azure_pipeline_raises_for_mltable_output(generator_factory):
+    catalog = _mltable_catalog()
+    catalog["i2"] = catalog["input_data"]
+    with pytest.raises(ValueError, match="mltable"):
+        generator_factory(catalog=catalog).generate()
+
+
+def test_azure_pipeline_with_appended_output(generator_factory):
+    catalog = DataCatalog(
+        {
+            "output_data": AzureMLAssetDataset(
+                dataset={"type": "pandas.ParquetDataset", "filepath": "data.parquet"},
+                azureml_dataset="events",
+                save_mode="append",
+                output_args={"datastore": "my_datastore", "path": "/events/"},
+            ),
+        }
+    )
+    az_pipeline = generator_factory(catalog=catalog).generate()
+    az_output = az_pipeline.jobs["node3"].outputs["output_data"]._data
+    assert az_output.type == "uri_folder"
+    assert az_output.path == "azureml://datastores/my_datastore/paths/events/"
+    assert az_pipeline.jobs["node3"].component.outputs["output_data"].mode == "rw_mount"
+    assert az_output.name is None, "Appended versions are registered by the dataset"
+
+
+def test_azure_pipeline_passes_pinned_versions_of_appended_inputs(generator_factory):
+    catalog = DataCatalog(
+        {
+            "input_data": AzureMLAssetDataset(
+                dataset={"type": "pandas.ParquetDataset", "filepath": "data.parquet"},
+                azureml_dataset="events",
+                save_mode="append",
+            ),
+        }
+    )
+    az_pipeline = generator_factory(
+        catalog=catalog, load_versions={"input_data": "3"}
+    ).generate()
+
+    assert az_pipeline.jobs["node1"].inputs["input_data"].path == "events:3"
+    assert json.loads(
+        az_pipeline.jobs["node1"].environment_variables[KEDRO_AZURE_LOAD_VERSIONS]
+    ) == {"input_data": "3"}
+    assert KEDRO_AZURE_LOAD_VERSIONS not in (
+        az_pipeline.jobs["node2"].environment_variables
+    )
+
+
+def test_azure_pipeline_with_output_skipped_when_unchanged(generator_factory):
+    catalog = DataCatalog(
+        {
+            "output_data": AzureMLAssetDataset(
+                dataset={"type": "pandas.ParquetDataset", "filepath": "data.parquet"},
+                azureml_dataset="features",
+                skip_unchanged=True,
+            ),
+        }
+    )
+    az_pipeline = generator_factory(catalog=catalog).generate()
+    node3 = az_pipeline.jobs["node3"]
+    run_id = node3.environment_variables[KEDRO_AZURE_RUN_ID]
+    assert node3.outputs["output_data"]._data.path == (
+        f"azureml://datastores/workspaceblobstore/paths/kedro-azureml/features/{run_id}/"
+    )
+    assert node3.outputs["output_data"]._data.name is None
+    assert KEDRO_AZURE_RUN_ID not in az_pipeline.jobs["node1"].environment_variables
+
+
+def test_generator_computes_catalog_and_pipeline_lookups_once(
+    generator_factory, dummy_pipeline, multi_catalog
+):
+    with patch.object(
+        multi_catalog, "filter", wraps=multi_catalog.filter
+    ) as catalog_filter, patch.object(
+        type(dummy_pipeline), "inputs", autospec=True, side_effect=lambda p: set()
+    ) as pipeline_inputs:
+        generator_factory(catalog=multi_catalog).generate()
+
+    catalog_filter.assert_called_once()
+    pipeline_inputs.assert_called_once()
+
+
+def test_can_fuse_linear_chain_of_nodes(
+    generator_factory, dummy_plugin_config, multi_catalog
+):
+    dummy_plugin_config.azure.node_fusion = NodeFusionConfig(enabled=True)
+    az_pipeline = generator_factory(catalog=multi_catalog).generate()
+
+    assert list(az_pipeline.jobs) == ["node1"]
+    step = az_pipeline.jobs["node1"]
+    assert "--node=node1 --node=node2 --node=node3 " in step.command
+    assert step.display_name == "node1 (3 nodes)"
+    assert set(step.inputs) == {"input_data"}
+    # i2 is an AzureMLAssetDataset, so it's saved to an Azure ML output, i3 stays in memory
+    assert set(step.outputs) == {"i2", "output_data"}
+    assert "--az-output=i3" not in step.command
+
+
+def test_node_fusion_splits_chains_on_compute_change(
+    generator_factory, dummy_pipeline_compute_tag, dummy_plugin_config, multi_catalog
+):
+    dummy_plugin_config.azure.compute["compute-2"] = ComputeConfig(
+        cluster_name="cpu-cluster-2"
+    )
+    dummy_plugin_config.azure.node_fusion = NodeFusionConfig(enabled=True)
+    az_pipeline = generator_factory(
+        dummy_pipeline_compute_tag, catalog=multi_catalog
+    ).generate()
+
+    assert list(az_pipeline.jobs) == ["node1", "node2"]
+    assert az_pipeline.jobs["node1"].compute == "cpu-cluster-2"
+    assert "--node=node2 --node=node3 " in az_pipeline.jobs["node2"].command
+    assert set(az_pipeline.jobs["node2"].inputs) == {"i2"}
+
+
+def test_can_fuse_nodes_by_group_tag(generator_factory, dummy_plugin_config):
+    fan_out = pipeline(
+        [
+            kedro_node(identity, "input_data", "a", name="split", tags=["group.prep"]),
+            kedro_node(identity, "a", "b", name="left", tags=["group.prep"]),
+            kedro_node(identity, "a", "c", name="right"),
+            kedro_node(lambda b, c: b, ["b", "c"], "output_data", name="merge"),
+        ]
+    )
+    dummy_plugin_config.azure.node_fusion = NodeFusionConfig(
+        enabled=True, linear_chains=False
+    )
+    az_pipeline = generator_factory(fan_out).generate()
+
+    assert list(az_pipeline.jobs) == ["prep", "right", "merge"]
+    prep = az_pipeline.jobs["prep"]
+    assert "--node=split --node=left " in prep.command
+    assert set(prep.outputs) == {"a", "b"}
+    assert set(az_pipeline.jobs["merge"].inputs) == {"b", "c"}
+
+
+@pytest.mark.parametrize(
+    "nodes, error",
+    (
+        (
+            [
+                kedro_node(identity, "input_data", "a", name="first", tags=["group.g"]),
+                kedro_node(identity, "a", "b", name="middle"),
+                kedro_node(identity, "b", "output_data", name="last", tags=["group.g"]),
+            ],
+            "depend on each other",
+        ),
+        (
+            [
+                kedro_node(identity, "input_data", "a", name="g"),
+                kedro_node(identity, "input_data", "b", name="other", tags=["group.g"]),
+            ],
+            "same name as a node",
+        ),
+        (
+            [
+                kedro_node(identity, "input_data", "a", name="first", tags=["group.g"]),
+                kedro_node(
+                    identity, "a", "b", name="second", tags=["group.g", "compute-2"]
+                ),
+            ],
+            "same compute",
+        ),
+    ),
+    ids=("cycle", "name clash", "different compute"),
+)
+def test_node_fusion_rejects_invalid_groups(
+    generator_factory, dummy_plugin_config, nodes, error
+):
+    dummy_plugin_config.azure.compute["compute-2"] = ComputeConfig(
+        cluster_name="cpu-cluster-2"
+    )
+    dummy_plugin_config.azure.node_fusion = NodeFusionConfig(enabled=True)
+    with pytest.raises(ConfigException, match=error):
+        generator_factory(pipeline(nodes)).generate()
+
+
+def test_can_compile_namespaces_into_pipeline_components(
+    generator_factory, dummy_plugin_config
+):
+    modular_pipeline = pipeline(
+        [
+            kedro_node(identity, "data", "features", name="featurize"),
+            kedro_node(identity, "features", "model", name="train"),
+        ]
+    )
+    kedro_pipeline = (
+        pipeline([kedro_node(identity, "raw", "data", name="prep")])
+        + pipeline(modular_pipeline, namespace="model_a", inputs={"data"})
+        + pipeline(modular_pipeline, namespace="model_b", inputs={"data"})
+        + pipeline(
+            pipeline(modular_pipeline, namespace="inner", inputs={"data"}),
+            namespace="outer",
+            inputs={"data"},
+        )
+    )
+    dummy_plugin_config.azure.namespace_components = NamespaceComponentsConfig(
+        enabled=True
+    )
+    az_pipeline = generator_factory(kedro_pipeline).generate()
+
+    assert list(az_pipeline.jobs) == ["prep", "model_a", "model_b", "outer"]
+    model_a, model_b = az_pipeline.jobs["model_a"], az_pipeline.jobs["model_b"]
+    assert model_a.component is model_b.component
+    assert model_a.component is (
+        az_pipeline.jobs["outer"].component.jobs["inner"].component
+    )
+    assert model_b.inputs["kedro_namespace"]._data == "model_b"
+    assert az_pipeline.jobs["outer"].inputs["kedro_namespace_inner"]._data == (
+        "outer.inner"
+    )
+
+    train = model_a.component.jobs["train"]
+    assert (
+        "--node=${{inputs.kedro_namespace}}.train "
+        "--az-input=${{inputs.kedro_namespace}}.features ${{inputs.features}} "
+        "--az-output=${{inputs.kedro_namespace}}.model ${{outputs.model}}"
+    ) in train.command
+    assert set(az_pipeline.outputs) == {
+        "model_a_model",
+        "model_b_model",
+        "outer_inner_model",
+    }
+
+
+def test_namespace_components_are_disabled_by_default(
+    generator_factory, dummy_pipeline
+):
+    az_pipeline = generator_factory(pipeline(dummy_pipeline, namespace="ns")).generate()
+    assert list(az_pipeline.jobs) == ["ns_node1", "ns_node2", "ns_node3"]
+
+
+def test_namespace_components_raise_for_cyclic_namespaces(
+    generator_factory, dummy_plugin_config
+):
+    kedro_pipeline = pipeline(
+        [
+            kedro_node(identity, "input_data", "a", name="first", namespace="ns"),
+            kedro_node(identity, "a", "b", name="middle"),
+            kedro_node(identity, "b", "output_data", name="last", namespace="ns"),
+        ]
+    )
+    dummy_plugin_config.azure.namespace_components = NamespaceComponentsConfig(
+        enabled=True
+    )
+    with pytest.raises(ConfigException, match="Namespaces depend on each other"):
+        generator_factory(kedro_pipeline).generate()
+
+
+def test_params_are_compiled_into_typed_pipeline_inputs(generator_factory):
+    kedro_pipeline = pipeline(
+        [
+            kedro_node(
+                lambda x, *_: x,
+                inputs=[
+                    "input_data",
+                    "params:alpha",
+                    "params:model.depth",
+                    "params:verbose",
+                    "params:name",
+                    "params:model",
+                ],
+                outputs="output_data",
+                name="train",
+            )
+        ]
+    )
+    kedro_params = {
+        "alpha": 0.5,
+        "model": {"depth": 3},
+        "verbose": True,
+        "name": "it's",
+    }
+    az_pipeline = generator_factory(
+        kedro_pipeline, kedro_params=kedro_params, params='{"alpha": 0.5}'
+    ).generate()
+
+    assert {
+        port: (az_pipeline.inputs[port].type, az_pipeline.inputs[port]._data)
+        for port in az_pipeline.inputs
+    } == {
+        "params_alpha": ("number", 0.5),
+        "params_model_depth": ("integer", 3),
+        "params_verbose": ("boolean", True),
+        "params_name": ("string", '"it\\u0027s"'),
+        "params_model": ("string", '{"depth": 3}'),
+    }
+    train = az_pipeline.jobs["train"]
+    assert train.component.inputs["params_model_depth"].type == "integer"
+    assert train.command.endswith(
+        "--az-param-input=alpha number params_alpha "
+        "--az-param-input=model.depth integer params_model_depth "
+        "--az-param-input=verbose boolean params_verbose "
+        "--az-param-input=name json params_name "
+        "--az-param-input=model json params_model "
+        "--params='{\"alpha\": 0.5}'"
+    )
+
+    kedro_params["alpha"] = 0.1
+    other_pipeline = generator_factory(
+        kedro_pipeline, kedro_params=kedro_params, params='{"alpha": 0.5}'
+    ).generate()
+    assert other_pipeline.inputs["params_alpha"]._data == 0.1
+    assert other_pipeline.jobs["train"].command == train.command
+
+
+def test_params_are_passed_to_namespace_components(
+    generator_factory, dummy_plugin_config
+):
+    kedro_pipeline = pipeline(
+        pipeline(
+            [
+                kedro_node(
+                    lambda x, _: x,
+                    inputs=["data", "params:lr"],
+                    outputs="model",
+                    name="train",
+                )
+            ]
+        ),
+        namespace="model_a",
+        inputs={"data"},
+    )
+    dummy_plugin_config.azure.namespace_components = NamespaceComponentsConfig(
+        enabled=True
+    )
+    az_pipeline = generator_factory(
+        kedro_pipeline, kedro_params={"model_a": {"lr": 0.01}}
+    ).generate()
+
+    assert az_pipeline.inputs["params_model_a_lr"]._data == 0.01
+    train = az_pipeline.jobs["model_a"].component.jobs["train"]
+    assert (
+        "--az-param-input=${{inputs.kedro_namespace}}.lr number params_lr"
+        in train.command
+    )
+
+
+def test_colliding_port_names_are_rejected(generator_factory):
+    kedro_pipeline = pipeline(
+        [
+            kedro_node(
+                lambda x, *_: x,
+                inputs=["input_data", "params:a.b", "params:a_b"],
+                outputs="output_data",
+                name="train",
+            )
+        ]
+    )
+    with pytest.raises(ConfigException, match="params:a.b and params:a_b.*params_a_b"):
+        generator_factory(
+            kedro_pipeline, kedro_params={"a": {"b": 1}, "a_b": 2}
+        ).generate()
+
+
+def _square(x):
+    return x**2
+
+
+def _get_step_fingerprints(az_pipeline: Job):
+    return {
+        name: step.environment_variables.get(KEDRO_AZURE_STEP_FINGERPRINT)
+        for name, step in az_pipeline.jobs.items()
+    }
+
+
+def test_step_reuse_fingerprints_steps(generator_factory, dummy_plugin_config):
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=True)
+    first = generator_factory().generate()
+    second = generator_factory().generate()
+    fingerprints = _get_step_fingerprints(first)
+    assert all(fingerprints.values())
+    assert fingerprints == _get_step_fingerprints(second)
+    assert all(step.component.is_deterministic for step in first.jobs.values())
+    runner_config = KedroAzureRunnerConfig.model_validate_json(
+        first.jobs["node2"].environment_variables[KEDRO_AZURE_RUNNER_CONFIG]
+    )
+    assert runner_config.run_id == fingerprints["node2"]
+
+    changed_pipeline = pipeline(
+        [
+            kedro_node(identity, "input_data", "i2", name="node1"),
+            kedro_node(_square, "i2", "i3", name="node2"),
+            kedro_node(identity, "i3", "output_data", name="node3"),
+        ]
+    )
+    changed = _get_step_fingerprints(generator_factory(changed_pipeline).generate())
+    assert changed["node1"] == fingerprints["node1"]
+    assert changed["node2"] != fingerprints["node2"]
+    assert changed["node3"] != fingerprints["node3"]
+
+
+@pytest.mark.parametrize("enabled", (False, True), ids=("no reuse", "step reuse"))
+def test_step_reuse_code_changes_invalidate_compile_cache(
+    generator_factory, dummy_plugin_config, dummy_pipeline, enabled
+):
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=enabled)
+    changed_pipeline = pipeline(
+        [
+            kedro_node(
+                _square if n.name == "node2" else n.func,
+                n.inputs,
+                n.outputs,
+                name=n.name,
+            )
+            for n in dummy_pipeline.nodes
+        ]
+    )
+    # the code of the nodes is baked into the steps only with step reuse
+    assert (
+        generator_factory(changed_pipeline).get_fingerprint()
+        != generator_factory().get_fingerprint()
+    ) == enabled
+
+
+@pytest.mark.parametrize(
+    "generator_factory", [{"kedro_params": {"alpha": 1}}], indirect=True
+)
+def test_step_reuse_skips_non_deterministic_nodes_and_their_descendants(
+    generator_factory, dummy_plugin_config
+):
+    kedro_pipeline = pipeline(
+        [
+            kedro_node(identity, "input_data", "i2", name="node1"),
+            kedro_node(identity, "i2", "i3", name="node2", tags=["non-deterministic"]),
+            kedro_node(identity, "i3", "output_data", name="node3"),
+            kedro_node(
+                lambda x, _: x, ["i2", "params:alpha"], "other_data", name="node4"
+            ),
+        ]
+    )
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=True)
+    az_pipeline = generator_factory(kedro_pipeline).generate()
+    fingerprints = _get_step_fingerprints(az_pipeline)
+    assert {name for name, fp in fingerprints.items() if fp} == {"node1", "node4"}
+    assert {
+        name
+        for name, step in az_pipeline.jobs.items()
+        if step.component.is_deterministic
+    } == {"node1", "node4"}
+
+
+@pytest.mark.parametrize(
+    "static_inputs,expected_reused",
+    [([], set()), (["input_data"], {"node1", "node2", "node3"})],
+    ids=("unversioned", "static"),
+)
+def test_step_reuse_skips_steps_reading_unversioned_catalog_datasets(
+    generator_factory, dummy_plugin_config, tmp_path, static_inputs, expected_reused
+):
+    catalog = DataCatalog(
+        {"input_data": CSVDataset(filepath=str(tmp_path / "input.csv"))}
+    )
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(
+        enabled=True, static_inputs=static_inputs
+    )
+    az_pipeline = generator_factory(catalog=catalog).generate()
+    fingerprints = _get_step_fingerprints(az_pipeline)
+    assert {name for name, fp in fingerprints.items() if fp} == expected_reused
+    assert {
+        name
+        for name, step in az_pipeline.jobs.items()
+        if step.component.is_deterministic
+    } == expected_reused
+
+
+def test_step_reuse_reuses_steps_reading_data_assets(
+    generator_factory, dummy_plugin_config, multi_catalog
+):
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=True)
+    az_pipeline = generator_factory(catalog=multi_catalog).generate()
+    assert all(_get_step_fingerprints(az_pipeline).values())
+
+
+def test_step_reuse_is_disabled_by_default(generator_factory):
+    az_pipeline = generator_factory().generate()
+    assert not any(_get_step_fingerprints(az_pipeline).values())
+    assert not any(
+        step.component.is_deterministic for step in az_pipeline.jobs.values()
+    )
+
+
+@pytest.mark.parametrize(
+    "filters,expected_steps",
+    [
+        ({"from_nodes": ["node2"]}, {"node2", "node3"}),
+        ({"to_nodes": ["node2"]}, {"node1", "node2"}),
+        ({"node_names": ["node1", "node3"]}, {"node1", "node3"}),
+        ({"from_inputs": ["i2"], "to_outputs": ["i3"]}, {"node2"}),
+        ({"tags": ["compute-2"]}, {"node1"}),
+        ({"tags": [], "node_names": []}, {"node1", "node2", "node3"}),
+    ],
+)
+def test_can_slice_pipeline(
+    generator_factory,
+    dummy_pipeline_compute_tag,
+    multi_catalog,
+    filters,
+    expected_steps,
+):
+    az_pipeline = generator_factory(
+        dummy_pipeline_compute_tag,
+        catalog=multi_catalog,
+        pipeline_filters=filters,
+        previous_run_id="previous",
+    ).generate()
+    assert set(az_pipeline.jobs) == expected_steps
+
+
+def test_sliced_off_inputs_are_read_from_catalog_or_previous_run(
+    generator_factory, multi_catalog
+):
+    # i2 is an asset in the catalog
+    az_pipeline = generator_factory(
+        catalog=multi_catalog, pipeline_filters={"from_nodes": ["node2"]}
+    ).generate()
+    node2 = az_pipeline.jobs["node2"]
+    assert node2.inputs["i2"]._data.path == "test_dataset_2@latest"
+    assert "--az-input=i2 ${{inputs.i2}}" in node2.command
+
+    # i3 is a temporary dataset of the previous run
+    az_pipeline = generator_factory(
+        catalog=multi_catalog,
+        pipeline_filters={"from_nodes": ["node3"]},
+        previous_run_id="previous",
+    ).generate()
+    node3 = az_pipeline.jobs["node3"]
+    assert node3.inputs["i3"]._data == "i3"
+    assert "--az-input" not in node3.command
+    runner_config = KedroAzureRunnerConfig.model_validate_json(
+        node3.environment_variables[KEDRO_AZURE_RUNNER_CONFIG]
+    )
+    assert runner_config.run_id == az_pipeline.tags[KEDRO_AZURE_RUN_ID_TAG]
+    assert runner_config.input_run_ids == {"i3": "previous"}
+
+
+@pytest.mark.parametrize(
+    "generator_factory",
+    [{"pipeline_filters": {"from_nodes": ["node3"]}}],
+    indirect=True,
+)
+def test_sliced_off_temporary_inputs_require_previous_run(
+    generator_factory, dummy_plugin_config, multi_catalog
+):
+    with pytest.raises(ConfigException, match="i3.*--previous-run-id"):
+        generator_factory(catalog=multi_catalog).generate()
+
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=True)
+    with pytest.raises(ConfigException, match="i3.*without pipeline_data_passing"):
+        generator_factory(catalog=multi_catalog, previous_run_id="previous").generate()
+
+
+RESUMED_GENERATOR = {"storage_account_key": "key", "resume_run_id": "resumed"}
+
+
+def _saved_temporary_outputs(dataset_names):
+    def exists(dataset):
+        assert dataset.run_id == "resumed"
+        return dataset.dataset_name in dataset_names
+
+    return patch.object(KedroAzureRunnerDataset, "_exists", exists)
+
+
+def _saved(dataset):
+    dataset._exists = lambda: True
+    return dataset
+
+
+@pytest.mark.parametrize(
+    "saved_temporary_outputs,catalog,expected_steps",
+    [
+        (set(), DataCatalog(), {"node1", "node2", "node3"}),
+        ({"i3"}, DataCatalog(), {"node1", "node2", "node3"}),
+        ({"i2"}, DataCatalog(), {"node2", "node3"}),
+        (
+            {"i2"},
+            DataCatalog(
+                {
+                    "i3": _saved(
+                        CSVDataset(
+                            filepath="abfs://container/i3.csv",
+                            credentials={"account_name": "a", "account_key": "k"},
+                        )
+                    )
+                }
+            ),
+            {"node3"},
+        ),
+        # the local files and the in-memory data on the submitting machine were not saved by the run
+        (
+            {"i2"},
+            DataCatalog({"i3": _saved(CSVDataset(filepath="i3.csv"))}),
+            {"node2", "node3"},
+        ),
+        ({"i2"}, DataCatalog({"i3": MemoryDataset(1)}), {"node2", "node3"}),
+        ({"i2", "i3"}, DataCatalog({"output_data": MemoryDataset()}), {"node3"}),
+    ],
+    ids=("none", "descendant", "temporary", "remote", "local", "memory", "no_output"),
+)
+@pytest.mark.parametrize("generator_factory", [RESUMED_GENERATOR], indirect=True)
+def test_resumed_run_runs_nodes_with_missing_outputs_and_their_descendants(
+    generator_factory,
+    saved_temporary_outputs,
+    catalog,
+    expected_steps,
+):
+    with _saved_temporary_outputs(saved_temporary_outputs):
+        az_pipeline = generator_factory(catalog=catalog).generate()
+    assert set(az_pipeline.jobs) == expected_steps
+    assert az_pipeline.tags[KEDRO_AZURE_RUN_ID_TAG] == "resumed"
+    for step in az_pipeline.jobs.values():
+        runner_config = KedroAzureRunnerConfig.model_validate_json(
+            step.environment_variables[KEDRO_AZURE_RUNNER_CONFIG]
+        )
+        assert runner_config.run_id == "resumed"
+        assert set(runner_config.input_run_ids.values()) <= {"resumed"}
+
+
+@pytest.mark.parametrize("generator_factory", [RESUMED_GENERATOR], indirect=True)
+def test_resumed_run_raises_when_nothing_to_resume(
+    generator_factory, dummy_plugin_config
+):
+    with pytest.raises(
+        ConfigException, match="nothing to resume"
+    ), _saved_temporary_outputs({"i2", "i3", "output_data"}):
+        generator_factory().generate()
+
+    dummy_plugin_config.azure.step_reuse = StepReuseConfig(enabled=True)
+    with pytest.raises(
+        ConfigException, match="can be resumed"
+    ), _saved_temporary_outputs(set()):
+        generator_factory().generate()
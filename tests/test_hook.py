@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from kedro.io.core import Version
@@ -63,3 +63,73 @@ def test_hook_after_context_created(
         assert multi_catalog["i2"]._download is False
         assert multi_catalog["i2"]._local_run is False
         assert multi_catalog["i2"]._version is None
+
+
+def test_hook_prefetches_pipeline_inputs_in_topological_order(
+    mock_azureml_config, dummy_pipeline, multi_catalog
+):
+    context_mock = Mock(
+        config_loader=MagicMock(
+            __getitem__=Mock(
+                return_value={
+                    "azure": {
+                        **mock_azureml_config.to_dict(),
+                        "local_run": {"prefetch": True, "prefetch_workers": 1},
+                    }
+                }
+            )
+        )
+    )
+    azureml_local_run_hook.after_context_created(context_mock)
+    azureml_local_run_hook.after_catalog_created(multi_catalog)
+
+    downloaded = []
+    with patch.object(
+        AzureMLAssetDataset,
+        "_download_azureml_dataset",
+        autospec=True,
+        side_effect=lambda ds: downloaded.append(ds._azureml_dataset),
+    ):
+        assert azureml_local_run_hook._get_datasets_to_prefetch(
+            dummy_pipeline, multi_catalog
+        ) == ["input_data"]
+        azureml_local_run_hook.before_pipeline_run(
+            {"runner": SequentialRunner.__name__}, dummy_pipeline, multi_catalog
+        )
+        prefetched = multi_catalog["input_data"]._prefetched
+        assert prefetched is not None
+        prefetched.result(timeout=10)
+        assert multi_catalog["i2"]._prefetched is None
+        session_dir = azureml_local_run_hook._download_session_dir
+        assert (
+            session_dir / f"{multi_catalog['input_data']._download_session}.done"
+        ).is_file()
+        azureml_local_run_hook.after_pipeline_run()
+
+    assert downloaded == ["test_dataset"]
+    assert azureml_local_run_hook._prefetch_executor is None
+    # the download locks and markers of the run are removed
+    assert not session_dir.exists()
+
+
+def test_hook_removes_download_markers_on_pipeline_error(
+    mock_azureml_config, dummy_pipeline, multi_catalog
+):
+    context_mock = Mock(
+        config_loader=MagicMock(
+            __getitem__=Mock(return_value={"azure": mock_azureml_config.to_dict()})
+        )
+    )
+    azureml_local_run_hook.after_context_created(context_mock)
+    azureml_local_run_hook.after_catalog_created(multi_catalog)
+    azureml_local_run_hook.before_pipeline_run(
+        {"runner": SequentialRunner.__name__}, dummy_pipeline, multi_catalog
+    )
+    session_dir = azureml_local_run_hook._download_session_dir
+    with patch.object(AzureMLAssetDataset, "_download_azureml_dataset"):
+        multi_catalog["input_data"]._ensure_downloaded()
+    assert any(session_dir.iterdir())
+
+    azureml_local_run_hook.on_pipeline_error()
+    assert not session_dir.exists()
+    assert azureml_local_run_hook._download_session_dir is None
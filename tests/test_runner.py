@@ -1,13 +1,24 @@
+import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from kedro.io import DataCatalog, MemoryDataset
 from kedro.io.core import Version
-from kedro.pipeline import Pipeline
+from kedro.pipeline import Pipeline, node, pipeline
 from kedro_datasets.pickle import PickleDataset
 
+from kedro_azureml.config import AzureTempStorageConfig, KedroAzureRunnerConfig
+from kedro_azureml.constants import (
+    KEDRO_AZURE_LOAD_VERSIONS,
+    KEDRO_AZURE_PARALLEL_SHARD,
+    KEDRO_AZURE_RUNNER_CONFIG,
+)
 from kedro_azureml.datasets.asset_dataset import AzureMLAssetDataset
 from kedro_azureml.datasets.pipeline_dataset import AzureMLPipelineDataset
+from kedro_azureml.distributed import parallel
+from kedro_azureml.distributed.parallel import ParallelShard
 from kedro_azureml.runner import AzurePipelinesRunner
 
 
@@ -68,6 +79,80 @@ def test_runner_pipeline_data_passing(dummy_pipeline: Pipeline, tmp_path: Path):
     assert output_data == input_data, "Output data is not the same as input data"
 
 
+def test_runner_reads_sliced_off_inputs_from_previous_run():
+    config = KedroAzureRunnerConfig(
+        temporary_storage=AzureTempStorageConfig(
+            account_name="unit_test", container="container"
+        ),
+        run_id="current",
+        storage_account_key="",
+        input_run_ids={"i3": "previous"},
+    )
+    with patch.dict(os.environ, {KEDRO_AZURE_RUNNER_CONFIG: config.model_dump_json()}):
+        runner = AzurePipelinesRunner()
+    assert runner.create_default_data_set("i3").run_id == "previous"
+    assert runner.create_default_data_set("output_data").run_id == "current"
+
+
+def test_runner_pins_versions_of_appended_inputs(tmp_path: Path):
+    ds = AzureMLAssetDataset(
+        dataset={"type": PickleDataset, "filepath": "data.pickle"},
+        azureml_dataset="events",
+        save_mode="append",
+    )
+    catalog = DataCatalog({"events": ds})
+    with patch.dict(
+        os.environ, {KEDRO_AZURE_LOAD_VERSIONS: json.dumps({"events": "3"})}
+    ):
+        runner = AzurePipelinesRunner(
+            pipeline_data_passing=True,
+            data_paths={"events": str(tmp_path), "output": str(tmp_path)},
+        )
+    with patch.object(AzureMLAssetDataset, "load", return_value=[1]):
+        runner.run(
+            pipeline([node(len, inputs="events", outputs="output", name="n")]),
+            catalog,
+        )
+
+    assert ds.root_dir == str(tmp_path)
+    assert ds._resolve_azureml_version() == "3"
+
+
+@parallel(instance_count=2)
+def _square_partitions(partitions):
+    return {key: value**2 for key, value in partitions.items()}
+
+
+def test_runner_merges_outputs_of_parallel_node_shards(tmp_path: Path):
+    parallel_pipeline = pipeline(
+        [node(_square_partitions, inputs="partitions", outputs="squares", name="sq")]
+    )
+    partitions = {f"p{i}": i for i in range(5)}
+    catalog = DataCatalog({"partitions": MemoryDataset(partitions)})
+    data_paths = {
+        name: tmp_path for name in ("squares", "squares__shard_0", "squares__shard_1")
+    }
+
+    for index in range(2):
+        shard = ParallelShard(index, 2)
+        with patch.dict(os.environ, {KEDRO_AZURE_PARALLEL_SHARD: shard.to_json()}):
+            AzurePipelinesRunner(pipeline_data_passing=True, data_paths=data_paths).run(
+                parallel_pipeline, catalog
+            )
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "squares__shard_0.pickle",
+        "squares__shard_1.pickle",
+    ]
+
+    AzurePipelinesRunner(
+        pipeline_data_passing=True, data_paths=data_paths
+    ).merge_shards(parallel_pipeline, DataCatalog(), shard_count=2)
+    merged = AzureMLPipelineDataset(
+        {"type": PickleDataset, "filepath": str(tmp_path / "squares.pickle")}
+    ).load()
+    assert merged == {key: value**2 for key, value in partitions.items()}
+
+
 @pytest.mark.parametrize(
     "azureml_dataset_type,data_path",
     [
@@ -2,7 +2,7 @@ from copy import deepcopy
 
 import pytest
 
-from kedro_azureml.utils import update_dict
+from kedro_azureml.utils import merge_dicts, update_dict
 
 
 @pytest.mark.parametrize(
@@ -26,3 +26,19 @@ def test_update_dict(input_dict, kv_pairs, expected_output):
     assert actual_output == expected_output, "update is incorrect"
     assert actual_output is not input_dict, "output should be a deep copy"
     assert input_dict == copied_dict, "input_dict should not be mutated"
+
+
+@pytest.mark.parametrize(
+    "input_dict, overrides, expected_output",
+    [
+        ({}, {"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": {"b": 2}}, {"a": {"b": 2}}),
+        ({"a": {"b": 1, "c": 2}}, {"a": {"b": 3}}, {"a": {"b": 3, "c": 2}}),
+        ({"a": {"b": {"c": 1}}}, {"a": {"b": 2}, "d": 4}, {"a": {"b": 2}, "d": 4}),
+    ],
+)
+def test_merge_dicts(input_dict, overrides, expected_output):
+    copied_dict = deepcopy(input_dict)
+    actual_output = merge_dicts(input_dict, overrides)
+    assert actual_output == expected_output, "merge is incorrect"
+    assert input_dict == copied_dict, "input_dict should not be mutated"